@@ -53,7 +53,8 @@ async def choose_agent(
 
 async def handle_json_error(response):
     try:
-        agent_dict = json_repair.loads(response)
+        # choose_agent already tried json.loads, so go straight to the repair parser
+        agent_dict = json_repair.loads(response, skip_json_loads=True)
         if agent_dict.get("server") and agent_dict.get("agent_role_prompt"):
             return agent_dict["server"], agent_dict["agent_role_prompt"]
     except Exception as e:
@@ -1,4 +1,9 @@
+import asyncio
+import functools
+import json
+import weakref
 import json_repair
+from collections import OrderedDict
 
 from gpt_researcher.llm_provider.generic.base import ReasoningEfforts
 from ..utils.llm import create_chat_completion
@@ -7,8 +12,90 @@ from typing import Any, List, Dict
 from ..config import Config
 import logging
 
+try:
+    from langdetect import DetectorFactory, detect_langs
+    DetectorFactory.seed = 0  # Deterministic detection results
+except ImportError:
+    detect_langs = None
+
 logger = logging.getLogger(__name__)
 
+# Prompt templates for query language detection/translation
+_TRANSLATE_PROMPT_TMPL = """Analyze this query and respond in JSON format:
+            Query: {query}
+            
+            Respond with:
+            {{
+                "language": "detected language name",
+                "is_english": false,
+                "english_translation": "translated query to English",
+                "search_optimized_query": "optimized English query for web search"
+            }}
+            
+            For search_optimized_query, make it search-engine friendly by:
+            - Removing filler words
+            - Focusing on key terms
+            - Adding relevant English keywords"""
+
+# Minimum local langdetect probability to treat a non-ASCII query as English without the LLM
+_LOCAL_ENGLISH_MIN_CONFIDENCE = 0.95
+
+# In-process LRU cache of translation results keyed by (query, fast_llm_model)
+_TRANSLATION_CACHE_MAX_SIZE = 1024
+# Upper bound on concurrent translation requests per event loop to stay under provider rate limits
+_TRANSLATION_MAX_CONCURRENCY = 16
+# One semaphore per event loop, since an asyncio primitive binds to the first loop that waits on it
+_translation_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+_translation_cache: "OrderedDict[tuple[str, str], tuple[str, str]]" = OrderedDict()
+
+
+def _parse_json_response(response: str) -> Any:
+    """Parse an LLM JSON response, only paying for json_repair when it is malformed."""
+    try:
+        return json.loads(response)
+    except (json.JSONDecodeError, TypeError):
+        # json.loads already failed, so let json_repair skip its own attempt
+        return json_repair.loads(response, skip_json_loads=True)
+
+
+def _is_english_locally(query: str) -> bool:
+    """Cheap first tier: check with langdetect whether a non-ASCII query is already English."""
+    if detect_langs is None:
+        return False
+    try:
+        candidates = detect_langs(query)
+    except Exception:
+        return False
+    return bool(candidates) and candidates[0].lang == "en" and candidates[0].prob >= _LOCAL_ENGLISH_MIN_CONFIDENCE
+
+
+def _translation_semaphore() -> asyncio.Semaphore:
+    """Return the translation semaphore of the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    semaphore = _translation_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _translation_semaphores.setdefault(loop, asyncio.Semaphore(_TRANSLATION_MAX_CONCURRENCY))
+    return semaphore
+
+
+def _translation_cache_key(query: str, cfg=None) -> tuple[str, str]:
+    return query, cfg.fast_llm_model if cfg else "gpt-4o-mini"
+
+
+def _get_cached_translation(key: tuple[str, str]) -> tuple[str, str] | None:
+    cached = _translation_cache.get(key)
+    if cached is not None:
+        _translation_cache.move_to_end(key)
+    return cached
+
+
+def _cache_translation(key: tuple[str, str], value: tuple[str, str]) -> tuple[str, str]:
+    _translation_cache[key] = value
+    _translation_cache.move_to_end(key)
+    if len(_translation_cache) > _TRANSLATION_CACHE_MAX_SIZE:
+        _translation_cache.popitem(last=False)
+    return value
+
 async def detect_and_translate_query(query: str, cfg=None, cost_callback: callable = None) -> tuple[str, str]:
     """
     Detect if query is non-English and translate to English if needed.
@@ -21,50 +108,70 @@ async def detect_and_translate_query(query: str, cfg=None, cost_callback: callab
     Returns:
         Tuple of (processed_query, original_language)
     """
-    import re
+    cache_key = _translation_cache_key(query, cfg)
+    cached = _get_cached_translation(cache_key)
+    if cached is not None:
+        return cached
     
-    # Quick check if query contains non-ASCII characters (likely non-English)
-    if not re.match(r'^[\x00-\x7F]+$', query):
+    # Quick check if query contains non-ASCII characters (likely non-English),
+    # skipping the LLM when local detection is confident the query is English anyway
+    if not query.isascii() and not _is_english_locally(query):
         logger.info(f"Detected non-English query, translating to English for better search results")
         
         try:
             # Use LLM to detect language and translate
-            detection_prompt = f"""Analyze this query and respond in JSON format:
-            Query: {query}
-            
-            Respond with:
-            {{
-                "language": "detected language name",
-                "is_english": false,
-                "english_translation": "translated query to English",
-                "search_optimized_query": "optimized English query for web search"
-            }}
-            
-            For search_optimized_query, make it search-engine friendly by:
-            - Removing filler words
-            - Focusing on key terms
-            - Adding relevant English keywords"""
+            detection_prompt = _TRANSLATE_PROMPT_TMPL.format(query=query)
             
-            response = await create_chat_completion(
-                model=cfg.fast_llm_model if cfg else "gpt-4o-mini",
-                messages=[{"role": "user", "content": detection_prompt}],
-                temperature=0.1,
-                llm_provider=cfg.fast_llm_provider if cfg else "openai",
-                llm_kwargs=cfg.llm_kwargs if cfg else {},
-                cost_callback=cost_callback
-            )
+            async with _translation_semaphore():
+                response = await create_chat_completion(
+                    model=cfg.fast_llm_model if cfg else "gpt-4o-mini",
+                    messages=[{"role": "user", "content": detection_prompt}],
+                    temperature=0.1,
+                    llm_provider=cfg.fast_llm_provider if cfg else "openai",
+                    llm_kwargs=cfg.llm_kwargs if cfg else {},
+                    cost_callback=cost_callback
+                )
             
-            result = json_repair.loads(response)
+            result = _parse_json_response(response)
             
             if not result.get("is_english", True):
                 translated_query = result.get("search_optimized_query", result.get("english_translation", query))
                 logger.info(f"Translated query from {result.get('language', 'unknown')} to English: {translated_query}")
-                return translated_query, result.get("language", "unknown")
+                return _cache_translation(cache_key, (translated_query, result.get("language", "unknown")))
                 
         except Exception as e:
+            # Don't cache failures so a transient LLM error can be retried
             logger.warning(f"Failed to translate query: {e}, using original")
+            return query, "english"
             
-    return query, "english"
+    return _cache_translation(cache_key, (query, "english"))
+
+# (provider, model) pairs of strategic LLMs that failed without max_tokens in this process
+_STRATEGIC_LLMS_REQUIRING_MAX_TOKENS: set[tuple[str, str]] = set()
+
+# Context appended to queries for the Tavily fallback of the LinkedIn retriever
+_LINKEDIN_QUERY_SUFFIX = "LinkedIn profiles Sales Navigator"
+_LINKEDIN_TRANSLATED_QUERY_SUFFIX = "LinkedIn Sales Navigator profiles startups investment"
+_LINKEDIN_FALLBACK_METADATA = {
+    'source': 'Tavily (LinkedIn fallback)',
+    'fallback_reason': 'LinkedIn returned no results',
+}
+
+# Retriever names that identify the MCP retriever in plan_research_outline
+_MCP_RETRIEVER_NAMES = frozenset({"mcp", "MCPRetriever"})
+
+
+@functools.lru_cache(maxsize=None)
+def _classify_retriever(retriever: Any) -> str:
+    """Classify a retriever class once as "mcp", "linkedin", "tavily" (web search) or "other"."""
+    name = retriever.__name__.lower()
+    if "mcpretriever" in name:
+        return "mcp"
+    if "linkedin" in name:
+        return "linkedin"
+    if "tavily" in name or "web" in name:
+        return "tavily"
+    return "other"
 
 async def get_search_results(query: str, retriever: Any, query_domains: List[str] = None, researcher=None) -> List[Dict[str, Any]]:
     """
@@ -79,68 +186,76 @@ async def get_search_results(query: str, retriever: Any, query_domains: List[str
     Returns:
         A list of search results
     """
-    # Check if this is an MCP retriever and pass the researcher instance
-    if "mcpretriever" in retriever.__name__.lower():
-        search_retriever = retriever(
-            query, 
-            query_domains=query_domains,
-            researcher=researcher  # Pass researcher instance for MCP retrievers
-        )
-    else:
-        search_retriever = retriever(query, query_domains=query_domains)
+    retriever_kind = _classify_retriever(retriever)
+    cfg = getattr(researcher, 'cfg', None) if researcher else None
+    cost_callback = getattr(researcher, 'add_costs', None) if researcher else None
     
     # Handle LinkedIn with fallback to Tavily
-    if "linkedin" in retriever.__name__.lower():
+    if retriever_kind == "linkedin":
         logger.info("Using LinkedIn Sales Navigator retriever")
-        results = search_retriever.search()
+        # The pre-flight check opens the SQLite rate limiter state, so keep it off the event loop
+        if not await asyncio.to_thread(retriever.can_serve):
+            # Rate limited: skip building the LinkedIn retriever and go straight to the fallback
+            results = None
+        else:
+            # Run the blocking LinkedIn search in a worker thread
+            search_retriever = retriever(query, query_domains=query_domains)
+            results = await asyncio.to_thread(search_retriever.search)
         
         # Check if LinkedIn search failed (returns None or empty list for rate limit/auth issues)
-        if results is None or (isinstance(results, list) and len(results) == 0):
+        if not results:
             logger.warning("LinkedIn search failed or returned no results, falling back to Tavily")
             
             # Import Tavily and use it as fallback
             from gpt_researcher.retrievers import TavilySearch
             
-            # Detect and translate non-English queries for better Tavily results
-            cfg = getattr(researcher, 'cfg', None) if researcher else None
-            cost_callback = getattr(researcher, 'add_costs', None) if researcher else None
+            # Detect and translate non-English queries for better Tavily results, only paying
+            # for the LLM call once the fallback actually needs it
             translated_query, original_language = await detect_and_translate_query(query, cfg, cost_callback)
             
             # Use translated query if it's different from original
             if translated_query != query:
                 logger.info(f"Using translated query for Tavily search: {translated_query}")
                 # Add context about LinkedIn and the search intent
-                enhanced_query = f"{translated_query} LinkedIn Sales Navigator profiles startups investment"
+                enhanced_query = " ".join((translated_query, _LINKEDIN_TRANSLATED_QUERY_SUFFIX))
             else:
                 # Add context about LinkedIn in the query for better Tavily results
-                enhanced_query = f"{query} LinkedIn profiles Sales Navigator"
+                enhanced_query = " ".join((query, _LINKEDIN_QUERY_SUFFIX))
             
             tavily_retriever = TavilySearch(enhanced_query, query_domains=query_domains)
             
             try:
-                results = tavily_retriever.search()
+                results = await asyncio.to_thread(tavily_retriever.search)
                 logger.info(f"Tavily fallback search returned {len(results) if results else 0} results")
                 
                 # Add metadata to indicate these are fallback results
                 if results:
+                    fallback_metadata = dict(_LINKEDIN_FALLBACK_METADATA)
+                    if original_language != "english":
+                        fallback_metadata['query_translated'] = True
+                        fallback_metadata['original_language'] = original_language
                     for result in results:
                         if isinstance(result, dict):
-                            result['source'] = 'Tavily (LinkedIn fallback)'
-                            result['fallback_reason'] = 'LinkedIn returned no results'
-                            if original_language != "english":
-                                result['query_translated'] = True
-                                result['original_language'] = original_language
+                            result.update(fallback_metadata)
             except Exception as e:
                 logger.error(f"Tavily fallback also failed: {e}")
                 results = []
         
         return results
     
+    # Check if this is an MCP retriever and pass the researcher instance
+    if retriever_kind == "mcp":
+        search_retriever = retriever(
+            query, 
+            query_domains=query_domains,
+            researcher=researcher  # Pass researcher instance for MCP retrievers
+        )
+    else:
+        search_retriever = retriever(query, query_domains=query_domains)
+    
     # For standard retrievers, also check if translation might help
     # This is especially useful for Tavily and other web search retrievers
-    if "tavily" in retriever.__name__.lower() or "web" in retriever.__name__.lower():
-        cfg = getattr(researcher, 'cfg', None) if researcher else None
-        cost_callback = getattr(researcher, 'add_costs', None) if researcher else None
+    if retriever_kind == "tavily":
         translated_query, original_language = await detect_and_translate_query(query, cfg, cost_callback)
         
         if translated_query != query:
@@ -148,11 +263,17 @@ async def get_search_results(query: str, retriever: Any, query_domains: List[str
             search_retriever.query = translated_query
             
             # Store original query for reference
-            if hasattr(search_retriever, 'original_query'):
+            try:
                 search_retriever.original_query = query
+            except AttributeError:
+                pass
     
-    # Standard retriever search
-    return search_retriever.search()
+    # MCP retrievers manage their own event loop hand-off in search()
+    if retriever_kind == "mcp":
+        return search_retriever.search()
+
+    # Standard retriever search, run in a worker thread so it doesn't block the event loop
+    return await asyncio.to_thread(search_retriever.search)
 
 async def generate_sub_queries(
     query: str,
@@ -188,20 +309,28 @@ async def generate_sub_queries(
         context=context,
     )
 
-    try:
-        response = await create_chat_completion(
-            model=cfg.strategic_llm_model,
-            messages=[{"role": "user", "content": gen_queries_prompt}],
-            llm_provider=cfg.strategic_llm_provider,
-            max_tokens=None,
-            llm_kwargs=cfg.llm_kwargs,
-            reasoning_effort=ReasoningEfforts.Medium.value,
-            cost_callback=cost_callback,
-            **kwargs
-        )
-    except Exception as e:
-        logger.warning(f"Error with strategic LLM: {e}. Retrying with max_tokens={cfg.strategic_token_limit}.")
-        logger.warning(f"See https://github.com/assafelovic/gpt-researcher/issues/1022")
+    strategic_llm = (cfg.strategic_llm_provider, cfg.strategic_llm_model)
+    response = None
+
+    # Skip the call without max_tokens for strategic LLMs already known to reject it
+    if strategic_llm not in _STRATEGIC_LLMS_REQUIRING_MAX_TOKENS:
+        try:
+            response = await create_chat_completion(
+                model=cfg.strategic_llm_model,
+                messages=[{"role": "user", "content": gen_queries_prompt}],
+                llm_provider=cfg.strategic_llm_provider,
+                max_tokens=None,
+                llm_kwargs=cfg.llm_kwargs,
+                reasoning_effort=ReasoningEfforts.Medium.value,
+                cost_callback=cost_callback,
+                **kwargs
+            )
+        except Exception as e:
+            _STRATEGIC_LLMS_REQUIRING_MAX_TOKENS.add(strategic_llm)
+            logger.warning(f"Error with strategic LLM: {e}. Retrying with max_tokens={cfg.strategic_token_limit}.")
+            logger.warning(f"See https://github.com/assafelovic/gpt-researcher/issues/1022")
+
+    if response is None:
         try:
             response = await create_chat_completion(
                 model=cfg.strategic_llm_model,
@@ -212,7 +341,7 @@ async def generate_sub_queries(
                 cost_callback=cost_callback,
                 **kwargs
             )
-            logger.warning(f"Retrying with max_tokens={cfg.strategic_token_limit} successful.")
+            logger.info(f"Strategic LLM call with max_tokens={cfg.strategic_token_limit} successful.")
         except Exception as e:
             logger.warning(f"Retrying with max_tokens={cfg.strategic_token_limit} failed.")
             logger.warning(f"Error with strategic LLM: {e}. Falling back to smart LLM.")
@@ -227,7 +356,7 @@ async def generate_sub_queries(
                 **kwargs
             )
 
-    return json_repair.loads(response)
+    return _parse_json_response(response)
 
 async def plan_research_outline(
     query: str,
@@ -262,9 +391,8 @@ async def plan_research_outline(
     
     # For MCP retrievers, we may want to skip sub-query generation
     # Check if MCP is the only retriever or one of multiple retrievers
-    if retriever_names and ("mcp" in retriever_names or "MCPRetriever" in retriever_names):
-        mcp_only = (len(retriever_names) == 1 and 
-                   ("mcp" in retriever_names or "MCPRetriever" in retriever_names))
+    if _MCP_RETRIEVER_NAMES & frozenset(retriever_names):
+        mcp_only = len(retriever_names) == 1
         
         if mcp_only:
             # If MCP is the only retriever, skip sub-query generation
@@ -286,4 +414,8 @@ async def plan_research_outline(
         **kwargs
     )
 
+    # Drop repeated sub-queries (keeping order) so each is only searched once
+    if isinstance(sub_queries, list) and all(isinstance(q, str) for q in sub_queries):
+        sub_queries = list(dict.fromkeys(sub_queries))
+
     return sub_queries
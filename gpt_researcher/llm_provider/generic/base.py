@@ -257,22 +257,23 @@ class GenericLLMProvider:
 
     async def stream_response(self, messages, websocket=None, **kwargs):
         paragraph = ""
-        response = ""
+        # Collect chunks in a list and join once, avoiding quadratic string concatenation
+        chunks = []
 
         # Streaming the response using the chain astream method from langchain
         async for chunk in self.llm.astream(messages, **kwargs):
             content = chunk.content
             if content is not None:
-                response += content
+                chunks.append(content)
                 paragraph += content
-                if "\n" in paragraph:
+                if "\n" in content:
                     await self._send_output(paragraph, websocket)
                     paragraph = ""
 
         if paragraph:
             await self._send_output(paragraph, websocket)
 
-        return response
+        return "".join(chunks)
 
     async def _send_output(self, content, websocket=None):
         if websocket is not None:
@@ -3,11 +3,15 @@
 from .linkedin_sales_navigator import LinkedInSalesNavigator
 from .stealth_browser import StealthBrowser
 from .human_simulator import HumanSimulator
-from .rate_limiter import RateLimiter
+from .rate_limiter import RateLimiter, get_rate_limiter
+from .browser_pool import BrowserPool, get_browser_pool
 
 __all__ = [
     'LinkedInSalesNavigator',
     'StealthBrowser',
     'HumanSimulator',
-    'RateLimiter'
+    'RateLimiter',
+    'get_rate_limiter',
+    'BrowserPool',
+    'get_browser_pool'
 ]
\ No newline at end of file
@@ -0,0 +1,220 @@
+# Process-wide Browser Pool for LinkedIn Scraping
+
+import os
+import queue
+import atexit
+import asyncio
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BROWSER_POOL_SIZE = int(os.environ.get("LINKEDIN_BROWSER_POOL_SIZE", "4"))
+BROWSER_POOL_RECYCLE_AFTER = int(os.environ.get("LINKEDIN_BROWSER_POOL_RECYCLE_AFTER", "100"))
+BROWSER_POOL_ACQUIRE_TIMEOUT = float(os.environ.get("LINKEDIN_BROWSER_POOL_ACQUIRE_TIMEOUT", "120"))
+
+# Lease taken by BrowserPool.lease() in the current context. Tasks and to_thread workers
+# inherit a copy of it, so it is only reused when its owner matches the caller
+_CURRENT_LEASE: ContextVar[Optional["BrowserLease"]] = ContextVar("linkedin_browser_lease", default=None)
+
+
+def _lease_owner() -> Tuple[int, Optional[asyncio.Task]]:
+    """Identify the calling thread and, inside an event loop, the running task"""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return threading.get_ident(), task
+
+
+class BrowserLease:
+    """A pooled stealth browser together with its usage counter and login state"""
+    
+    def __init__(self, stealth_browser, driver):
+        self.stealth_browser = stealth_browser
+        self.driver = driver
+        self.uses = 0
+        self.logged_in = False
+        self.account = None  # Credential identity of the session logged_in refers to
+        self.owner = None  # (thread id, task) holding it through BrowserPool.lease()
+    
+    def is_alive(self) -> bool:
+        """Check that the driver session still responds"""
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+    
+    def clear_session(self) -> None:
+        """
+        Drop the cookies and site storage left by the previous user, so the next one
+        can't act under their LinkedIn login
+        
+        Raises:
+            Exception: If the browser could not be cleared and must not be reused
+        """
+        self.logged_in = False
+        self.account = None
+        self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        self.driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+            "origin": "https://www.linkedin.com",
+            "storageTypes": "local_storage,session_storage,indexeddb,cache_storage,service_workers"
+        })
+    
+    def close(self) -> None:
+        """Quit the underlying browser"""
+        self.stealth_browser.close()
+
+
+class BrowserPool:
+    """
+    Keep warm stealth Chrome instances around so each search doesn't pay the browser
+    launch cost. At most `size` drivers are checked out at once, and a driver is
+    relaunched after `recycle_after` checkouts to bound memory growth.
+    """
+    
+    def __init__(self, size: int = BROWSER_POOL_SIZE, recycle_after: int = BROWSER_POOL_RECYCLE_AFTER):
+        self.size = size
+        self.recycle_after = recycle_after
+        self._idle = queue.LifoQueue()  # Most recently used (warmest) first
+        self._slots = threading.BoundedSemaphore(size)
+    
+    def acquire(self, timeout: Optional[float] = BROWSER_POOL_ACQUIRE_TIMEOUT) -> BrowserLease:
+        """
+        Check out a browser, reusing an idle one when possible
+        
+        Args:
+            timeout: Seconds to wait for a free slot, None to wait forever
+        
+        Returns:
+            BrowserLease holding the driver
+        """
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"No LinkedIn browser available after {timeout} seconds")
+        
+        try:
+            lease = self._take_idle() or self._launch()
+        except Exception:
+            self._slots.release()
+            raise
+        
+        lease.uses += 1
+        return lease
+    
+    def release(self, lease: BrowserLease, discard: bool = False) -> None:
+        """
+        Return a browser to the pool
+        
+        Args:
+            lease: Lease obtained from acquire
+            discard: Quit the browser instead of keeping it for reuse
+        """
+        try:
+            if discard or lease.uses >= self.recycle_after:
+                logger.debug(f"Retiring pooled browser after {lease.uses} uses")
+                lease.close()
+            else:
+                self._idle.put(lease)
+        finally:
+            self._slots.release()
+    
+    @contextmanager
+    def lease(self, timeout: Optional[float] = BROWSER_POOL_ACQUIRE_TIMEOUT) -> Iterator[BrowserLease]:
+        """
+        Check out a browser dedicated to the calling thread or task for the block
+        
+        Nested calls from the same thread and task reuse the lease already held instead
+        of taking a second slot, so helpers can lease freely without deadlocking a fully
+        checked out pool. Tasks and threads started inside the block get browsers of their
+        own, since WebDriver sessions are not thread-safe. A browser that stops responding
+        inside the block is discarded rather than pooled.
+        
+        Args:
+            timeout: Seconds to wait for a free slot, None to wait forever
+        
+        Yields:
+            BrowserLease checked out for the block
+        """
+        owner = _lease_owner()
+        current = _CURRENT_LEASE.get()
+        if current is not None and current.owner == owner:
+            yield current
+            return
+        
+        lease = self.acquire(timeout=timeout)
+        lease.owner = owner
+        token = _CURRENT_LEASE.set(lease)
+        discard = False
+        try:
+            yield lease
+        except BaseException:
+            discard = not lease.is_alive()
+            raise
+        finally:
+            _CURRENT_LEASE.reset(token)
+            lease.owner = None
+            self.release(lease, discard=discard)
+    
+    def prewarm(self, count: int = 1) -> threading.Thread:
+        """Launch browsers in a background thread so the first search finds one ready"""
+        def _warm():
+            leases = []
+            try:
+                for _ in range(min(count, self.size)):
+                    leases.append(self.acquire())
+            except Exception as e:
+                logger.warning(f"Browser pool prewarm failed: {e}")
+            for lease in leases:
+                lease.uses -= 1  # Warming is not a real use
+                self.release(lease)
+        
+        thread = threading.Thread(target=_warm, name="linkedin-browser-prewarm", daemon=True)
+        thread.start()
+        return thread
+    
+    def close_all(self) -> None:
+        """Quit every idle browser"""
+        while True:
+            try:
+                lease = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            lease.close()
+    
+    def _take_idle(self) -> Optional[BrowserLease]:
+        """Pop idle browsers until a live one is found"""
+        while True:
+            try:
+                lease = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            if lease.is_alive():
+                return lease
+            logger.debug("Dropping dead pooled browser")
+            lease.close()
+    
+    @staticmethod
+    def _launch() -> BrowserLease:
+        """Start a new stealth browser"""
+        from .stealth_browser import StealthBrowser
+        
+        # Uses undetected-chromedriver when installed, enhanced Selenium otherwise
+        stealth_browser = StealthBrowser()
+        driver = stealth_browser.init_stealth_browser()
+        return BrowserLease(stealth_browser, driver)
+
+
+_POOL = BrowserPool()
+atexit.register(_POOL.close_all)
+
+if os.environ.get("LINKEDIN_BROWSER_POOL_PREWARM") == "1":
+    _POOL.prewarm()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide browser pool"""
+    return _POOL
@@ -1,47 +1,163 @@
 # Human Behavior Simulator for LinkedIn Scraping
 
+import os
 import random
 import time
 import math
+import asyncio
+import functools
 import logging
-from typing import Optional, Tuple, List
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.common.by import By
+import numpy as np
+from typing import Optional, Tuple, List, Iterator, TYPE_CHECKING
+
+# Selenium is imported where it is used, keeping the package cheap to import
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webelement import WebElement
 
 logger = logging.getLogger(__name__)
 
+# Set LINKEDIN_HUMAN_DELAYS=0 to turn every simulated pause into a no-op (tests, warmups)
+_DELAYS_ENABLED = os.environ.get("LINKEDIN_HUMAN_DELAYS", "1") == "1"
+
+# Sentinel returned by next() once a step generator is exhausted
+_STEPS_DONE = object()
+
+# Shared generator for batched random draws
+_rng = np.random.default_rng()
+
+# Parameterized scroll scripts; values are passed as arguments so the source stays constant
+_SCROLL_BY_SMOOTH = "window.scrollBy({top: arguments[0], behavior: 'smooth'});"
+_SCROLL_BY_AUTO = "window.scrollBy({top: arguments[0], behavior: 'auto'});"
+_SCROLL_TO_SMOOTH = "window.scrollTo({top: arguments[0], behavior: 'smooth'});"
+_SCROLL_TO_AUTO = "window.scrollTo({top: arguments[0], behavior: 'auto'});"
+_SCROLL_TO_FRACTION = "window.scrollTo({top: document.body.scrollHeight * arguments[0], behavior: 'smooth'});"
+
+# Index of each scroll script in the ops table of _REPLAY_SCROLL_STEPS
+_REPLAY_OPS = {
+    _SCROLL_BY_SMOOTH: 0,
+    _SCROLL_BY_AUTO: 1,
+    _SCROLL_TO_SMOOTH: 2,
+    _SCROLL_TO_AUTO: 3,
+    _SCROLL_TO_FRACTION: 4
+}
+_REPLAY_WAIT_ONLY = -1
+
+# Replays recorded [op, value, delay_ms] steps inside the browser, resolving when done
+_REPLAY_SCROLL_STEPS = """
+    var steps = arguments[0];
+    var done = arguments[arguments.length - 1];
+    var ops = [
+        function (v) { window.scrollBy({top: v, behavior: 'smooth'}); },
+        function (v) { window.scrollBy({top: v, behavior: 'auto'}); },
+        function (v) { window.scrollTo({top: v, behavior: 'smooth'}); },
+        function (v) { window.scrollTo({top: v, behavior: 'auto'}); },
+        function (v) { window.scrollTo({top: document.body.scrollHeight * v, behavior: 'smooth'}); }
+    ];
+    (async function () {
+        for (var i = 0; i < steps.length; i++) {
+            if (steps[i][0] >= 0) {
+                ops[steps[i][0]](steps[i][1]);
+            }
+            await new Promise(function (resolve) { setTimeout(resolve, steps[i][2]); });
+        }
+    })().then(function () { done(true); }, function () { done(false); });
+"""
+
+# Delay ranges for characters that pause longer than a regular keystroke
+_CHAR_DELAY_RANGES = {
+    ' ': (0.1, 0.3),
+    '\n': (0.3, 0.7),
+    **{c: (0.2, 0.5) for c in '.,!?;:'}
+}
+
+# Characters after which buffered keystrokes are flushed
+_CHUNK_BREAK_CHARS = frozenset('.,!?;:\n')
+
+# Adjacent keys on a QWERTY keyboard, used to simulate typos
+_KEYBOARD_ADJACENCY = {
+    'a': 'qwsz', 'b': 'vghn', 'c': 'xdfv', 'd': 'erfcxs',
+    'e': 'wrd', 'f': 'rtgvcd', 'g': 'tyhbvf', 'h': 'yujnbg',
+    'i': 'uok', 'j': 'uikmnh', 'k': 'iolmj', 'l': 'opk',
+    'm': 'njk', 'n': 'bhjm', 'o': 'ipl', 'p': 'ol',
+    'q': 'wa', 'r': 'etf', 's': 'awedxz', 't': 'ryfg',
+    'u': 'yihj', 'v': 'cfgb', 'w': 'qase', 'x': 'zsdc',
+    'y': 'tugh', 'z': 'asx'
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _delay_distribution(min_seconds: float, max_seconds: float) -> Tuple[float, float]:
+    """Mean and standard deviation of a human delay for the given bounds"""
+    mean = (min_seconds + max_seconds) / 2
+    std_dev = (max_seconds - min_seconds) / 6  # 99.7% within range
+    # Variance of the uniform(-0.05, 0.05) micro-variation is 0.1**2 / 12
+    return mean, math.sqrt(std_dev ** 2 + 0.1 ** 2 / 12)
+
+
+class _ScrollRecorder:
+    """Driver stand-in that records scroll scripts for replay and forwards everything else"""
+    
+    def __init__(self, driver):
+        self._driver = driver
+        self.steps: List[list] = []
+    
+    def execute_script(self, script: str, *args):
+        op = _REPLAY_OPS.get(script)
+        if op is None:
+            return self._driver.execute_script(script, *args)
+        self.steps.append([op, args[0], 0])
+    
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
 
 class HumanSimulator:
     """Simulate human-like interactions to avoid detection"""
     
     @staticmethod
-    def random_delay(min_seconds: float = 0.5, max_seconds: float = 3.0) -> None:
+    def _human_delay(min_seconds: float = 0.5, max_seconds: float = 3.0) -> float:
         """
         Generate random delay with normal distribution to simulate human timing
         
         Args:
             min_seconds: Minimum delay in seconds
             max_seconds: Maximum delay in seconds
-        """
-        # Use normal distribution for more realistic timing
-        mean = (min_seconds + max_seconds) / 2
-        std_dev = (max_seconds - min_seconds) / 6  # 99.7% within range
         
-        # Generate delay with bounds checking
+        Returns:
+            Delay in seconds
+        """
+        # Use normal distribution for more realistic timing, with the +/-0.05s
+        # micro-variation folded into the spread so a single draw suffices
+        mean, std_dev = _delay_distribution(min_seconds, max_seconds)
         delay = random.gauss(mean, std_dev)
-        delay = max(min_seconds, min(max_seconds, delay))
         
-        # Add micro-variations for realism
-        micro_variation = random.uniform(-0.05, 0.05)
-        delay = max(0.1, delay + micro_variation)
+        # Bounds checking (range widened by the micro-variation)
+        delay = max(min_seconds - 0.05, min(max_seconds + 0.05, delay))
+        delay = max(0.1, delay)
         
-        time.sleep(delay)
         logger.debug(f"Applied human delay: {delay:.2f} seconds")
+        return delay
     
     @staticmethod
-    def typing_delay() -> None:
+    def random_delay(min_seconds: float = 0.5, max_seconds: float = 3.0) -> None:
+        """
+        Sleep for a random human-like delay
+        
+        Args:
+            min_seconds: Minimum delay in seconds
+            max_seconds: Maximum delay in seconds
+        """
+        if _DELAYS_ENABLED:
+            time.sleep(HumanSimulator._human_delay(min_seconds, max_seconds))
+    
+    @staticmethod
+    async def arandom_delay(min_seconds: float = 0.5, max_seconds: float = 3.0) -> None:
+        """Async variant of random_delay that doesn't block the event loop"""
+        if _DELAYS_ENABLED:
+            await asyncio.sleep(HumanSimulator._human_delay(min_seconds, max_seconds))
+    
+    @staticmethod
+    def _typing_pause() -> float:
         """Generate realistic typing delay between keystrokes"""
         # Fast typist: 40-60 WPM, Slow: 20-30 WPM
         # Average inter-keystroke interval: 0.1-0.3 seconds
@@ -51,10 +167,101 @@ class HumanSimulator:
         if random.random() < 0.1:  # 10% chance
             base_delay += random.uniform(0.5, 1.5)
         
-        time.sleep(max(0.05, base_delay))
+        return max(0.05, base_delay)
+    
+    @staticmethod
+    def _typing_pauses(count: int) -> np.ndarray:
+        """Vectorized _typing_pause: draw count keystroke delays in one batch"""
+        base_delays = _rng.normal(0.15, 0.05, count)
+        thinking = _rng.random(count) < 0.1
+        base_delays += np.where(thinking, _rng.uniform(0.5, 1.5, count), 0.0)
+        return np.maximum(0.05, base_delays)
+    
+    @staticmethod
+    def typing_delay() -> None:
+        """Sleep for a realistic typing delay between keystrokes"""
+        if _DELAYS_ENABLED:
+            time.sleep(HumanSimulator._typing_pause())
+    
+    @staticmethod
+    async def atyping_delay() -> None:
+        """Async variant of typing_delay that doesn't block the event loop"""
+        if _DELAYS_ENABLED:
+            await asyncio.sleep(HumanSimulator._typing_pause())
+    
+    @staticmethod
+    def _run_steps(steps: Iterator[float]) -> None:
+        """Drive a step generator, sleeping for each delay it yields"""
+        for delay in steps:
+            if _DELAYS_ENABLED:
+                time.sleep(delay)
+    
+    @staticmethod
+    async def _arun_steps(steps: Iterator[float]) -> None:
+        """
+        Drive a step generator without blocking the event loop: the WebDriver calls
+        between delays run in the default executor and the delays are awaited
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            delay = await loop.run_in_executor(None, next, steps, _STEPS_DONE)
+            if delay is _STEPS_DONE:
+                return
+            if _DELAYS_ENABLED:
+                await asyncio.sleep(delay)
     
     @staticmethod
-    def human_mouse_movement(driver, target_element: Optional[WebElement] = None) -> None:
+    def _viewport_size(driver) -> Tuple[int, int]:
+        """
+        Return (innerWidth, innerHeight), cached on the driver
+        
+        The window size is fixed when the browser is launched, so it is queried once per
+        driver. Checking driver.current_url to invalidate it would itself be a round-trip.
+        """
+        size = getattr(driver, '_hs_viewport_size', None)
+        if size is None:
+            size = tuple(driver.execute_script("return [window.innerWidth, window.innerHeight];"))
+            driver._hs_viewport_size = size
+        return size
+    
+    @staticmethod
+    def _record_steps(driver, make_steps) -> List[list]:
+        """
+        Run a scroll step generator against a recorder instead of the live page
+        
+        Returns:
+            [op, value, delay_ms] steps for _run_timed_script; reads still hit the driver
+        """
+        recorder = _ScrollRecorder(driver)
+        for delay in make_steps(recorder):
+            if not recorder.steps:
+                recorder.steps.append([_REPLAY_WAIT_ONLY, 0, 0])
+            if _DELAYS_ENABLED:
+                recorder.steps[-1][2] += int(delay * 1000)
+        return recorder.steps
+    
+    @staticmethod
+    def _run_timed_script(driver, steps: List[list]) -> None:
+        """Play recorded scroll steps and their pauses in the browser in one round-trip"""
+        if not steps:
+            return
+        total_seconds = sum(step[2] for step in steps) / 1000
+        
+        # Pooled drivers outlive this call, so the longer timeout must not leak into later scripts
+        previous_timeout = driver.timeouts.script
+        driver.set_script_timeout(total_seconds + 10)
+        try:
+            driver.execute_async_script(_REPLAY_SCROLL_STEPS, steps)
+        finally:
+            driver.set_script_timeout(previous_timeout)
+    
+    @staticmethod
+    def _replay_in_browser(driver, make_steps) -> None:
+        """Record a scroll step generator and replay it with a single async script"""
+        HumanSimulator._run_timed_script(driver, HumanSimulator._record_steps(driver, make_steps))
+    
+    @staticmethod
+    def human_mouse_movement(driver, target_element: Optional["WebElement"] = None) -> None:
         """
         Simulate human-like mouse movement with bezier curves
         
@@ -63,11 +270,8 @@ class HumanSimulator:
             target_element: Optional target element to move to
         """
         try:
-            action = ActionChains(driver)
-            
             # Get viewport dimensions
-            viewport_width = driver.execute_script("return window.innerWidth;")
-            viewport_height = driver.execute_script("return window.innerHeight;")
+            viewport_width, viewport_height = HumanSimulator._viewport_size(driver)
             
             if target_element:
                 # Move to specific element with curve
@@ -85,65 +289,69 @@ class HumanSimulator:
                     duration = random.uniform(0.5, 1.5)
                     steps = random.randint(10, 30)
                     
-                    # Execute smooth movement
-                    driver.execute_script(f"""
-                        var element = document.elementFromPoint({x}, {y});
-                        if (element) {{
-                            element.dispatchEvent(new MouseEvent('mousemove', {{
-                                bubbles: true,
-                                cancelable: true,
-                                clientX: {x},
-                                clientY: {y}
-                            }}));
-                        }}
-                    """)
+                    # Dispatch a trusted mouse move at the exact viewport position
+                    driver.execute_cdp_cmd('Input.dispatchMouseEvent', {
+                        'type': 'mouseMoved',
+                        'x': x,
+                        'y': y
+                    })
+                    driver._hs_mouse_position = (x, y)
                     
-                    time.sleep(duration / steps)
+                    if _DELAYS_ENABLED:
+                        time.sleep(duration / steps)
             
         except Exception as e:
             logger.debug(f"Mouse movement simulation error: {e}")
     
     @staticmethod
-    def _curved_mouse_movement(driver, element: WebElement) -> None:
+    def _curved_mouse_movement(driver, element: "WebElement") -> None:
         """Create curved mouse movement to element"""
+        from selenium.webdriver.common.action_chains import ActionChains
+        from selenium.webdriver.common.actions.action_builder import ActionBuilder
+        
         try:
-            action = ActionChains(driver)
-            
-            # Get element location
-            element_rect = driver.execute_script("""
+            # Get element center
+            target_x, target_y = driver.execute_script("""
                 var rect = arguments[0].getBoundingClientRect();
-                return {x: rect.left + rect.width/2, y: rect.top + rect.height/2};
+                return [rect.left + rect.width/2, rect.top + rect.height/2];
             """, element)
             
-            # Get current mouse position (approximate)
-            current_x = driver.execute_script("return window.mouseX || 0;")
-            current_y = driver.execute_script("return window.mouseY || 0;")
+            # Start from the last position we moved the mouse to
+            current_x, current_y = getattr(driver, '_hs_mouse_position', (0, 0))
             
             # Generate control points for bezier curve
             control_x1 = current_x + random.randint(-100, 100)
             control_y1 = current_y + random.randint(-100, 100)
-            control_x2 = element_rect['x'] + random.randint(-50, 50)
-            control_y2 = element_rect['y'] + random.randint(-50, 50)
+            control_x2 = target_x + random.randint(-50, 50)
+            control_y2 = target_y + random.randint(-50, 50)
             
             # Generate points along bezier curve
             num_points = random.randint(20, 40)
-            for i in range(num_points):
-                t = i / num_points
-                
-                # Bezier curve formula
-                x = (1-t)**3 * current_x + 3*(1-t)**2*t * control_x1 + 3*(1-t)*t**2 * control_x2 + t**3 * element_rect['x']
-                y = (1-t)**3 * current_y + 3*(1-t)**2*t * control_y1 + 3*(1-t)*t**2 * control_y2 + t**3 * element_rect['y']
-                
-                # Move to point
-                action.move_by_offset(int(x - current_x), int(y - current_y))
-                current_x, current_y = x, y
-                
-                # Variable speed
-                action.pause(random.uniform(0.01, 0.03))
+            t = np.arange(num_points) / num_points
+            xs = HumanSimulator._bezier(t, current_x, control_x1, control_x2, target_x)
+            ys = HumanSimulator._bezier(t, current_y, control_y1, control_y2, target_y)
+            
+            # Absolute viewport positions kept on screen. Unlike move_by_offset they don't depend
+            # on where the WebDriver pointer last was, which CDP mouse events never update
+            viewport_width, viewport_height = HumanSimulator._viewport_size(driver)
+            xs = np.clip(xs, 0, viewport_width - 1)
+            ys = np.clip(ys, 0, viewport_height - 1)
+            points = np.rint(np.stack([xs, ys])).astype(np.int32).tolist()
+            
+            # Variable speed
+            pauses = _rng.uniform(0.01, 0.03, num_points).tolist()
+            
+            builder = ActionBuilder(driver)
+            pointer = builder.pointer_action
+            for x, y, pause in zip(*points, pauses):
+                pointer.move_to_location(x, y)
+                if _DELAYS_ENABLED:
+                    pointer.pause(pause)
             
             # Final move to element
-            action.move_to_element(element)
-            action.perform()
+            pointer.move_to(element)
+            builder.perform()
+            driver._hs_mouse_position = (target_x, target_y)
             
         except Exception as e:
             logger.debug(f"Curved mouse movement error: {e}")
@@ -151,7 +359,15 @@ class HumanSimulator:
             ActionChains(driver).move_to_element(element).perform()
     
     @staticmethod
-    def human_typing(element: WebElement, text: str, make_typos: bool = True) -> None:
+    def _bezier(t: np.ndarray, p0: float, p1: float, p2: float, p3: float) -> np.ndarray:
+        """Evaluate a cubic bezier curve at every t, in power-basis Horner form"""
+        c1 = 3 * (p1 - p0)
+        c2 = 3 * (p2 - 2 * p1 + p0)
+        c3 = p3 - 3 * p2 + 3 * p1 - p0
+        return ((c3 * t + c2) * t + c1) * t + p0
+    
+    @staticmethod
+    def human_typing(element: "WebElement", text: str, make_typos: bool = True) -> None:
         """
         Type text with human-like speed and occasional typos
         
@@ -160,23 +376,43 @@ class HumanSimulator:
             text: Text to type
             make_typos: Whether to simulate typos
         """
+        HumanSimulator._run_steps(HumanSimulator._typing_steps(element, text, make_typos))
+    
+    @staticmethod
+    async def ahuman_typing(element: "WebElement", text: str, make_typos: bool = True) -> None:
+        """Async variant of human_typing that doesn't block the event loop"""
+        await HumanSimulator._arun_steps(HumanSimulator._typing_steps(element, text, make_typos))
+    
+    @staticmethod
+    def _typing_steps(element: "WebElement", text: str, make_typos: bool) -> Iterator[float]:
+        """Type text into element, yielding each pause (in seconds) instead of sleeping"""
+        from selenium.webdriver.common.keys import Keys
+        
         element.clear()
         
         # Sometimes select all and delete instead of clear
         if random.random() < 0.3:
             element.send_keys(Keys.CONTROL + 'a')
-            HumanSimulator.typing_delay()
+            yield HumanSimulator._typing_pause()
             element.send_keys(Keys.DELETE)
-            HumanSimulator.random_delay(0.2, 0.5)
+            yield HumanSimulator._human_delay(0.2, 0.5)
         
         typo_chance = 0.03 if make_typos else 0  # 3% typo chance per character
         
-        i = 0
-        while i < len(text):
-            char = text[i]
-            
+        # Plain keystrokes are buffered and sent in one send_keys call, together with
+        # their accumulated delay, whenever a typo, punctuation or thinking pause occurs
+        buffer: List[str] = []
+        pending = 0.0
+        
+        # Draw per-character randomness up front
+        typo_rolls = _rng.random(len(text)).tolist()
+        thinking_rolls = _rng.random(len(text)).tolist()
+        keystroke_pauses = HumanSimulator._typing_pauses(len(text)).tolist()
+        
+        last_index = len(text) - 1
+        for i, char in enumerate(text):
             # Simulate typo
-            if random.random() < typo_chance and i > 0 and i < len(text) - 1:
+            if typo_rolls[i] < typo_chance and 0 < i < last_index:
                 # Common typo patterns
                 typo_patterns = [
                     lambda: HumanSimulator._adjacent_key_typo(char),  # Adjacent key
@@ -188,56 +424,55 @@ class HumanSimulator:
                 typo = random.choice(typo_patterns)()
                 
                 if typo:
+                    if buffer:
+                        element.send_keys(''.join(buffer))
+                        buffer.clear()
+                        yield pending
+                        pending = 0.0
+                    
                     element.send_keys(typo)
-                    HumanSimulator.typing_delay()
+                    yield HumanSimulator._typing_pause()
                     
                     # Realize mistake and correct
-                    HumanSimulator.random_delay(0.3, 0.8)
+                    yield HumanSimulator._human_delay(0.3, 0.8)
                     
                     # Backspace to correct
                     for _ in range(len(typo)):
                         element.send_keys(Keys.BACKSPACE)
-                        HumanSimulator.typing_delay()
-                    
-                    # Type correct character
-                    element.send_keys(char)
-                else:
-                    element.send_keys(char)
-            else:
-                element.send_keys(char)
+                        yield HumanSimulator._typing_pause()
+            
+            # Type correct character
+            buffer.append(char)
             
             # Variable typing speed
-            if char == ' ':
-                HumanSimulator.random_delay(0.1, 0.3)
-            elif char in '.,!?;:':
-                HumanSimulator.random_delay(0.2, 0.5)
-            elif char == '\n':
-                HumanSimulator.random_delay(0.3, 0.7)
+            delay_range = _CHAR_DELAY_RANGES.get(char)
+            if delay_range:
+                pending += HumanSimulator._human_delay(*delay_range)
             else:
-                HumanSimulator.typing_delay()
+                pending += keystroke_pauses[i]
             
             # Occasional pause (thinking)
-            if random.random() < 0.02:  # 2% chance
-                HumanSimulator.random_delay(0.5, 2.0)
+            thinking = thinking_rolls[i] < 0.02  # 2% chance
             
-            i += 1
+            if thinking or char in _CHUNK_BREAK_CHARS:
+                element.send_keys(''.join(buffer))
+                buffer.clear()
+                yield pending
+                pending = 0.0
+                
+                if thinking:
+                    yield HumanSimulator._human_delay(0.5, 2.0)
+        
+        if buffer:
+            element.send_keys(''.join(buffer))
+            yield pending
     
     @staticmethod
     def _adjacent_key_typo(char: str) -> str:
         """Return adjacent key on QWERTY keyboard"""
-        keyboard_adjacency = {
-            'a': 'qwsz', 'b': 'vghn', 'c': 'xdfv', 'd': 'erfcxs',
-            'e': 'wrd', 'f': 'rtgvcd', 'g': 'tyhbvf', 'h': 'yujnbg',
-            'i': 'uok', 'j': 'uikmnh', 'k': 'iolmj', 'l': 'opk',
-            'm': 'njk', 'n': 'bhjm', 'o': 'ipl', 'p': 'ol',
-            'q': 'wa', 'r': 'etf', 's': 'awedxz', 't': 'ryfg',
-            'u': 'yihj', 'v': 'cfgb', 'w': 'qase', 'x': 'zsdc',
-            'y': 'tugh', 'z': 'asx'
-        }
-        
-        if char.lower() in keyboard_adjacency:
-            adjacent = keyboard_adjacency[char.lower()]
-            return random.choice(adjacent)
+        adjacent = _KEYBOARD_ADJACENCY.get(char.lower())
+        if adjacent:
+            return adjacent[random.randrange(len(adjacent))]
         return char
     
     @staticmethod
@@ -248,35 +483,51 @@ class HumanSimulator:
         return text[index]
     
     @staticmethod
-    def random_scroll(driver, scroll_type: Optional[str] = None) -> None:
+    def random_scroll(driver, scroll_type: Optional[str] = None, in_browser: bool = False) -> None:
         """
         Perform random scrolling patterns
         
         Args:
             driver: Selenium WebDriver instance
             scroll_type: Optional specific scroll pattern
+            in_browser: Replay the whole pattern, pauses included, in one async script
         """
-        scroll_patterns = {
-            'smooth_down': HumanSimulator._smooth_scroll_down,
-            'smooth_up': HumanSimulator._smooth_scroll_up,
-            'quick_scan': HumanSimulator._quick_scan_scroll,
-            'read_pause': HumanSimulator._read_pause_scroll,
-            'back_check': HumanSimulator._back_check_scroll,
-            'search_scan': HumanSimulator._search_scan_scroll
-        }
-        
-        if scroll_type and scroll_type in scroll_patterns:
-            pattern = scroll_patterns[scroll_type]
-        else:
-            pattern = random.choice(list(scroll_patterns.values()))
-        
         try:
-            pattern(driver)
+            if in_browser:
+                HumanSimulator._replay_in_browser(
+                    driver, lambda d: HumanSimulator._scroll_steps(d, scroll_type)
+                )
+            else:
+                HumanSimulator._run_steps(HumanSimulator._scroll_steps(driver, scroll_type))
+        except Exception as e:
+            logger.debug(f"Scroll simulation error: {e}")
+    
+    @staticmethod
+    async def arandom_scroll(driver, scroll_type: Optional[str] = None, in_browser: bool = False) -> None:
+        """Async variant of random_scroll that doesn't block the event loop"""
+        try:
+            if in_browser:
+                await asyncio.to_thread(
+                    HumanSimulator._replay_in_browser,
+                    driver, lambda d: HumanSimulator._scroll_steps(d, scroll_type)
+                )
+            else:
+                await HumanSimulator._arun_steps(HumanSimulator._scroll_steps(driver, scroll_type))
         except Exception as e:
             logger.debug(f"Scroll simulation error: {e}")
     
     @staticmethod
-    def _smooth_scroll_down(driver) -> None:
+    def _scroll_steps(driver, scroll_type: Optional[str] = None) -> Iterator[float]:
+        """Pick a scroll pattern and return its step generator"""
+        pattern = HumanSimulator._SCROLL_PATTERNS.get(scroll_type) if scroll_type else None
+        if pattern is None:
+            choices = HumanSimulator._SCROLL_PATTERN_CHOICES
+            pattern = choices[random.randrange(len(choices))]
+        
+        return pattern(driver)
+    
+    @staticmethod
+    def _smooth_scroll_down(driver) -> Iterator[float]:
         """Smooth downward scrolling"""
         scroll_count = random.randint(3, 7)
         
@@ -284,17 +535,12 @@ class HumanSimulator:
             scroll_amount = random.randint(100, 400)
             duration = random.uniform(0.5, 1.5)
             
-            driver.execute_script(f"""
-                window.scrollBy({{
-                    top: {scroll_amount},
-                    behavior: 'smooth'
-                }});
-            """)
+            driver.execute_script(_SCROLL_BY_SMOOTH, scroll_amount)
             
-            time.sleep(duration)
+            yield duration
     
     @staticmethod
-    def _smooth_scroll_up(driver) -> None:
+    def _smooth_scroll_up(driver) -> Iterator[float]:
         """Smooth upward scrolling"""
         scroll_count = random.randint(2, 4)
         
@@ -302,33 +548,22 @@ class HumanSimulator:
             scroll_amount = random.randint(-300, -100)
             duration = random.uniform(0.3, 0.8)
             
-            driver.execute_script(f"""
-                window.scrollBy({{
-                    top: {scroll_amount},
-                    behavior: 'smooth'
-                }});
-            """)
+            driver.execute_script(_SCROLL_BY_SMOOTH, scroll_amount)
             
-            time.sleep(duration)
+            yield duration
     
     @staticmethod
-    def _quick_scan_scroll(driver) -> None:
+    def _quick_scan_scroll(driver) -> Iterator[float]:
         """Quick scanning scroll pattern"""
         # Scroll to different sections quickly
-        positions = [0.3, 0.5, 0.7, 0.9]
-        random.shuffle(positions)
+        positions = HumanSimulator._QUICK_POSITIONS
         
-        for pos in positions[:random.randint(2, 3)]:
-            driver.execute_script(f"""
-                window.scrollTo({{
-                    top: document.body.scrollHeight * {pos},
-                    behavior: 'smooth'
-                }});
-            """)
-            time.sleep(random.uniform(0.8, 1.5))
+        for index in random.sample(range(len(positions)), random.randint(2, 3)):
+            driver.execute_script(_SCROLL_TO_FRACTION, positions[index])
+            yield random.uniform(0.8, 1.5)
     
     @staticmethod
-    def _read_pause_scroll(driver) -> None:
+    def _read_pause_scroll(driver) -> Iterator[float]:
         """Scroll with reading pauses"""
         current_position = driver.execute_script("return window.pageYOffset;")
         
@@ -337,75 +572,59 @@ class HumanSimulator:
             scroll_amount = random.randint(200, 500)
             current_position += scroll_amount
             
-            driver.execute_script(f"""
-                window.scrollTo({{
-                    top: {current_position},
-                    behavior: 'smooth'
-                }});
-            """)
+            driver.execute_script(_SCROLL_TO_SMOOTH, current_position)
             
             # Reading pause
             reading_time = random.uniform(2, 5)
-            time.sleep(reading_time)
+            yield reading_time
             
             # Occasionally scroll back a bit (re-reading)
             if random.random() < 0.2:
-                driver.execute_script(f"""
-                    window.scrollBy({{
-                        top: {random.randint(-100, -50)},
-                        behavior: 'smooth'
-                    }});
-                """)
-                time.sleep(random.uniform(0.5, 1))
+                driver.execute_script(_SCROLL_BY_SMOOTH, random.randint(-100, -50))
+                yield random.uniform(0.5, 1)
     
     @staticmethod
-    def _back_check_scroll(driver) -> None:
+    def _back_check_scroll(driver) -> Iterator[float]:
         """Scroll down then back up (checking something)"""
         # Scroll down
-        driver.execute_script("""
-            window.scrollBy({
-                top: 500,
-                behavior: 'smooth'
-            });
-        """)
-        time.sleep(random.uniform(1, 2))
+        driver.execute_script(_SCROLL_BY_SMOOTH, 500)
+        yield random.uniform(1, 2)
         
         # Scroll back up partially
-        driver.execute_script("""
-            window.scrollBy({
-                top: -200,
-                behavior: 'smooth'
-            });
-        """)
-        time.sleep(random.uniform(0.5, 1))
+        driver.execute_script(_SCROLL_BY_SMOOTH, -200)
+        yield random.uniform(0.5, 1)
     
     @staticmethod
-    def _search_scan_scroll(driver) -> None:
+    def _search_scan_scroll(driver) -> Iterator[float]:
         """Scroll pattern for searching through results"""
         # Initial quick scan
-        driver.execute_script("""
-            window.scrollTo({
-                top: 300,
-                behavior: 'smooth'
-            });
-        """)
-        time.sleep(random.uniform(0.5, 1))
+        driver.execute_script(_SCROLL_TO_SMOOTH, 300)
+        yield random.uniform(0.5, 1)
         
         # Incremental scrolling through results
         for _ in range(random.randint(3, 5)):
             scroll_amount = random.randint(150, 300)
-            driver.execute_script(f"""
-                window.scrollBy({{
-                    top: {scroll_amount},
-                    behavior: 'auto'
-                }});
-            """)
+            driver.execute_script(_SCROLL_BY_AUTO, scroll_amount)
             
             # Pause to "examine" results
-            time.sleep(random.uniform(1, 2.5))
+            yield random.uniform(1, 2.5)
+    
+    # Page fractions visited by _quick_scan_scroll
+    _QUICK_POSITIONS = (0.3, 0.5, 0.7, 0.9)
+    
+    # Scroll patterns by name, built once at class creation
+    _SCROLL_PATTERNS = {
+        'smooth_down': _smooth_scroll_down,
+        'smooth_up': _smooth_scroll_up,
+        'quick_scan': _quick_scan_scroll,
+        'read_pause': _read_pause_scroll,
+        'back_check': _back_check_scroll,
+        'search_scan': _search_scan_scroll
+    }
+    _SCROLL_PATTERN_CHOICES = tuple(_SCROLL_PATTERNS.values())
     
     @staticmethod
-    def random_hover(driver, elements: List[WebElement]) -> None:
+    def random_hover(driver, elements: List["WebElement"]) -> None:
         """
         Randomly hover over elements
         
@@ -418,7 +637,10 @@ class HumanSimulator:
         
         # Select random subset of elements to hover
         num_hovers = min(len(elements), random.randint(1, 3))
-        hover_elements = random.sample(elements, num_hovers)
+        if num_hovers == 1:
+            hover_elements = (random.choice(elements),)
+        else:
+            hover_elements = random.sample(elements, num_hovers)
         
         for element in hover_elements:
             try:
@@ -428,37 +650,54 @@ class HumanSimulator:
                 logger.debug(f"Hover simulation error: {e}")
     
     @staticmethod
-    def simulate_reading_pattern(driver) -> None:
-        """Simulate natural reading pattern on page"""
+    def simulate_reading_pattern(driver, in_browser: bool = False) -> None:
+        """
+        Simulate natural reading pattern on page
+        
+        Args:
+            driver: Selenium WebDriver instance
+            in_browser: Replay the whole pattern, pauses included, in one async script
+        """
+        if in_browser:
+            HumanSimulator._replay_in_browser(driver, HumanSimulator._reading_steps)
+        else:
+            HumanSimulator._run_steps(HumanSimulator._reading_steps(driver))
+    
+    @staticmethod
+    async def asimulate_reading_pattern(driver, in_browser: bool = False) -> None:
+        """Async variant of simulate_reading_pattern that doesn't block the event loop"""
+        if in_browser:
+            await asyncio.to_thread(HumanSimulator._replay_in_browser, driver, HumanSimulator._reading_steps)
+        else:
+            await HumanSimulator._arun_steps(HumanSimulator._reading_steps(driver))
+    
+    @staticmethod
+    def _reading_steps(driver) -> Iterator[float]:
+        """Read the page in chunks, yielding each pause (in seconds) instead of sleeping"""
         # Start from top
-        driver.execute_script("window.scrollTo(0, 0);")
-        HumanSimulator.random_delay(0.5, 1)
+        driver.execute_script(_SCROLL_TO_AUTO, 0)
+        yield HumanSimulator._human_delay(0.5, 1)
         
         # Read in chunks
-        viewport_height = driver.execute_script("return window.innerHeight;")
+        _, viewport_height = HumanSimulator._viewport_size(driver)
         total_height = driver.execute_script("return document.body.scrollHeight;")
         
         current_position = 0
         while current_position < total_height - viewport_height:
             # Read current viewport
             reading_time = random.uniform(2, 4)
-            time.sleep(reading_time)
+            yield reading_time
             
             # Scroll to next section
             scroll_amount = random.randint(int(viewport_height * 0.6), int(viewport_height * 0.9))
             current_position += scroll_amount
             
-            driver.execute_script(f"""
-                window.scrollTo({{
-                    top: {current_position},
-                    behavior: 'smooth'
-                }});
-            """)
+            driver.execute_script(_SCROLL_TO_SMOOTH, current_position)
             
             # Occasionally scroll back to re-read
             if random.random() < 0.15:
-                HumanSimulator._smooth_scroll_up(driver)
-                time.sleep(random.uniform(1, 2))
+                yield from HumanSimulator._smooth_scroll_up(driver)
+                yield random.uniform(1, 2)
     
     @staticmethod
     def simulate_page_interaction(driver) -> None:
@@ -479,14 +718,28 @@ class HumanSimulator:
     @staticmethod
     def simulate_micro_movements(driver) -> None:
         """Simulate small mouse movements while reading"""
-        for _ in range(random.randint(3, 7)):
-            # Small random mouse movements
-            offset_x = random.randint(-20, 20)
-            offset_y = random.randint(-20, 20)
+        from selenium.webdriver.common.actions.action_builder import ActionBuilder
+        
+        try:
+            # Wiggle around the last position we moved the mouse to, kept on screen. Absolute
+            # moves don't depend on the WebDriver pointer, which CDP mouse events never update
+            x, y = (int(round(v)) for v in getattr(driver, '_hs_mouse_position', (0, 0)))
+            viewport_width, viewport_height = HumanSimulator._viewport_size(driver)
             
-            try:
-                ActionChains(driver).move_by_offset(offset_x, offset_y).perform()
-            except:
-                pass
+            # Queue every movement and pause in one sequence so the burst is a single round-trip
+            builder = ActionBuilder(driver)
+            pointer = builder.pointer_action
+            for _ in range(random.randint(3, 7)):
+                # Small random mouse movements
+                x = min(max(x + random.randint(-20, 20), 0), viewport_width - 1)
+                y = min(max(y + random.randint(-20, 20), 0), viewport_height - 1)
+                
+                pointer.move_to_location(x, y)
+                pause = random.uniform(0.5, 1.5)
+                if _DELAYS_ENABLED:
+                    pointer.pause(pause)
             
-            time.sleep(random.uniform(0.5, 1.5))
\ No newline at end of file
+            builder.perform()
+            driver._hs_mouse_position = (x, y)
+        except Exception as e:
+            logger.debug(f"Micro movement simulation error: {e}")
\ No newline at end of file
@@ -1,26 +1,334 @@
 # LinkedIn Sales Navigator Retriever
 
 import os
+import re
+import hashlib
 import json
 import time
+import random
+import asyncio
 import logging
 import platform
+import threading
 import pickle
+import traceback
+import orjson
+from dataclasses import dataclass
+from functools import lru_cache, cached_property
 from pathlib import Path
-from typing import List, Dict, Optional, Any
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-import requests
-from urllib.parse import quote_plus
+from typing import List, Dict, Optional, Any, Tuple
+from urllib.parse import urlencode, quote_plus
 
 logger = logging.getLogger(__name__)
 
+# Poll explicit waits often so they return as soon as the page is ready
+_WAIT_POLL_FREQUENCY = 0.1
+
+
+# Sales Navigator search endpoint; the search type ("people" or "companies") is appended
+_SALES_NAV_SEARCH_URL = "https://www.linkedin.com/sales/search/"
+
+# URL fragments seen after a successful login: feed, Sales Navigator, profile
+# (/in/username), network, messages, jobs and notifications pages
+_SUCCESS_RE = re.compile(r"feed|sales|/in/|mynetwork|messaging|jobs|notifications")
+
+# URL fragments of security checks, phone verification and other pages needing user action
+_CHALLENGE_RE = re.compile(r"checkpoint/challenge|check/add-phone|add-phone|challenge|verify")
+
+# URL fragments that show a restored session landed inside LinkedIn
+_SESSION_VALID_RE = re.compile(r"sales|feed|/in/")
+
+# Name cells present on every lead or company result row
+_RESULT_MARKER_SELECTOR = "[data-anonymize='person-name'], [data-anonymize='company-name']"
+
+# Per search type: name cell, (field, selector) pairs read from the same row, link selector
+# and the result key for the link
+_RESULT_ROW_SPECS = {
+    "people": (
+        "[data-anonymize='person-name']",
+        [["title", "[data-anonymize='title']"],
+         ["company", "[data-anonymize='company-name']"],
+         ["location", "[data-anonymize='location']"]],
+        "a[href*='/sales/lead/']",
+        "profile_url"
+    ),
+    "companies": (
+        "[data-anonymize='company-name']",
+        [["industry", "[data-anonymize='industry']"],
+         ["size", "[data-anonymize='company-size']"],
+         ["location", "[data-anonymize='location']"]],
+        "a[href*='/sales/company/']",
+        "company_url"
+    )
+}
+
+# Collect result rows in the page: visible text of each field ("N/A" when missing or empty)
+# and the absolute link URL; names outside a result row container are skipped
+_EXTRACT_RESULT_ROWS = """
+const [nameSelector, fields, linkSelector, limit] = arguments;
+const text = (el) => (el && el.innerText.trim()) || "N/A";
+return Array.from(document.querySelectorAll(nameSelector)).slice(0, limit).map((nameEl) => {
+    const row = nameEl.closest("li[class*='reusable-search__result-container']");
+    if (!row) return null;
+    const result = {name: text(nameEl)};
+    for (const [key, selector] of fields) result[key] = text(row.querySelector(selector));
+    const link = row.querySelector(linkSelector);
+    result.url = link ? link.href : "";
+    return result;
+}).filter(Boolean);
+"""
+
+# Error banners LinkedIn shows on a rejected login, queried in the page as one selector list
+_LOGIN_ERROR_SELECTOR = ",".join([
+    ".form__label--error",
+    ".alert-content",
+    ".error",
+    "[data-test-id='error-message']",
+    "#error-for-password",
+    "#error-for-username",
+    ".login__form_action_container .error"
+])
+_COLLECT_LOGIN_ERRORS = (
+    "return Array.from(document.querySelectorAll(arguments[0]))"
+    ".map(e => e.innerText.trim()).filter(Boolean);"
+)
+
+# URL fragments that mean the login form has been submitted and LinkedIn redirected
+_LOGIN_REDIRECT_MARKERS = ("feed", "sales", "checkpoint", "challenge")
+
+# Intent vocabulary (English and Ukrainian patterns); canonical name -> substrings that imply it
+_ROLE_PATTERNS = {
+    "javascript developer": ["javascript", "js", "frontend", "backend", "fullstack", "розробник"],
+    "cto": ["cto", "chief technology", "tech lead", "технічний директор"],
+    "ceo": ["ceo", "chief executive", "founder", "засновник", "директор"],
+    "developer": ["developer", "engineer", "programmer", "розробник", "програміст"],
+    "manager": ["manager", "менеджер", "керівник"]
+}
+
+_SKILL_PATTERNS = {
+    "JavaScript": ["javascript", "js", "node", "react", "vue", "angular"],
+    "Python": ["python", "django", "flask"],
+    "Java": ["java", "spring"],
+    "TypeScript": ["typescript", "ts"]
+}
+
+_LOCATION_PATTERNS = {
+    "Valencia": ["valencia", "валенсії", "валенсія"],
+    "Barcelona": ["barcelona", "барселоні", "барселона"],
+    "Madrid": ["madrid", "мадрид"],
+    "Spain": ["spain", "іспанії", "іспанія"]
+}
+
+_COMPANY_SIZE_PATTERNS = {
+    "1-100": ["100", "співробітників", "employees"],
+    "1-50": ["startup", "стартап"]
+}
+
+_FUNDING_PATTERNS = {
+    "funded": ["funded", "investment", "інвестиції"]
+}
+
+_DECISION_MAKER_PATTERNS = {
+    "decision_maker": ["лпр", "decision maker", "ceo", "cto", "founder"]
+}
+
+# Terms that turn the query into a company search instead of a lead search
+_SEARCH_TYPE_PATTERNS = {
+    "companies": ["company", "companies", "startup", "стартап", "компанії"]
+}
+
+_INTENT_VOCABULARY = {
+    "roles": _ROLE_PATTERNS,
+    "skills": _SKILL_PATTERNS,
+    "locations": _LOCATION_PATTERNS,
+    "company_size": _COMPANY_SIZE_PATTERNS,
+    "funding": _FUNDING_PATTERNS,
+    "decision_maker": _DECISION_MAKER_PATTERNS,
+    "search_type": _SEARCH_TYPE_PATTERNS
+}
+
+# Words too common to be useful as fallback keywords
+_STOP_WORDS = frozenset({
+    'the', 'and', 'or', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'склади', 'будь', 'ласка', 'список', 'які', 'мають', 'шукають'
+})
+
+# Everything str.isalnum() rejects (\w also admits the underscore)
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+
+# Sales Navigator company size codes by parsed size range
+_COMPANY_SIZE_CODES = {
+    "1-50": "B",   # 1-50 employees
+    "1-100": "C",  # 51-200 employees (closest to 1-100)
+    "51-200": "D",
+    "201-500": "E"
+}
+
+# Roles that map to the engineering function filter
+_ENGINEERING_ROLES = frozenset({"javascript developer", "developer"})
+
+# Seniority levels searched for when the query asks for decision makers
+_DECISION_MAKER_SENIORITY = ("owner", "partner", "cxo", "vp", "director")
+
+# Pre-joined OR groups for the broadening query
+_SENIORITY_OR = "founder OR CEO OR CTO"
+_FUNDING_OR = "startup OR funded OR investment"
+_DEFAULT_BROADENING = "developer OR engineer OR founder OR manager"
+
+
+def _build_intent_automaton():
+    """
+    Compile the intent vocabulary into one Aho-Corasick automaton
+    
+    Returns:
+        ahocorasick.Automaton or None if pyahocorasick is not installed
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    
+    # A substring can imply several (category, name) pairs, e.g. "js" is both a role and a skill
+    hits_by_pattern = {}
+    for category, groups in _INTENT_VOCABULARY.items():
+        for name, patterns in groups.items():
+            for pattern in patterns:
+                hits_by_pattern.setdefault(pattern, []).append((category, name))
+    
+    automaton = ahocorasick.Automaton()
+    for pattern, hits in hits_by_pattern.items():
+        automaton.add_word(pattern, tuple(hits))
+    automaton.make_automaton()
+    return automaton
+
+
+_INTENT_AUTOMATON = _build_intent_automaton()
+
+
+def _match_intent_terms(text: str) -> Dict[str, set]:
+    """
+    Find every vocabulary entry whose patterns occur in text
+    
+    Args:
+        text (str): Lowercased query
+        
+    Returns:
+        dict: Category -> set of matched canonical names
+    """
+    matched = {category: set() for category in _INTENT_VOCABULARY}
+    
+    if _INTENT_AUTOMATON is not None:
+        # Single linear pass over the text
+        for _, hits in _INTENT_AUTOMATON.iter(text):
+            for category, name in hits:
+                matched[category].add(name)
+        return matched
+    
+    for category, groups in _INTENT_VOCABULARY.items():
+        for name, patterns in groups.items():
+            if any(pattern in text for pattern in patterns):
+                matched[category].add(name)
+    return matched
+
+
+def _normalize_query(query: str) -> str:
+    """Canonical cache key for a query; matching is case-insensitive and ignores outer whitespace"""
+    return query.strip().lower()
+
+
+@dataclass(frozen=True, slots=True)
+class Intent:
+    """Immutable parsed intent, the cached form behind the intent dicts"""
+    keywords_raw: str
+    roles: Tuple[str, ...] = ()
+    skills: Tuple[str, ...] = ()
+    locations: Tuple[str, ...] = ()
+    company_criteria: Tuple[Tuple[str, str], ...] = ()
+    seniority: Tuple[str, ...] = ()
+    
+    def to_dict(self, keywords_raw: Optional[str] = None) -> dict:
+        """
+        Expand into a fresh mutable intent dict
+        
+        Args:
+            keywords_raw (Optional[str]): Caller's lowercased query to report instead of the normalized cache key
+            
+        Returns:
+            dict: Intent dict with list and dict fields
+        """
+        return {
+            "roles": list(self.roles),
+            "skills": list(self.skills),
+            "locations": list(self.locations),
+            "company_criteria": dict(self.company_criteria),
+            "seniority": list(self.seniority),
+            "keywords_raw": self.keywords_raw if keywords_raw is None else keywords_raw
+        }
+
+
+@lru_cache(maxsize=1024)
+def _parse_intent(query: str) -> Intent:
+    """
+    Parse a query into its semantic intent, cached by query string
+    
+    Args:
+        query (str): The normalized search query in any language
+        
+    Returns:
+        Intent: The parsed intent
+    """
+    keywords_raw = query.lower()
+    matched = _match_intent_terms(keywords_raw)
+    
+    # Extract roles, skills and locations, keeping vocabulary order
+    roles = tuple(role for role in _ROLE_PATTERNS if role in matched["roles"])
+    skills = tuple(skill for skill in _SKILL_PATTERNS if skill in matched["skills"])
+    locations = tuple(location for location in _LOCATION_PATTERNS if location in matched["locations"])
+    
+    # Extract company criteria
+    company_criteria = []
+    if "1-100" in matched["company_size"]:
+        company_criteria.append(("size", "1-100"))
+    elif "1-50" in matched["company_size"]:
+        company_criteria.append(("size", "1-50"))
+        
+    if matched["funding"]:
+        company_criteria.append(("funding", "funded"))
+        
+    # Extract seniority (decision makers)
+    seniority = _DECISION_MAKER_SENIORITY if matched["decision_maker"] else ()
+    
+    return Intent(
+        keywords_raw=keywords_raw,
+        roles=roles,
+        skills=skills,
+        locations=locations,
+        company_criteria=tuple(company_criteria),
+        seniority=seniority
+    )
+
+
+_LOOP = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the event loop that runs the async search methods for the sync interface,
+    starting it in a daemon thread on first use
+    
+    Returns:
+        asyncio.AbstractEventLoop: The shared running loop
+    """
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(
+                target=_LOOP.run_forever, name="linkedin-search-loop", daemon=True
+            ).start()
+    return _LOOP
+
 
 class LinkedInSalesNavigator:
     """
@@ -51,21 +359,109 @@ class LinkedInSalesNavigator:
         if self.session_token:
             self.session_token = self.session_token.strip("'\"")
         
-        # Check for saved cookies
+        # Identifies whose LinkedIn session a pooled browser holds, without keeping the token itself
+        token_digest = hashlib.sha256(self.session_token.encode()).hexdigest() if self.session_token else None
+        self._account = (self.username, token_digest)
+        
+        # Saved cookies location (JSON preferred, legacy pickle still accepted)
         self.cookies_file = Path("linkedin_cookies.pkl")
-        self.has_saved_session = self.cookies_file.exists()
         
         # Initialize browser and anti-detection components
         self.driver = None
+        self._lease = None
         self.logged_in = False
         self.stealth_browser = None
         self.human_sim = None
         self.rate_limiter = None
         
+        # Whether a search is already recorded with the rate limiter ahead of its page load
+        self._search_reserved = False
+        
         # Session tracking
         self.session_start_time = time.time()
         self.pages_visited = 0
         
+    @classmethod
+    def can_serve(cls):
+        """
+        Cheap pre-flight check of the shared rate limiter, so callers can
+        skip building a LinkedIn session when the search would be refused anyway
+        
+        Returns:
+            bool: True if a search is currently allowed
+        """
+        from .rate_limiter import get_rate_limiter
+        
+        can_proceed, message = get_rate_limiter().can_search()
+        if not can_proceed:
+            logger.warning(f"Rate limit hit: {message}")
+        return can_proceed
+    
+    @classmethod
+    async def batch_search(cls, queries, kind="leads", max_results=10):
+        """
+        Run several searches side by side, each on its own pooled browser, spaced out by
+        the shared rate limiter
+        
+        Args:
+            queries (list): Search queries
+            kind (str): "leads" or "companies"
+            max_results (int): Maximum results per query
+            
+        Returns:
+            list: Raw results per query, in query order (None where login failed or the
+                rate limit refused the search)
+        """
+        from .browser_pool import get_browser_pool
+        from .rate_limiter import get_rate_limiter
+        
+        limiter = get_rate_limiter()
+        
+        # Never queue more searches than there are browsers to run them
+        slots = asyncio.Semaphore(get_browser_pool().size)
+        
+        async def _run(query):
+            async with slots:
+                # Reserve the search before starting it, waiting out the gap since the last one
+                while True:
+                    reserved, reason = await asyncio.to_thread(limiter.reserve_search)
+                    if reserved:
+                        break
+                    # Only a spent counter blocks for good; a timer may already have run out
+                    wait = limiter.seconds_until_search()
+                    if wait == float("inf"):
+                        logger.warning(f"Skipping batch query {query!r}: {reason}")
+                        return None
+                    await asyncio.sleep(wait)
+                return await asyncio.to_thread(cls._run_batch_query, query, kind, max_results)
+        
+        return await asyncio.gather(*(_run(query) for query in queries))
+    
+    @classmethod
+    def _run_batch_query(cls, query, kind, max_results):
+        """
+        Run one batch search in a worker thread with its own driver, on the shared
+        background loop
+        
+        Args:
+            query (str): Search query
+            kind (str): "leads" or "companies"
+            max_results (int): Maximum results to return
+            
+        Returns:
+            list: Raw search results, None if login failed
+        """
+        with cls(query) as navigator:
+            # batch_search already reserved this search with the shared rate limiter
+            navigator._search_reserved = True
+            search = navigator.search_companies if kind == "companies" else navigator.search_leads
+            return asyncio.run_coroutine_threadsafe(search(max_results), _background_loop()).result()
+    
+    @cached_property
+    def has_saved_session(self) -> bool:
+        """Whether saved cookies exist, probed only when login first consults it"""
+        return self.cookies_file.with_suffix(".json").exists() or self.cookies_file.exists()
+    
     def get_credential(self, key):
         """
         Gets LinkedIn credentials from headers or environment variables
@@ -98,33 +494,27 @@ class LinkedInSalesNavigator:
             return
         
         try:
-            # Initialize stealth browser
-            from .stealth_browser import StealthBrowser
+            # Check out a stealth browser from the shared pool
+            from .browser_pool import get_browser_pool
             from .human_simulator import HumanSimulator
-            from .rate_limiter import RateLimiter
+            from .rate_limiter import get_rate_limiter
             
             # Check rate limits before proceeding
-            self.rate_limiter = RateLimiter()
-            can_proceed, message = self.rate_limiter.can_search()
-            if not can_proceed:
-                logger.warning(f"Rate limit hit: {message}")
-                # Return without raising exception to gracefully handle rate limiting
-                self.driver = None
-                return
-            
-            # Initialize stealth browser with anti-detection
-            self.stealth_browser = StealthBrowser()
-            
-            # Try undetected-chromedriver first if available
-            try:
-                import undetected_chromedriver
-                use_undetected = True
-                logger.info("Using undetected-chromedriver for maximum stealth")
-            except ImportError:
-                use_undetected = False
-                logger.info("Using enhanced Selenium with stealth settings")
+            self.rate_limiter = get_rate_limiter()
+            if not self._search_reserved:
+                # Record the search as part of the check, so concurrent navigators can't all pass it
+                can_proceed, message = self.rate_limiter.reserve_search()
+                if not can_proceed:
+                    logger.warning(f"Rate limit hit: {message}")
+                    # Return without raising exception to gracefully handle rate limiting
+                    self.driver = None
+                    return
+                self._search_reserved = True
             
-            self.driver = self.stealth_browser.init_stealth_browser(use_undetected=use_undetected)
+            # Reuse a warm browser with anti-detection, launching one only if none is idle
+            self._lease = get_browser_pool().acquire()
+            self.stealth_browser = self._lease.stealth_browser
+            self.driver = self._lease.driver
             
             # Initialize human simulator for behavior mimicking
             self.human_sim = HumanSimulator()
@@ -138,8 +528,141 @@ class LinkedInSalesNavigator:
         except Exception as e:
             logger.error(f"Failed to initialize browser with anti-detection: {e}")
             logger.warning("LinkedIn retriever will return empty results due to browser initialization failure")
-            self.driver = None
+            self.close()
+    
+    def close(self, discard=False):
+        """
+        Return the browser to the shared pool
+        
+        Args:
+            discard (bool): Quit the browser instead of keeping it for reuse
+        """
+        if self._lease:
+            from .browser_pool import get_browser_pool
+            
+            if self.logged_in:
+                # Let the next user with the same credentials skip the login round-trips
+                self._lease.logged_in = True
+                self._lease.account = self._account
+            elif not discard:
+                # Don't hand a half-finished or foreign login to the next user
+                try:
+                    self._lease.clear_session()
+                except Exception as clear_error:
+                    logger.warning(f"Could not clear LinkedIn session, discarding browser: {clear_error}")
+                    discard = True
+            
+            try:
+                get_browser_pool().release(self._lease, discard=discard)
+                logger.info("LinkedIn browser returned to pool")
+            except Exception as cleanup_error:
+                logger.warning(f"Error releasing browser: {cleanup_error}")
+        
+        self._lease = None
+        self.driver = None
+        self.stealth_browser = None
+        self.logged_in = False
+        self._search_reserved = False
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
 
+    def _wait(self, timeout):
+        """
+        Create an explicit wait on the current driver with a short polling interval
+        
+        Args:
+            timeout (float): Maximum seconds to wait
+            
+        Returns:
+            WebDriverWait: The wait object
+        """
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        return WebDriverWait(self.driver, timeout, poll_frequency=_WAIT_POLL_FREQUENCY)
+    
+    def _wait_for_url(self, fragments, timeout=10):
+        """
+        Wait until the current URL contains any of the given fragments
+        
+        Args:
+            fragments (tuple): URL fragments to look for (lowercase)
+            timeout (float): Maximum seconds to wait
+            
+        Returns:
+            bool: True if a fragment appeared, False on timeout
+        """
+        from selenium.common.exceptions import TimeoutException
+        
+        try:
+            self._wait(timeout).until(
+                lambda d: any(fragment in d.current_url.lower() for fragment in fragments)
+            )
+            return True
+        except TimeoutException:
+            return False
+    
+    @staticmethod
+    def _debug_artifacts_enabled():
+        """Debug screenshots and page dumps are only written when explicitly requested"""
+        return logger.isEnabledFor(logging.DEBUG) and bool(os.environ.get("LINKEDIN_DEBUG_SCREENSHOTS"))
+    
+    def _debug_screenshot(self, path):
+        """
+        Save a screenshot of the current page when debug artifacts are enabled
+        
+        Args:
+            path (str): Destination PNG path
+        """
+        if not self._debug_artifacts_enabled():
+            return
+        try:
+            self.driver.save_screenshot(path)
+            logger.debug(f"Screenshot saved: {path}")
+        except Exception:
+            pass
+    
+    def _debug_page_source(self, path):
+        """
+        Save the current page HTML when debug artifacts are enabled
+        
+        Args:
+            path (str): Destination HTML path
+        """
+        if not self._debug_artifacts_enabled():
+            return
+        try:
+            with open(path, 'w') as f:
+                f.write(self.driver.page_source)
+            logger.debug(f"Full page source saved to {path}")
+        except Exception:
+            pass
+    
+    def _wait_for_results(self, timeout=15):
+        """
+        Wait until the first search result row is in the DOM
+        
+        Args:
+            timeout (float): Maximum seconds to wait
+            
+        Returns:
+            bool: True if results appeared, False on timeout (e.g. an empty search)
+        """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        try:
+            self._wait(timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, _RESULT_MARKER_SELECTOR))
+            )
+            return True
+        except TimeoutException:
+            return False
+    
     def smart_navigation(self, url):
         """
         Navigate with human-like behavior to avoid detection
@@ -193,12 +716,19 @@ class LinkedInSalesNavigator:
         if self.rate_limiter:
             # Don't record decoy pages as searches
             if "sales/search" in url:
-                self.rate_limiter.record_search(success=True)
+                if self._search_reserved:
+                    # Already recorded when init_browser reserved it
+                    self._search_reserved = False
+                else:
+                    self.rate_limiter.record_search(success=True)
     
     def login(self):
         """
         Login to LinkedIn Sales Navigator using session token, saved session, or credentials
         """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        
         if self.logged_in:
             return True
             
@@ -210,6 +740,16 @@ class LinkedInSalesNavigator:
                 logger.warning("Browser initialization failed, cannot login to LinkedIn")
                 return False
             
+            # A pooled browser that already logged in keeps its session cookies, which are
+            # only reused by a caller with the same credentials
+            if self._lease.logged_in:
+                if self._lease.account == self._account:
+                    logger.info("Reusing logged-in LinkedIn session from pooled browser")
+                    self.logged_in = True
+                    return True
+                logger.info("Pooled browser holds another LinkedIn account's session, clearing it")
+                self._lease.clear_session()
+            
             # Try to use session token first (highest priority)
             if self.session_token:
                 logger.info("Found LinkedIn session token in environment, attempting to use it...")
@@ -251,7 +791,7 @@ class LinkedInSalesNavigator:
             
             # Enter credentials with human-like typing
             logger.info("Entering username...")
-            username_field = WebDriverWait(self.driver, 10).until(
+            username_field = self._wait(10).until(
                 EC.presence_of_element_located((By.ID, "username"))
             )
             
@@ -280,11 +820,7 @@ class LinkedInSalesNavigator:
                 password_field.send_keys(self.password)
             
             # Take screenshot before clicking login
-            try:
-                self.driver.save_screenshot("/tmp/linkedin_before_login.png")
-                logger.info("Screenshot saved: /tmp/linkedin_before_login.png")
-            except:
-                pass
+            self._debug_screenshot("/tmp/linkedin_before_login.png")
             
             # Click login button
             logger.info("Clicking login button...")
@@ -292,7 +828,13 @@ class LinkedInSalesNavigator:
             login_button.click()
             
             # Wait for login to complete and handle various redirect scenarios
-            return self._verify_login_success()
+            if not self._verify_login_success():
+                return False
+            
+            # Snapshot the fresh session so later browsers load cookies instead of logging in;
+            # an expired snapshot falls through to this path and is overwritten
+            self.save_session()
+            return True
                 
         except Exception as e:
             logger.error(f"Login failed: {e}")
@@ -308,46 +850,32 @@ class LinkedInSalesNavigator:
         Returns:
             bool: True if login successful, False otherwise
         """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support import expected_conditions as EC
+        
         for attempt in range(max_attempts):
             try:
-                # Wait a bit for redirect to complete
-                time.sleep(5)
+                # Wait for the redirect to complete, returning as soon as it does
+                try:
+                    self._wait(8).until(EC.any_of(
+                        *(EC.url_contains(marker) for marker in _LOGIN_REDIRECT_MARKERS)
+                    ))
+                except TimeoutException:
+                    pass
                 current_url = self.driver.current_url.lower()
                 logger.info(f"Login attempt {attempt + 1}: Current URL is {current_url}")
                 
                 # Take screenshot after login attempt
-                try:
-                    self.driver.save_screenshot(f"/tmp/linkedin_after_login_{attempt}.png")
-                    logger.info(f"Screenshot saved: /tmp/linkedin_after_login_{attempt}.png")
-                except:
-                    pass
+                self._debug_screenshot(f"/tmp/linkedin_after_login_{attempt}.png")
                 
                 # Check for successful login indicators
-                success_indicators = [
-                    "feed",           # Main LinkedIn feed
-                    "sales",          # Sales Navigator
-                    "/in/",           # Profile page (/in/username)
-                    "mynetwork",      # Network page
-                    "messaging",      # Messages
-                    "jobs",           # Jobs page
-                    "notifications"   # Notifications
-                ]
-                
-                if any(indicator in current_url for indicator in success_indicators):
+                if _SUCCESS_RE.search(current_url):
                     self.logged_in = True
                     logger.info(f"Successfully logged in to LinkedIn (redirected to {current_url})")
                     return True
                 
                 # Check for challenge/verification pages that require user action
-                challenge_indicators = [
-                    "checkpoint/challenge",    # Security verification
-                    "check/add-phone",        # Phone verification
-                    "add-phone",              # Phone number request
-                    "challenge",              # General challenge
-                    "verify",                 # Verification page
-                ]
-                
-                if any(indicator in current_url for indicator in challenge_indicators):
+                if _CHALLENGE_RE.search(current_url):
                     logger.warning(f"LinkedIn requires additional verification: {current_url}")
                     logger.warning("Please complete the verification manually or use a different account")
                     return False
@@ -356,33 +884,13 @@ class LinkedInSalesNavigator:
                 if "/login" in current_url:
                     # Look for error messages
                     try:
-                        # More comprehensive error selectors
-                        error_selectors = [
-                            ".form__label--error",
-                            ".alert-content",
-                            ".error",
-                            "[data-test-id='error-message']",
-                            "#error-for-password",
-                            "#error-for-username",
-                            ".login__form_action_container .error"
-                        ]
-                        
-                        error_messages = []
-                        for selector in error_selectors:
-                            elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                            for elem in elements:
-                                if elem.text.strip():
-                                    error_messages.append(elem.text.strip())
+                        # One querySelectorAll over every error selector instead of a round-trip each
+                        error_messages = self.driver.execute_script(_COLLECT_LOGIN_ERRORS, _LOGIN_ERROR_SELECTOR)
                         
                         if error_messages:
                             logger.error(f"Login failed with errors: {'; '.join(error_messages)}")
-                            # Try to get full page source for debugging
-                            try:
-                                with open('/tmp/linkedin_error_page.html', 'w') as f:
-                                    f.write(self.driver.page_source)
-                                logger.info("Full page source saved to /tmp/linkedin_error_page.html")
-                            except:
-                                pass
+                            # Keep the full page source for debugging
+                            self._debug_page_source('/tmp/linkedin_error_page.html')
                             return False
                     except Exception as e:
                         logger.debug(f"Error checking for error messages: {e}")
@@ -390,7 +898,6 @@ class LinkedInSalesNavigator:
                     # If still on login page but no specific error, might need more time
                     logger.warning(f"Still on login page (attempt {attempt + 1}), waiting longer...")
                     if attempt < max_attempts - 1:
-                        time.sleep(5)
                         continue
                     else:
                         logger.error("Login failed - remained on login page")
@@ -407,7 +914,6 @@ class LinkedInSalesNavigator:
                 # If we get here, we're in an unexpected state
                 logger.warning(f"Unexpected redirect during login: {current_url}")
                 if attempt < max_attempts - 1:
-                    time.sleep(2)
                     continue
                     
             except Exception as e:
@@ -426,11 +932,9 @@ class LinkedInSalesNavigator:
         Returns:
             bool: True if session loaded successfully, False otherwise
         """
+        from selenium.webdriver.common.by import By
+        
         try:
-            # Navigate to LinkedIn first (required for cookies to work)
-            self.driver.get("https://www.linkedin.com")
-            time.sleep(2)
-            
             # Create the li_at cookie with the session token
             cookie = {
                 'name': 'li_at',
@@ -443,9 +947,6 @@ class LinkedInSalesNavigator:
             
             logger.info(f"Setting li_at cookie with token: {self.session_token[:30]}...")
             
-            # Add the cookie to the browser
-            self.driver.add_cookie(cookie)
-            
             # Also add other necessary cookies for LinkedIn
             # Add JSESSIONID if needed
             jsessionid_cookie = {
@@ -456,16 +957,13 @@ class LinkedInSalesNavigator:
                 'secure': True,
                 'httpOnly': True
             }
-            self.driver.add_cookie(jsessionid_cookie)
             
-            # Refresh the page to apply cookies
-            logger.info("Refreshing page to apply session token...")
-            self.driver.refresh()
-            time.sleep(3)
+            # Add the cookies to the browser
+            self._install_cookies([cookie, jsessionid_cookie])
             
-            # Check if we're logged in by navigating to feed
+            # Check if we're logged in by navigating to feed (loads with the new cookies)
             self.driver.get("https://www.linkedin.com/feed/")
-            time.sleep(3)
+            self._wait_for_url(("feed", "sales", "login", "checkpoint"), timeout=10)
             
             current_url = self.driver.current_url
             logger.info(f"Current URL after session token: {current_url}")
@@ -493,6 +991,82 @@ class LinkedInSalesNavigator:
             logger.error(f"Error loading session token: {e}")
             return False
     
+    def _read_cookies(self):
+        """
+        Read saved cookies, preferring the JSON file over the legacy pickle
+        
+        Returns:
+            list: Cookies in Selenium format
+        """
+        json_file = self.cookies_file.with_suffix(".json")
+        if json_file.exists():
+            return orjson.loads(json_file.read_bytes())
+        
+        with open(self.cookies_file, 'rb') as file:
+            return pickle.load(file)
+    
+    def save_session(self):
+        """
+        Save the browser's cookies as JSON so later runs can reuse the session.
+        New sessions should always be written this way rather than pickled.
+        
+        Returns:
+            bool: True if the cookies were saved, False otherwise
+        """
+        if not self.driver:
+            return False
+        
+        try:
+            json_file = self.cookies_file.with_suffix(".json")
+            json_file.write_bytes(orjson.dumps(self.driver.get_cookies()))
+            self.has_saved_session = True
+            logger.info(f"Saved LinkedIn session to {json_file}")
+            return True
+        except Exception as e:
+            logger.error(f"Error saving session: {e}")
+            return False
+    
+    def _install_cookies(self, cookies):
+        """
+        Install cookies with a single CDP Network.setCookies call, falling back to
+        per-cookie add_cookie (which needs the LinkedIn domain loaded) if CDP rejects them
+        
+        Args:
+            cookies (list): Cookies in Selenium format
+        """
+        cdp_cookies = []
+        for cookie in cookies:
+            cdp_cookie = {
+                key: cookie[key]
+                for key in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly')
+                if key in cookie
+            }
+            if 'expiry' in cookie:
+                cdp_cookie['expires'] = int(cookie['expiry'])
+            if 'domain' not in cdp_cookie:
+                cdp_cookie['url'] = "https://www.linkedin.com"
+            cdp_cookies.append(cdp_cookie)
+        
+        try:
+            self.driver.execute_cdp_cmd('Network.setCookies', {'cookies': cdp_cookies})
+            return
+        except Exception as e:
+            logger.debug(f"CDP cookie install failed, adding cookies one by one: {e}")
+        
+        # Navigate to LinkedIn first (required for add_cookie to work)
+        self.driver.get("https://www.linkedin.com")
+        
+        for cookie in cookies:
+            # Remove sameSite attribute if present (can cause issues)
+            cookie = {key: value for key, value in cookie.items() if key != 'sameSite'}
+            # Remove expiry if it's causing issues
+            if 'expiry' in cookie:
+                cookie['expiry'] = int(cookie['expiry'])
+            try:
+                self.driver.add_cookie(cookie)
+            except Exception as e:
+                logger.debug(f"Could not add cookie {cookie.get('name', 'unknown')}: {e}")
+    
     def _load_saved_session(self):
         """
         Load saved cookies from file and apply them to the browser
@@ -501,37 +1075,22 @@ class LinkedInSalesNavigator:
             bool: True if session loaded successfully, False otherwise
         """
         try:
-            # Navigate to LinkedIn first (required for cookies to work)
-            self.driver.get("https://www.linkedin.com")
-            time.sleep(2)
-            
             # Load cookies from file
-            with open(self.cookies_file, 'rb') as file:
-                cookies = pickle.load(file)
+            cookies = self._read_cookies()
             
             logger.info(f"Loading {len(cookies)} saved cookies...")
             
-            # Add each cookie to the browser
-            for cookie in cookies:
-                # Remove sameSite attribute if present (can cause issues)
-                if 'sameSite' in cookie:
-                    del cookie['sameSite']
-                # Remove expiry if it's causing issues
-                if 'expiry' in cookie:
-                    cookie['expiry'] = int(cookie['expiry'])
-                try:
-                    self.driver.add_cookie(cookie)
-                except Exception as e:
-                    logger.debug(f"Could not add cookie {cookie.get('name', 'unknown')}: {e}")
+            # Add all cookies to the browser
+            self._install_cookies(cookies)
             
             # Navigate to Sales Navigator to test the session
             logger.info("Testing saved session...")
             self.driver.get("https://www.linkedin.com/sales/home")
-            time.sleep(3)
+            self._wait_for_url(("sales", "feed", "/in/", "login", "checkpoint"), timeout=10)
             
             # Check if we're logged in
             current_url = self.driver.current_url.lower()
-            if "sales" in current_url or "feed" in current_url or "/in/" in current_url:
+            if _SESSION_VALID_RE.search(current_url):
                 logger.info(f"Saved session is valid! Current URL: {current_url}")
                 return True
             else:
@@ -555,7 +1114,7 @@ class LinkedInSalesNavigator:
         Returns:
             list: List of lead information, None if rate limited
         """
-        if not self.login():
+        if not await asyncio.to_thread(self.login):
             logger.error("Failed to login to LinkedIn Sales Navigator")
             # Return None to indicate login failure (for fallback to Tavily)
             return None
@@ -585,7 +1144,7 @@ class LinkedInSalesNavigator:
         Returns:
             list: List of company information, None if rate limited
         """
-        if not self.login():
+        if not await asyncio.to_thread(self.login):
             logger.error("Failed to login to LinkedIn Sales Navigator")
             # Return None to indicate login failure (for fallback to Tavily)
             return None
@@ -615,68 +1174,10 @@ class LinkedInSalesNavigator:
         Returns:
             dict: Parsed intent with roles, skills, locations, etc.
         """
-        intent = {
-            "roles": [],
-            "skills": [],
-            "locations": [],
-            "company_criteria": {},
-            "seniority": [],
-            "keywords_raw": query.lower()
-        }
-        
-        # Extract roles (English and Ukrainian patterns)
-        role_patterns = {
-            "javascript developer": ["javascript", "js", "frontend", "backend", "fullstack", "розробник"],
-            "cto": ["cto", "chief technology", "tech lead", "технічний директор"],
-            "ceo": ["ceo", "chief executive", "founder", "засновник", "директор"],
-            "developer": ["developer", "engineer", "programmer", "розробник", "програміст"],
-            "manager": ["manager", "менеджер", "керівник"]
-        }
-        
-        for role, patterns in role_patterns.items():
-            if any(pattern in intent["keywords_raw"] for pattern in patterns):
-                intent["roles"].append(role)
-        
-        # Extract technical skills
-        skill_patterns = {
-            "JavaScript": ["javascript", "js", "node", "react", "vue", "angular"],
-            "Python": ["python", "django", "flask"],
-            "Java": ["java", "spring"],
-            "TypeScript": ["typescript", "ts"]
-        }
-        
-        for skill, patterns in skill_patterns.items():
-            if any(pattern in intent["keywords_raw"] for pattern in patterns):
-                intent["skills"].append(skill)
-        
-        # Extract locations (support multiple languages)
-        location_patterns = {
-            "Valencia": ["valencia", "валенсії", "валенсія"],
-            "Barcelona": ["barcelona", "барселоні", "барселона"],
-            "Madrid": ["madrid", "мадрид"],
-            "Spain": ["spain", "іспанії", "іспанія"]
-        }
-        
-        for location, patterns in location_patterns.items():
-            if any(pattern in intent["keywords_raw"] for pattern in patterns):
-                intent["locations"].append(location)
-        
-        # Extract company criteria
-        if any(term in intent["keywords_raw"] for term in ["100", "співробітників", "employees"]):
-            intent["company_criteria"]["size"] = "1-100"
-        elif any(term in intent["keywords_raw"] for term in ["startup", "стартап"]):
-            intent["company_criteria"]["size"] = "1-50"
-            
-        if any(term in intent["keywords_raw"] for term in ["funded", "investment", "інвестиції"]):
-            intent["company_criteria"]["funding"] = "funded"
-            
-        # Extract seniority (decision makers)
-        if any(term in intent["keywords_raw"] for term in ["лпр", "decision maker", "ceo", "cto", "founder"]):
-            intent["seniority"].extend(["owner", "partner", "cxo", "vp", "director"])
-            
-        return intent
+        return _parse_intent(_normalize_query(query)).to_dict(keywords_raw=query.lower())
     
-    def generate_optimized_keywords(self, intent: dict) -> str:
+    @staticmethod
+    def generate_optimized_keywords(intent: dict) -> str:
         """
         Generate LinkedIn-optimized Boolean search keywords
         
@@ -706,12 +1207,13 @@ class LinkedInSalesNavigator:
         # If no structured keywords found, extract simple terms
         if not keyword_parts:
             # Fallback: extract 1-2 key terms from original query
-            simple_terms = self._extract_simple_keywords(intent["keywords_raw"])
+            simple_terms = LinkedInSalesNavigator._extract_simple_keywords(intent["keywords_raw"])
             return ' OR '.join(simple_terms[:2])
             
         return ' '.join(keyword_parts)
     
-    def _extract_simple_keywords(self, query: str) -> list:
+    @staticmethod
+    def _extract_simple_keywords(query: str) -> list:
         """
         Extract simple keywords as fallback when structured parsing fails
         
@@ -722,21 +1224,12 @@ class LinkedInSalesNavigator:
             list: Simple keyword terms
         """
         # Remove common words and extract meaningful terms
-        stop_words = {'the', 'and', 'or', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
-                      'склади', 'будь', 'ласка', 'список', 'які', 'мають', 'шукають'}
-        
-        words = query.lower().split()
-        keywords = []
-        
-        for word in words:
-            # Clean word and check if meaningful
-            clean_word = ''.join(c for c in word if c.isalnum())
-            if len(clean_word) > 2 and clean_word not in stop_words:
-                keywords.append(clean_word)
-                
-        return keywords
+        # Clean each word and keep the meaningful ones
+        clean_words = (_NON_ALNUM_RE.sub('', word) for word in query.lower().split())
+        return [word for word in clean_words if len(word) > 2 and word not in _STOP_WORDS]
     
-    def build_native_filters(self, intent: dict) -> dict:
+    @staticmethod
+    def build_native_filters(intent: dict) -> dict:
         """
         Build LinkedIn Sales Navigator native filters from intent
         
@@ -754,22 +1247,16 @@ class LinkedInSalesNavigator:
         
         # Company size filter
         if intent["company_criteria"].get("size"):
-            size_map = {
-                "1-50": "B",   # 1-50 employees
-                "1-100": "C",  # 51-200 employees (closest to 1-100)
-                "51-200": "D", 
-                "201-500": "E"
-            }
             size = intent["company_criteria"]["size"]
-            if size in size_map:
-                filters["companySize"] = size_map[size]
+            if size in _COMPANY_SIZE_CODES:
+                filters["companySize"] = _COMPANY_SIZE_CODES[size]
         
         # Seniority filter (for decision makers)
         if intent["seniority"]:
             filters["seniorityIncluded"] = ','.join(intent["seniority"])
         
         # Function filter (for technical roles)
-        if any(role in intent["roles"] for role in ["javascript developer", "developer"]):
+        if not _ENGINEERING_ROLES.isdisjoint(intent["roles"]):
             filters["functionIncluded"] = "engineering"
             
         # Current job title only (best practice)
@@ -787,21 +1274,38 @@ class LinkedInSalesNavigator:
         Returns:
             dict: Optimized filters with keywords and native LinkedIn filters
         """
+        normalized = _normalize_query(query)
+        optimized_keywords, native_filters = self._cached_query_filters(normalized)
+        
+        # Return combined result as fresh mutable copies
+        return {
+            "keywords": optimized_keywords,
+            "native_filters": dict(native_filters),
+            "intent": _parse_intent(normalized).to_dict(keywords_raw=query.lower())  # Keep for debugging and fallback
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _cached_query_filters(query):
+        """
+        Derive keywords and native filters for a query, cached by query string
+        
+        Args:
+            query (str): The normalized search query
+            
+        Returns:
+            tuple: (optimized keywords, native filter items)
+        """
         # Step 1: Parse semantic intent
-        intent = self.parse_intent(query)
+        intent = _parse_intent(query).to_dict()
         
         # Step 2: Generate optimized keywords
-        optimized_keywords = self.generate_optimized_keywords(intent)
+        optimized_keywords = LinkedInSalesNavigator.generate_optimized_keywords(intent)
         
         # Step 3: Build native filters
-        native_filters = self.build_native_filters(intent)
+        native_filters = LinkedInSalesNavigator.build_native_filters(intent)
         
-        # Return combined result
-        return {
-            "keywords": optimized_keywords,
-            "native_filters": native_filters,
-            "intent": intent  # Keep for debugging and fallback
-        }
+        return optimized_keywords, tuple(native_filters.items())
     
     def build_sales_nav_url(self, filters, search_type="people"):
         """
@@ -814,26 +1318,41 @@ class LinkedInSalesNavigator:
         Returns:
             str: The search URL
         """
-        base_url = f"https://www.linkedin.com/sales/search/{search_type}"
-        params = []
+        # Keep only filters that are set, in their original order, as a hashable cache key
+        native_items = tuple(
+            (filter_key, filter_value)
+            for filter_key, filter_value in filters.get("native_filters", {}).items()
+            if filter_value
+        )
+        return self._cached_sales_nav_url(filters.get("keywords") or "", native_items, search_type)
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _cached_sales_nav_url(keywords, native_items, search_type):
+        """
+        Encode a Sales Navigator search URL, cached by its canonical parameters
+        
+        Args:
+            keywords (str): Optimized keywords, empty for none
+            native_items (tuple): (filter key, value) pairs that are set
+            search_type (str): Type of search (people or companies)
+            
+        Returns:
+            str: The search URL
+        """
+        base_url = _SALES_NAV_SEARCH_URL + search_type
+        params = {}
         
         # Add optimized keywords
-        if filters.get("keywords"):
-            params.append(f"keywords={quote_plus(filters['keywords'])}")
+        if keywords:
+            params["keywords"] = keywords
         
         # Add native LinkedIn filters
-        native_filters = filters.get("native_filters", {})
-        
-        for filter_key, filter_value in native_filters.items():
-            if filter_value:
-                if filter_key == "currentJobTitle" and filter_value == "true":
-                    params.append("currentJobTitle=true")
-                else:
-                    params.append(f"{filter_key}={quote_plus(str(filter_value))}")
+        params.update(native_items)
             
-        # Combine URL with proper parameter separation
+        # Encode every parameter in one pass
         if params:
-            return f"{base_url}?{'&'.join(params)}"
+            return f"{base_url}?{urlencode(params, quote_via=quote_plus)}"
         return base_url
     
     async def search_with_progressive_fallback(self, filters, search_type="people", max_results=10):
@@ -849,19 +1368,18 @@ class LinkedInSalesNavigator:
             list: Search results
         """
         logger.info(f"Starting progressive search with filters: {filters}")
+        tried_urls = set()
         
         # Strategy 1: Full optimized search
         try:
             search_url = self.build_sales_nav_url(filters, search_type)
+            tried_urls.add(search_url)
             logger.info(f"Trying optimized search: {search_url}")
             
-            self.smart_navigation(search_url)
-            if self.human_sim:
-                self.human_sim.random_delay(3, 7)
-            else:
-                time.sleep(5)
+            await asyncio.to_thread(self.smart_navigation, search_url)
+            await asyncio.to_thread(self._wait_for_results)
             
-            results = self._extract_search_results(search_type, max_results)
+            results = await asyncio.to_thread(self._extract_search_results, search_type, max_results)
             
             if len(results) > 0:
                 logger.info(f"✅ Optimized search successful: {len(results)} results")
@@ -872,14 +1390,6 @@ class LinkedInSalesNavigator:
         except Exception as e:
             logger.error(f"Optimized search failed: {e}")
         
-        # Add randomized delay between strategies to avoid rate limiting
-        if self.human_sim:
-            delay = self.rate_limiter.get_delay("search") if self.rate_limiter else random.uniform(20, 40)
-            logger.debug(f"Waiting {delay:.1f} seconds before next strategy")
-            time.sleep(delay)
-        else:
-            time.sleep(random.uniform(15, 25))
-        
         # Strategy 2: Simplified keywords search
         try:
             intent = filters.get("intent", {})
@@ -895,30 +1405,23 @@ class LinkedInSalesNavigator:
                 }
                 
                 search_url = self.build_sales_nav_url(simplified_filters, search_type)
-                logger.info(f"Trying simplified search: {search_url}")
-                
-                self.driver.get(search_url)
-                time.sleep(10)  # Increased delay to avoid rate limiting
-                
-                results = self._extract_search_results(search_type, max_results)
-                
-                if len(results) > 0:
-                    logger.info(f"✅ Simplified search successful: {len(results)} results")
-                    return results
-                else:
-                    logger.warning("❌ Simplified search returned 0 results, trying minimal...")
+                if await self._begin_fallback_strategy(search_url, tried_urls):
+                    logger.info(f"Trying simplified search: {search_url}")
+                    
+                    await asyncio.to_thread(self.driver.get, search_url)
+                    await asyncio.to_thread(self._wait_for_results)
                     
+                    results = await asyncio.to_thread(self._extract_search_results, search_type, max_results)
+                    
+                    if len(results) > 0:
+                        logger.info(f"✅ Simplified search successful: {len(results)} results")
+                        return results
+                    else:
+                        logger.warning("❌ Simplified search returned 0 results, trying minimal...")
+                        
         except Exception as e:
             logger.error(f"Simplified search failed: {e}")
         
-        # Add randomized delay between strategies to avoid rate limiting
-        if self.human_sim:
-            delay = self.rate_limiter.get_delay("search") if self.rate_limiter else random.uniform(20, 40)
-            logger.debug(f"Waiting {delay:.1f} seconds before next strategy")
-            time.sleep(delay)
-        else:
-            time.sleep(random.uniform(15, 25))
-        
         # Strategy 3: Minimal search (location only)
         try:
             minimal_filters = {
@@ -929,38 +1432,27 @@ class LinkedInSalesNavigator:
             }
             
             search_url = self.build_sales_nav_url(minimal_filters, search_type)
-            logger.info(f"Trying minimal search: {search_url}")
-            
-            self.smart_navigation(search_url)
-            if self.human_sim:
-                self.human_sim.random_delay(3, 7)
-            else:
-                time.sleep(5)
-            
-            results = self._extract_search_results(search_type, max_results)
-            
-            if len(results) > 0:
-                logger.info(f"✅ Minimal search successful: {len(results)} results")
-                return results
-            else:
-                logger.warning("❌ Minimal search returned 0 results, trying OR broadening...")
+            if await self._begin_fallback_strategy(search_url, tried_urls):
+                logger.info(f"Trying minimal search: {search_url}")
+                
+                await asyncio.to_thread(self.smart_navigation, search_url)
+                await asyncio.to_thread(self._wait_for_results)
                 
+                results = await asyncio.to_thread(self._extract_search_results, search_type, max_results)
+                
+                if len(results) > 0:
+                    logger.info(f"✅ Minimal search successful: {len(results)} results")
+                    return results
+                else:
+                    logger.warning("❌ Minimal search returned 0 results, trying OR broadening...")
+                    
         except Exception as e:
             logger.error(f"Minimal search failed: {e}")
         
-        # Add randomized delay between strategies to avoid rate limiting
-        if self.human_sim:
-            delay = self.rate_limiter.get_delay("search") if self.rate_limiter else random.uniform(20, 40)
-            logger.debug(f"Waiting {delay:.1f} seconds before next strategy")
-            time.sleep(delay)
-        else:
-            time.sleep(random.uniform(15, 25))
-        
         # Strategy 4: OR-based broadening for AI post-processing
         try:
             intent = filters.get("intent", {})
-            or_keywords = self._create_or_broadening_query(intent)
-            or_filters = self._create_or_broadening_filters(intent)
+            or_keywords, or_filters = self._build_or_broadening(intent)
             
             broadening_filters = {
                 "keywords": or_keywords,
@@ -968,44 +1460,34 @@ class LinkedInSalesNavigator:
             }
             
             search_url = self.build_sales_nav_url(broadening_filters, search_type)
-            logger.info(f"🎯 Trying OR broadening search: {search_url}")
-            logger.info(f"OR Keywords: {or_keywords}")
-            
-            self.smart_navigation(search_url)
-            if self.human_sim:
-                self.human_sim.random_delay(3, 7)
-            else:
-                time.sleep(5)
-            
-            results = self._extract_search_results(search_type, max_results * 2)  # Get more results for AI filtering
-            
-            if len(results) > 0:
-                logger.info(f"✅ OR broadening successful: {len(results)} results for AI post-processing")
-                # Add metadata to indicate these results need AI filtering
-                for result in results:
-                    result["ai_filter_needed"] = True
-                    result["original_criteria"] = {
-                        "roles": intent.get("roles", []),
-                        "locations": intent.get("locations", []),
-                        "company_criteria": intent.get("company_criteria", {}),
-                        "seniority": intent.get("seniority", []),
-                        "skills": intent.get("skills", [])
-                    }
-                return results
-            else:
-                logger.warning("❌ OR broadening also returned 0 results")
+            if await self._begin_fallback_strategy(search_url, tried_urls):
+                logger.info(f"🎯 Trying OR broadening search: {search_url}")
+                logger.info(f"OR Keywords: {or_keywords}")
+                
+                await asyncio.to_thread(self.smart_navigation, search_url)
+                await asyncio.to_thread(self._wait_for_results)
+                
+                results = await asyncio.to_thread(self._extract_search_results, search_type, max_results * 2)  # Get more results for AI filtering
                 
+                if len(results) > 0:
+                    logger.info(f"✅ OR broadening successful: {len(results)} results for AI post-processing")
+                    # Add metadata to indicate these results need AI filtering
+                    for result in results:
+                        result["ai_filter_needed"] = True
+                        result["original_criteria"] = {
+                            "roles": intent.get("roles", []),
+                            "locations": intent.get("locations", []),
+                            "company_criteria": intent.get("company_criteria", {}),
+                            "seniority": intent.get("seniority", []),
+                            "skills": intent.get("skills", [])
+                        }
+                    return results
+                else:
+                    logger.warning("❌ OR broadening also returned 0 results")
+                    
         except Exception as e:
             logger.error(f"OR broadening search failed: {e}")
         
-        # Add randomized delay between strategies to avoid rate limiting
-        if self.human_sim:
-            delay = self.rate_limiter.get_delay("search") if self.rate_limiter else random.uniform(20, 40)
-            logger.debug(f"Waiting {delay:.1f} seconds before next strategy")
-            time.sleep(delay)
-        else:
-            time.sleep(random.uniform(15, 25))
-        
         # Strategy 5: Ultra-broad location-only search for maximum data
         try:
             locations = filters.get("intent", {}).get("locations", [])
@@ -1019,21 +1501,22 @@ class LinkedInSalesNavigator:
                 }
                 
                 search_url = self.build_sales_nav_url(ultra_broad_filters, search_type)
-                logger.info(f"🌍 Trying ultra-broad location search: {search_url}")
-                
-                self.driver.get(search_url)
-                time.sleep(10)  # Increased delay to avoid rate limiting
-                
-                results = self._extract_search_results(search_type, max_results * 3)  # Even more results
-                
-                if len(results) > 0:
-                    logger.info(f"✅ Ultra-broad search successful: {len(results)} results for AI post-processing")
-                    for result in results:
-                        result["ai_filter_needed"] = True
-                        result["search_strategy"] = "ultra_broad"
-                        result["original_criteria"] = intent
-                    return results
+                if await self._begin_fallback_strategy(search_url, tried_urls):
+                    logger.info(f"🌍 Trying ultra-broad location search: {search_url}")
+                    
+                    await asyncio.to_thread(self.driver.get, search_url)
+                    await asyncio.to_thread(self._wait_for_results)
+                    
+                    results = await asyncio.to_thread(self._extract_search_results, search_type, max_results * 3)  # Even more results
                     
+                    if len(results) > 0:
+                        logger.info(f"✅ Ultra-broad search successful: {len(results)} results for AI post-processing")
+                        for result in results:
+                            result["ai_filter_needed"] = True
+                            result["search_strategy"] = "ultra_broad"
+                            result["original_criteria"] = intent
+                        return results
+                        
         except Exception as e:
             logger.error(f"Ultra-broad search failed: {e}")
         
@@ -1041,17 +1524,47 @@ class LinkedInSalesNavigator:
         logger.error("🚨 All progressive search strategies failed")
         return []
     
-    def _create_or_broadening_query(self, intent: dict) -> str:
+    async def _begin_fallback_strategy(self, search_url, tried_urls):
+        """
+        Decide whether a fallback strategy should run and pace it after the previous one
+        
+        A strategy whose URL was already tried would only repeat an empty search, so it
+        is skipped together with the rate-limit delay that would have preceded it.
+        
+        Args:
+            search_url (str): URL the strategy is about to load
+            tried_urls (set): URLs loaded by earlier strategies
+            
+        Returns:
+            bool: True if the strategy should run
+        """
+        if search_url in tried_urls:
+            logger.info(f"Skipping strategy with an already tried URL: {search_url}")
+            return False
+        
+        # Add randomized delay between strategies to avoid rate limiting
+        if self.human_sim:
+            delay = self.rate_limiter.get_delay("search") if self.rate_limiter else random.uniform(20, 40)
+            logger.debug(f"Waiting {delay:.1f} seconds before next strategy")
+            await asyncio.sleep(delay)
+        else:
+            await asyncio.sleep(random.uniform(15, 25))
+        
+        tried_urls.add(search_url)
+        return True
+    
+    def _build_or_broadening(self, intent: dict) -> Tuple[str, dict]:
         """
-        Create OR-based broadening query for better AI post-processing
+        Create the OR-based broadening query and its broadened native filters in one pass
         
         Args:
             intent (dict): Parsed intent
             
         Returns:
-            str: OR-based broadening query
+            tuple: (OR-based broadening query, broadened native filters)
         """
         or_parts = []
+        filters = {}
         
         # Add roles with OR
         if intent.get("roles"):
@@ -1065,49 +1578,26 @@ class LinkedInSalesNavigator:
         
         # Add seniority terms with OR
         if intent.get("seniority"):
-            seniority_terms = ["founder", "CEO", "CTO", "director", "manager"]
-            seniority_or = ' OR '.join(seniority_terms[:3])
-            or_parts.append(f"({seniority_or})")
+            or_parts.append(f"({_SENIORITY_OR})")
         
         # Add company-related terms
         if intent.get("company_criteria", {}).get("funding"):
-            funding_terms = ["startup", "funded", "investment"]
-            funding_or = ' OR '.join(funding_terms)
-            or_parts.append(f"({funding_or})")
-        
-        # If no specific parts, use general terms
-        if not or_parts:
-            return "developer OR engineer OR founder OR manager"
-        
-        # Combine with OR (not AND) for maximum results
-        return ' OR '.join(or_parts[:3])  # Limit to 3 major OR groups
-    
-    def _create_or_broadening_filters(self, intent: dict) -> dict:
-        """
-        Create broadened native filters for OR search
-        
-        Args:
-            intent (dict): Parsed intent
-            
-        Returns:
-            dict: Broadened native filters
-        """
-        filters = {}
+            or_parts.append(f"({_FUNDING_OR})")
         
         # Keep location - this is usually the most important
         if intent.get("locations"):
             filters["geoIncluded"] = ','.join(intent["locations"])
         
-        # Remove or broaden company size (allow more companies)
-        # Don't apply company size filter for broader results
+        # Company size and function filters are left out for broader results,
+        # which allows us to find founders/managers in any function
         
         # Keep current job title filter
         filters["currentJobTitle"] = "true"
         
-        # Don't apply function filter for broader results
-        # This allows us to find founders/managers in any function
-        
-        return filters
+        # Combine with OR (not AND) for maximum results, limited to 3 major OR groups;
+        # if no specific parts, use general terms
+        or_keywords = ' OR '.join(or_parts[:3]) if or_parts else _DEFAULT_BROADENING
+        return or_keywords, filters
     
     def _extract_search_results(self, search_type, max_results):
         """
@@ -1120,111 +1610,24 @@ class LinkedInSalesNavigator:
         Returns:
             list: Extracted results
         """
+        name_selector, fields, link_selector, link_key = _RESULT_ROW_SPECS.get(
+            search_type, _RESULT_ROW_SPECS["companies"]
+        )
         results = []
         
         try:
-            if search_type == "people":
-                # Look for lead elements
-                lead_elements = self.driver.find_elements(By.CSS_SELECTOR, "[data-anonymize='person-name']")[:max_results]
-                
-                for element in lead_elements:
-                    try:
-                        # Get parent container
-                        container = element.find_element(By.XPATH, "./ancestor::li[contains(@class, 'reusable-search__result-container')]")
-                        
-                        # Extract lead information
-                        name = element.text if element.text else "N/A"
-                        
-                        # Try to get title and company
-                        try:
-                            title_element = container.find_element(By.CSS_SELECTOR, "[data-anonymize='title']")
-                            title = title_element.text if title_element.text else "N/A"
-                        except:
-                            title = "N/A"
-                        
-                        try:
-                            company_element = container.find_element(By.CSS_SELECTOR, "[data-anonymize='company-name']")
-                            company = company_element.text if company_element.text else "N/A"
-                        except:
-                            company = "N/A"
-                        
-                        # Get profile URL
-                        try:
-                            link_element = container.find_element(By.CSS_SELECTOR, "a[href*='/sales/lead/']")
-                            profile_url = link_element.get_attribute("href") if link_element else ""
-                        except:
-                            profile_url = ""
-                        
-                        # Get location if available
-                        try:
-                            location_element = container.find_element(By.CSS_SELECTOR, "[data-anonymize='location']")
-                            location = location_element.text if location_element.text else "N/A"
-                        except:
-                            location = "N/A"
-                        
-                        results.append({
-                            "name": name,
-                            "title": title,
-                            "company": company,
-                            "location": location,
-                            "profile_url": profile_url,
-                            "source": "LinkedIn Sales Navigator"
-                        })
-                        
-                    except Exception as e:
-                        logger.debug(f"Error extracting lead data: {e}")
-                        continue
-            
-            else:  # companies
-                company_elements = self.driver.find_elements(By.CSS_SELECTOR, "[data-anonymize='company-name']")[:max_results]
-                
-                for element in company_elements:
-                    try:
-                        # Get parent container
-                        container = element.find_element(By.XPATH, "./ancestor::li[contains(@class, 'reusable-search__result-container')]")
-                        
-                        # Extract company information
-                        name = element.text if element.text else "N/A"
-                        
-                        # Try to get industry and size
-                        try:
-                            industry_element = container.find_element(By.CSS_SELECTOR, "[data-anonymize='industry']")
-                            industry = industry_element.text if industry_element.text else "N/A"
-                        except:
-                            industry = "N/A"
-                        
-                        try:
-                            size_element = container.find_element(By.CSS_SELECTOR, "[data-anonymize='company-size']")
-                            size = size_element.text if size_element.text else "N/A"
-                        except:
-                            size = "N/A"
-                        
-                        # Get company URL
-                        try:
-                            link_element = container.find_element(By.CSS_SELECTOR, "a[href*='/sales/company/']")
-                            company_url = link_element.get_attribute("href") if link_element else ""
-                        except:
-                            company_url = ""
-                        
-                        # Get location
-                        try:
-                            location_element = container.find_element(By.CSS_SELECTOR, "[data-anonymize='location']")
-                            location = location_element.text if location_element.text else "N/A"
-                        except:
-                            location = "N/A"
-                        
-                        results.append({
-                            "name": name,
-                            "industry": industry,
-                            "size": size,
-                            "location": location,
-                            "company_url": company_url,
-                            "source": "LinkedIn Sales Navigator"
-                        })
-                        
-                    except Exception as e:
-                        logger.debug(f"Error extracting company data: {e}")
-                        continue
+            # Read every row in one round-trip instead of several find_element calls per row
+            rows = self.driver.execute_script(
+                _EXTRACT_RESULT_ROWS, name_selector, fields, link_selector, max_results
+            ) or []
+            
+            for row in rows:
+                result = {"name": row["name"]}
+                for key, _ in fields:
+                    result[key] = row[key]
+                result[link_key] = row["url"]
+                result["source"] = "LinkedIn Sales Navigator"
+                results.append(result)
         
         except Exception as e:
             logger.error(f"Error extracting search results: {e}")
@@ -1245,53 +1648,52 @@ class LinkedInSalesNavigator:
         try:
             logger.info(f"Starting LinkedIn Sales Navigator search for: {self.query}")
             
-            # Since we can't use async in the main retriever interface, we need to run the async methods
-            import asyncio
-            
-            # Create event loop if it doesn't exist
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+            # Since we can't use async in the main retriever interface, run the async methods
+            # on the shared background loop
+            loop = _background_loop()
             
             # Determine search type based on query
-            if any(term in self.query.lower() for term in ["company", "companies", "startup", "стартап", "компанії"]):
-                raw_results = loop.run_until_complete(self.search_companies(max_results))
+            if _match_intent_terms(self.query.lower())["search_type"]:
+                raw_results = asyncio.run_coroutine_threadsafe(self.search_companies(max_results), loop).result()
                 search_type = "companies"
                 logger.info(f"Detected company search type")
             else:
-                raw_results = loop.run_until_complete(self.search_leads(max_results))
+                raw_results = asyncio.run_coroutine_threadsafe(self.search_leads(max_results), loop).result()
                 search_type = "leads"
                 logger.info(f"Detected lead search type")
             
-            # Format results for GPT Researcher
+            # Format results for GPT Researcher, one f-string per row
             formatted_results = []
             for result in raw_results:
+                get = result.get
                 if search_type == "companies":
-                    body = f"Company: {result.get('name', 'N/A')}\n"
-                    body += f"Industry: {result.get('industry', 'N/A')}\n"
-                    body += f"Size: {result.get('size', 'N/A')}\n"
-                    body += f"Location: {result.get('location', 'N/A')}\n"
-                    href = result.get('company_url', '')
+                    body = (
+                        f"Company: {get('name', 'N/A')}\n"
+                        f"Industry: {get('industry', 'N/A')}\n"
+                        f"Size: {get('size', 'N/A')}\n"
+                        f"Location: {get('location', 'N/A')}\n"
+                    )
+                    href = get('company_url', '')
                 else:
-                    body = f"Name: {result.get('name', 'N/A')}\n"
-                    body += f"Title: {result.get('title', 'N/A')}\n"
-                    body += f"Company: {result.get('company', 'N/A')}\n"
-                    body += f"Location: {result.get('location', 'N/A')}\n"
-                    href = result.get('profile_url', '')
+                    body = (
+                        f"Name: {get('name', 'N/A')}\n"
+                        f"Title: {get('title', 'N/A')}\n"
+                        f"Company: {get('company', 'N/A')}\n"
+                        f"Location: {get('location', 'N/A')}\n"
+                    )
+                    href = get('profile_url', '')
                     
                 # Check if this result needs AI filtering
-                ai_filter_info = ""
-                if result.get("ai_filter_needed"):
-                    original_criteria = result.get("original_criteria", {})
-                    ai_filter_info += "\n[AI FILTER NEEDED]\n"
-                    ai_filter_info += f"Original Criteria: {original_criteria}\n"
-                    ai_filter_info += "Please evaluate if this profile matches the original search criteria.\n"
+                if get("ai_filter_needed"):
+                    body += (
+                        "\n[AI FILTER NEEDED]\n"
+                        f"Original Criteria: {get('original_criteria', {})}\n"
+                        "Please evaluate if this profile matches the original search criteria.\n"
+                    )
                 
                 formatted_results.append({
                     "href": href,
-                    "body": body + ai_filter_info
+                    "body": body
                 })
             
             logger.info(f"🎯 LinkedIn Sales Navigator search completed: {len(formatted_results)} formatted results")
@@ -1306,17 +1708,8 @@ class LinkedInSalesNavigator:
             
         except Exception as e:
             logger.error(f"LinkedIn Sales Navigator search failed: {e}")
-            import traceback
             logger.error(f"Full error traceback: {traceback.format_exc()}")
             return []
         finally:
-            # Clean up browser
-            if self.driver:
-                try:
-                    self.driver.quit()
-                    logger.info("LinkedIn browser session closed")
-                except Exception as cleanup_error:
-                    logger.warning(f"Error cleaning up browser: {cleanup_error}")
-                finally:
-                    self.driver = None
-                    self.logged_in = False
\ No newline at end of file
+            # Hand the browser back to the pool for the next search
+            self.close()
\ No newline at end of file
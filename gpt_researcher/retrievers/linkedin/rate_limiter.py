@@ -1,126 +1,467 @@
 # Rate Limiter for LinkedIn Scraping
 
-import json
 import time
+import atexit
 import random
 import logging
-from datetime import datetime, timedelta
+import sqlite3
+import threading
+import orjson
+import numpy as np
+from functools import lru_cache
+from dataclasses import dataclass, fields, astuple
+from datetime import date
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between state writes; changes inside the window are deferred
+_FLUSH_INTERVAL = 5.0
+
+# Single-row key/value table holding the serialized state
+_STATE_KEY = "state"
+_CREATE_STATE_TABLE = "CREATE TABLE IF NOT EXISTS state (k TEXT PRIMARY KEY, v BLOB NOT NULL)"
+_SELECT_STATE = "SELECT v FROM state WHERE k = ?"
+_UPSERT_STATE = "INSERT OR REPLACE INTO state (k, v) VALUES (?, ?)"
+
+# Minimum seconds between day/hour rollover checks
+_RESET_CHECK_INTERVAL = 1.0
+
+# Consecutive failure counts with a precomputed backoff factor; higher counts use the last entry
+_BACKOFF_TABLE_SIZE = 32
+
+# Result returned whenever an action is allowed
+_OK = (True, "OK")
+
+# Shared generator and batch size for the buffered get_delay draws
+_rng = np.random.default_rng()
+_DELAY_DRAW_BATCH = 64
+
+# Day and hour lengths for the local-time rollover indices kept in the state file
+_SECONDS_PER_DAY = 86400
+_SECONDS_PER_HOUR = 3600
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Seconds between background sweeps that write deferred state once its window has passed
+_FLUSHER_INTERVAL = 2.0
+
+# Limiters holding state changes not yet written to disk, keyed by state file
+_PENDING_FLUSH: Dict[Path, "RateLimiter"] = {}
+_PENDING_LOCK = threading.Lock()
+_FLUSHER: Optional[threading.Thread] = None
+
+
+def _flush_pending(config_file: Optional[Path] = None, force: bool = True) -> None:
+    """
+    Write deferred state to disk
+    
+    Args:
+        config_file: Only flush the limiter for this state file, None for all of them
+        force: Ignore the debounce window
+    """
+    with _PENDING_LOCK:
+        if config_file is None:
+            limiters = list(_PENDING_FLUSH.values())
+        else:
+            limiters = [_PENDING_FLUSH[config_file]] if config_file in _PENDING_FLUSH else []
+    for limiter in limiters:
+        limiter.save_state(force=force)
+
+
+def _flush_loop() -> None:
+    """Periodically write the latest deferred state, skipping superseded intermediate states"""
+    while True:
+        time.sleep(_FLUSHER_INTERVAL)
+        try:
+            _flush_pending(force=False)
+        except Exception as e:
+            logger.error(f"Error flushing rate limiter state: {e}")
+
+
+def _start_flusher() -> None:
+    """Start the background flusher thread once per process; caller holds _PENDING_LOCK"""
+    global _FLUSHER
+    if _FLUSHER is None:
+        _FLUSHER = threading.Thread(target=_flush_loop, name="linkedin-rate-limit-flush", daemon=True)
+        _FLUSHER.start()
+
+
+atexit.register(_flush_pending)
+
+
+def _local_indices(now: float) -> Tuple[int, int]:
+    """
+    Local calendar day and hour indices for a timestamp, so counters reset at local
+    midnight and on the local hour, as the date-string state of older versions did
+    
+    Args:
+        now: Unix timestamp
+    
+    Returns:
+        Tuple of (days, hours) since the epoch in local time
+    """
+    local = now + time.localtime(now).tm_gmtoff
+    return int(local // _SECONDS_PER_DAY), int(local // _SECONDS_PER_HOUR)
+
+
+@lru_cache(maxsize=1)
+def _random_break(limiter_id: int, near_daily_limit: bool, ttl_hash: int) -> bool:
+    """
+    Randomized break decision, cached per limiter, usage band and second (ttl_hash)
+    
+    Args:
+        limiter_id: id() of the asking limiter
+        near_daily_limit: Whether more than 70% of the daily searches are used
+        ttl_hash: Current whole second, so cached decisions expire each second
+    
+    Returns:
+        True if a break is recommended
+    """
+    # Random break chance to appear more human
+    if random.random() < 0.1:  # 10% chance
+        return True
+    
+    # Break if we're approaching limits
+    return near_daily_limit and random.random() < 0.3  # 30% chance when above 70% usage
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimits:
+    """Immutable LinkedIn rate limits, read as plain attributes on the hot paths"""
+    
+    # Daily limits
+    searches_per_day: int = 15  # Very conservative for Sales Navigator
+    profiles_per_day: int = 30  # LinkedIn typically allows 80-100, but we're being safe
+    connection_requests_per_day: int = 20
+    
+    # Hourly limits
+    searches_per_hour: int = 3
+    profiles_per_hour: int = 10
+    
+    # Timing constraints
+    min_delay_between_searches: float = 45  # seconds
+    max_delay_between_searches: float = 180  # seconds
+    min_delay_between_profiles: float = 5   # seconds
+    max_delay_between_profiles: float = 30   # seconds
+    
+    # Backoff configuration
+    backoff_multiplier: float = 2.0
+    max_backoff: float = 3600  # 1 hour maximum backoff
+    jitter_range: float = 0.2  # 20% jitter
+    
+    # Session limits
+    max_continuous_searches: int = 5  # Force break after 5 continuous searches
+    break_duration_min: float = 300  # 5 minutes minimum break
+    break_duration_max: float = 900  # 15 minutes maximum break
+
+
+@dataclass(slots=True)
+class RateLimiterState:
+    """Persistent rate limiting counters and timestamps, stored as slots rather than dict keys"""
+    
+    daily_searches: int = 0
+    daily_profiles: int = 0
+    daily_connections: int = 0
+    hourly_searches: int = 0
+    hourly_profiles: int = 0
+    last_search_time: float = 0
+    last_profile_time: float = 0
+    last_reset_date: int = 0  # Local day index
+    last_hour_reset: int = 0  # Local hour index
+    consecutive_failures: int = 0
+    total_failures_today: int = 0
+    last_break_time: float = 0
+    continuous_searches: int = 0
+    blocked_until: float = 0  # Timestamp when blocking expires
+
+
+# Field names accepted when loading a state file
+_STATE_FIELDS = frozenset(f.name for f in fields(RateLimiterState))
+
 
 class RateLimiter:
     """
     Implement LinkedIn-specific rate limiting to avoid detection and account suspension
     """
     
-    def __init__(self, config_file: str = "linkedin_rate_limit.json"):
+    def __init__(self, config_file: str = "linkedin_rate_limit.sqlite", limits: Optional[RateLimits] = None):
         """
         Initialize rate limiter with conservative defaults
         
         Args:
-            config_file: Path to JSON file for persistent state storage
+            config_file: Path to the SQLite database for persistent state storage; a JSON
+                state file with the same stem is imported on first use
+            limits: Limits to enforce, None for the conservative defaults
         """
-        self.config_file = Path(config_file)
+        self.config_file = Path(config_file).with_suffix(".sqlite")
         
         # Conservative limits based on LinkedIn's known restrictions
-        self.limits = {
-            # Daily limits
-            "searches_per_day": 15,  # Very conservative for Sales Navigator
-            "profiles_per_day": 30,  # LinkedIn typically allows 80-100, but we're being safe
-            "connection_requests_per_day": 20,
-            
-            # Hourly limits
-            "searches_per_hour": 3,
-            "profiles_per_hour": 10,
-            
-            # Timing constraints
-            "min_delay_between_searches": 45,  # seconds
-            "max_delay_between_searches": 180,  # seconds
-            "min_delay_between_profiles": 5,   # seconds
-            "max_delay_between_profiles": 30,   # seconds
-            
-            # Backoff configuration
-            "backoff_multiplier": 2.0,
-            "max_backoff": 3600,  # 1 hour maximum backoff
-            "jitter_range": 0.2,  # 20% jitter
-            
-            # Session limits
-            "max_continuous_searches": 5,  # Force break after 5 continuous searches
-            "break_duration_min": 300,  # 5 minutes minimum break
-            "break_duration_max": 900,  # 15 minutes maximum break
+        self.limits = limits or RateLimits()
+        
+        # Backoff factor for each consecutive failure count, capped like the delays it scales
+        multiplier = self.limits.backoff_multiplier
+        max_backoff = self.limits.max_backoff
+        self._backoff_table = [min(multiplier ** i, max_backoff) for i in range(_BACKOFF_TABLE_SIZE)]
+        
+        # (min, max, mean, std dev) of the gaussian delay per action type
+        self._delay_params = {
+            action_type: (min_delay, max_delay, (min_delay + max_delay) / 2, (max_delay - min_delay) / 6)
+            for action_type, min_delay, max_delay in (
+                ("search", self.limits.min_delay_between_searches, self.limits.max_delay_between_searches),
+                ("profile", self.limits.min_delay_between_profiles, self.limits.max_delay_between_profiles),
+            )
         }
         
-        # Load or initialize state
+        # Guards state mutations and writes, so the flusher thread never serializes a
+        # half-applied update and concurrent callers don't lose counter increments
+        self._lock = threading.RLock()
+        
+        # Denials whose message only depends on the limits; waits are still formatted per call
+        self._reasons = {
+            "daily_searches": (False, f"Daily search limit reached ({self.limits.searches_per_day} searches)"),
+            "hourly_searches": (False, f"Hourly search limit reached ({self.limits.searches_per_hour} searches)"),
+            "failures_today": (False, "Too many failures today. Please try again tomorrow"),
+            "daily_profiles": (False, f"Daily profile view limit reached ({self.limits.profiles_per_day} profiles)"),
+            "hourly_profiles": (False, f"Hourly profile view limit reached ({self.limits.profiles_per_hour} profiles)"),
+        }
+        
+        # Debounced persistence bookkeeping
+        self._last_flush = 0.0
+        self._flushed_state_hash = None
+        
+        # Rollover check throttle
+        self._last_reset_check = 0.0
+        
+        # Bumped on every state mutation; get_status reuses its result within one second
+        # while the version is unchanged
+        self._state_version = 0
+        self._status_cache_key = None
+        self._status_cache = None
+        
+        # Monotonic time from which a search is allowed, valid for _search_gate_version;
+        # infinite while a counter limit rather than a timer is what blocks searching
+        self._search_gate_version = None
+        self._next_search_allowed_at = 0.0
+        
+        # Buffered (gaussian delay, unit jitter) draws per action type, refilled in batches
+        self._delay_draws = {}
+        
+        # Monotonic times of actions taken through this limiter, keyed by the matching
+        # wall-clock state field; persisted wall times cover actions from other limiters
+        self._mono_marks = {}
+        
+        # Load or initialize state, picking up any write another limiter still holds back
+        _flush_pending(self.config_file)
+        self._db = self._open_db()
         self.state = self.load_state()
         
         # Track session information
         self.session_start = time.time()
         self.continuous_actions = 0
     
-    def load_state(self) -> dict:
-        """Load rate limiting state from persistent storage"""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    state = json.load(f)
-                    logger.info(f"Loaded rate limiter state: {state['daily_searches']} searches today")
-                    return state
-            except Exception as e:
-                logger.error(f"Error loading rate limiter state: {e}")
+    def _open_db(self) -> Optional[sqlite3.Connection]:
+        """
+        Open the state database in WAL mode, so writes are atomic and other processes
+        can read while this one writes
+        
+        Returns:
+            Autocommit connection, or None to keep state in memory only
+        """
+        try:
+            # Shared with the background flusher thread; writes are serialized by self._lock
+            db = sqlite3.connect(self.config_file, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(_CREATE_STATE_TABLE)
+            return db
+        except sqlite3.Error as e:
+            logger.error(f"Error opening rate limiter database {self.config_file}: {e}")
+            return None
+    
+    def close(self) -> None:
+        """Write any deferred state and close the state database"""
+        with self._lock:
+            self._save_state(force=True)
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+    
+    def load_state(self) -> RateLimiterState:
+        """Load rate limiting state from persistent storage, failing closed if it is unreadable"""
+        legacy_file = self.config_file.with_suffix(".json")
+        try:
+            row = self._db.execute(_SELECT_STATE, (_STATE_KEY,)).fetchone() if self._db else None
+            if row is not None:
+                data = orjson.loads(row[0])
+                imported = False
+            elif legacy_file.exists():
+                data = orjson.loads(legacy_file.read_bytes())
+                self._migrate_legacy_state(data)
+                imported = True
+                logger.info(f"Importing rate limiter state from {legacy_file}")
+            else:
+                data = None
+            
+            if data is not None:
+                state = RateLimiterState(**{k: v for k, v in data.items() if k in _STATE_FIELDS})
+                logger.info(f"Loaded rate limiter state: {state.daily_searches} searches today")
+                if not imported:
+                    self._flushed_state_hash = hash(astuple(state))
+                return state
+        except Exception as e:
+            # Unreadable counters may hide a spent quota, so fail closed until the next reset
+            logger.error(f"Error loading rate limiter state, blocking until the next daily reset: {e}")
+            today, this_hour = _local_indices(time.time())
+            return RateLimiterState(
+                daily_searches=self.limits.searches_per_day,
+                daily_profiles=self.limits.profiles_per_day,
+                hourly_searches=self.limits.searches_per_hour,
+                hourly_profiles=self.limits.profiles_per_hour,
+                last_reset_date=today,
+                last_hour_reset=this_hour,
+            )
         
         # Default state
-        return {
-            "daily_searches": 0,
-            "daily_profiles": 0,
-            "daily_connections": 0,
-            "hourly_searches": 0,
-            "hourly_profiles": 0,
-            "last_search_time": 0,
-            "last_profile_time": 0,
-            "last_reset_date": str(datetime.now().date()),
-            "last_hour_reset": datetime.now().hour,
-            "consecutive_failures": 0,
-            "total_failures_today": 0,
-            "last_break_time": 0,
-            "continuous_searches": 0,
-            "blocked_until": 0,  # Timestamp when blocking expires
-        }
+        today, this_hour = _local_indices(time.time())
+        return RateLimiterState(last_reset_date=today, last_hour_reset=this_hour)
     
-    def save_state(self) -> None:
-        """Save rate limiting state to persistent storage"""
+    @staticmethod
+    def _migrate_legacy_state(data: dict) -> bool:
+        """
+        Convert the local ISO date and hour-of-day written by older versions into local
+        day and hour indices, so upgrading doesn't trigger a spurious counter reset
+        
+        Args:
+            data: Raw state loaded from disk, updated in place
+        
+        Returns:
+            True if the state was converted and needs rewriting
+        """
+        if not isinstance(data.get("last_reset_date"), str):
+            return False
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.state, f, indent=2)
+            day = date.fromisoformat(data["last_reset_date"]).toordinal() - _EPOCH_ORDINAL
+            data["last_reset_date"] = day
+            data["last_hour_reset"] = day * 24 + int(data.get("last_hour_reset", 0))
+        except (ValueError, TypeError):
+            # Keep the counters for the current day and hour rather than resetting them
+            logger.warning(f"Unreadable reset date {data['last_reset_date']!r} in legacy rate limiter state")
+            data["last_reset_date"], data["last_hour_reset"] = _local_indices(time.time())
+        return True
+    
+    def save_state(self, force: bool = False) -> None:
+        """
+        Save rate limiting state to persistent storage
+        
+        Unchanged state is never rewritten, and changes made within _FLUSH_INTERVAL of
+        the last write are deferred to the background flusher, a later save or interpreter exit
+        
+        Args:
+            force: Write now even if the last write was recent
+        """
+        with self._lock:
+            self._save_state(force)
+    
+    def _save_state(self, force: bool) -> None:
+        """Body of save_state, run under the state lock"""
+        if self._db is None:
+            return
+        
+        state_hash = hash(astuple(self.state))
+        if state_hash == self._flushed_state_hash:
+            self._clear_pending()
+            return
+        
+        if not force and time.monotonic() - self._last_flush < _FLUSH_INTERVAL:
+            with _PENDING_LOCK:
+                _PENDING_FLUSH[self.config_file] = self
+                _start_flusher()
+            return
+        
+        try:
+            self._db.execute(_UPSERT_STATE, (_STATE_KEY, orjson.dumps(self.state)))
+            self._last_flush = time.monotonic()
+            self._flushed_state_hash = state_hash
+            self._clear_pending()
             logger.debug("Rate limiter state saved")
-        except Exception as e:
+        except sqlite3.Error as e:
             logger.error(f"Error saving rate limiter state: {e}")
     
+    def _maybe_flush(self, urgent: bool = False) -> None:
+        """
+        Persist state after a mutation, batching routine updates into the debounce window
+        
+        Args:
+            urgent: Write immediately, e.g. after a failure or block
+        """
+        self._state_version += 1
+        self.save_state(force=urgent)
+    
+    def _clear_pending(self) -> None:
+        """Drop this limiter from the deferred flush registry"""
+        with _PENDING_LOCK:
+            if _PENDING_FLUSH.get(self.config_file) is self:
+                del _PENDING_FLUSH[self.config_file]
+    
     def reset_if_needed(self) -> None:
-        """Reset counters if new day or hour"""
-        now = datetime.now()
-        
-        # Daily reset (LinkedIn resets at midnight PST)
-        if str(now.date()) != self.state["last_reset_date"]:
-            logger.info("Daily limit reset - new day started")
-            self.state["daily_searches"] = 0
-            self.state["daily_profiles"] = 0
-            self.state["daily_connections"] = 0
-            self.state["total_failures_today"] = 0
-            self.state["last_reset_date"] = str(now.date())
-            self.state["consecutive_failures"] = max(0, self.state["consecutive_failures"] - 1)
-            self.continuous_actions = 0
+        """Reset counters if new day or hour, checking at most once per second"""
+        mono = time.monotonic()
+        if mono - self._last_reset_check < _RESET_CHECK_INTERVAL:
+            return
+        self._last_reset_check = mono
+        
+        with self._lock:
+            today, this_hour = _local_indices(time.time())
+            dirty = False
+            
+            # Daily reset at local midnight
+            if today != self.state.last_reset_date:
+                logger.info("Daily limit reset - new day started")
+                self.state.daily_searches = 0
+                self.state.daily_profiles = 0
+                self.state.daily_connections = 0
+                self.state.total_failures_today = 0
+                self.state.last_reset_date = today
+                self.state.consecutive_failures = max(0, self.state.consecutive_failures - 1)
+                self.continuous_actions = 0
+                dirty = True
+            
+            # Hourly reset
+            if this_hour != self.state.last_hour_reset:
+                logger.debug("Hourly limit reset")
+                self.state.hourly_searches = 0
+                self.state.hourly_profiles = 0
+                self.state.last_hour_reset = this_hour
+                dirty = True
+            
+            # Nothing rolled over in the steady state, so there is nothing to persist
+            if dirty:
+                self._maybe_flush()
+    
+    def _mark(self, key: str) -> None:
+        """
+        Record that an action happens now
+        
+        Args:
+            key: Wall-clock state field for the action, e.g. "last_search_time"
+        """
+        setattr(self.state, key, time.time())
+        self._mono_marks[key] = time.monotonic()
+    
+    def _elapsed_since(self, key: str) -> float:
+        """
+        Seconds since an action, immune to wall-clock jumps when this limiter recorded it
         
-        # Hourly reset
-        if now.hour != self.state["last_hour_reset"]:
-            logger.debug("Hourly limit reset")
-            self.state["hourly_searches"] = 0
-            self.state["hourly_profiles"] = 0
-            self.state["last_hour_reset"] = now.hour
+        Args:
+            key: Wall-clock state field for the action
         
-        self.save_state()
+        Returns:
+            Elapsed seconds
+        """
+        mono = self._mono_marks.get(key)
+        if mono is not None:
+            return time.monotonic() - mono
+        return time.time() - getattr(self.state, key)
     
     def can_search(self) -> Tuple[bool, str]:
         """
@@ -131,53 +472,118 @@ class RateLimiter:
         """
         self.reset_if_needed()
         
-        # Check if we're temporarily blocked
-        if self.state["blocked_until"] > time.time():
-            wait_time = self.state["blocked_until"] - time.time()
-            return False, f"Temporarily blocked for {wait_time:.0f} seconds due to failures"
-        
-        # Check daily limit
-        if self.state["daily_searches"] >= self.limits["searches_per_day"]:
-            return False, f"Daily search limit reached ({self.limits['searches_per_day']} searches)"
-        
-        # Check hourly limit
-        if self.state["hourly_searches"] >= self.limits["searches_per_hour"]:
-            return False, f"Hourly search limit reached ({self.limits['searches_per_hour']} searches)"
-        
-        # Check if we need a break
-        if self.state["continuous_searches"] >= self.limits["max_continuous_searches"]:
-            time_since_break = time.time() - self.state["last_break_time"]
-            required_break = random.uniform(
-                self.limits["break_duration_min"],
-                self.limits["break_duration_max"]
-            )
+        # Fast path: nothing has changed since the gates were last evaluated and every timer
+        # has expired, so the checks below would all pass
+        if self._search_gate_version != self._state_version:
+            with self._lock:
+                self._recompute_next_allowed()
+        if time.monotonic() >= self._next_search_allowed_at:
+            return _OK
+        
+        with self._lock:
+            limits = self.limits
+            state = self.state
             
-            if time_since_break < required_break:
-                wait_time = required_break - time_since_break
-                return False, f"Break required. Please wait {wait_time:.0f} seconds"
-            else:
-                # Break completed, reset counter
-                self.state["continuous_searches"] = 0
-                self.state["last_break_time"] = time.time()
-        
-        # Check minimum delay between searches
-        time_since_last = time.time() - self.state["last_search_time"]
-        min_delay = self.limits["min_delay_between_searches"]
-        
-        # Apply exponential backoff if we have failures
-        if self.state["consecutive_failures"] > 0:
-            backoff_factor = self.limits["backoff_multiplier"] ** self.state["consecutive_failures"]
-            min_delay = min(min_delay * backoff_factor, self.limits["max_backoff"])
-        
-        if time_since_last < min_delay:
-            wait_time = min_delay - time_since_last
-            return False, f"Please wait {wait_time:.0f} seconds before next search"
+            # Check if we're temporarily blocked
+            if state.blocked_until > time.time():
+                wait_time = state.blocked_until - time.time()
+                return False, f"Temporarily blocked for {wait_time:.0f} seconds due to failures"
+            
+            # Check daily limit
+            if state.daily_searches >= limits.searches_per_day:
+                return self._reasons["daily_searches"]
+            
+            # Check hourly limit
+            if state.hourly_searches >= limits.searches_per_hour:
+                return self._reasons["hourly_searches"]
+            
+            # Check if we need a break
+            if state.continuous_searches >= limits.max_continuous_searches:
+                time_since_break = self._elapsed_since("last_break_time")
+                required_break = random.uniform(
+                    limits.break_duration_min,
+                    limits.break_duration_max
+                )
+                
+                if time_since_break < required_break:
+                    wait_time = required_break - time_since_break
+                    return False, f"Break required. Please wait {wait_time:.0f} seconds"
+                else:
+                    # Break completed, reset counter
+                    state.continuous_searches = 0
+                    self._mark("last_break_time")
+                    self._state_version += 1
+            
+            # Check minimum delay between searches
+            time_since_last = self._elapsed_since("last_search_time")
+            min_delay = limits.min_delay_between_searches
+            
+            # Apply exponential backoff if we have failures
+            if state.consecutive_failures > 0:
+                backoff_factor = self._backoff_table[min(state.consecutive_failures, _BACKOFF_TABLE_SIZE - 1)]
+                min_delay = min(min_delay * backoff_factor, limits.max_backoff)
+            
+            if time_since_last < min_delay:
+                wait_time = min_delay - time_since_last
+                return False, f"Please wait {wait_time:.0f} seconds before next search"
+            
+            # Check if we have too many failures
+            if state.total_failures_today >= 10:
+                return self._reasons["failures_today"]
+            
+            return _OK
+    
+    def reserve_search(self) -> Tuple[bool, str]:
+        """
+        Check and record a search in one step, so concurrent callers can't all pass the
+        check before any of them has recorded
         
-        # Check if we have too many failures
-        if self.state["total_failures_today"] >= 10:
-            return False, "Too many failures today. Please try again tomorrow"
+        Returns:
+            Tuple of (reserved: bool, reason: str)
+        """
+        with self._lock:
+            allowed = self.can_search()
+            if allowed[0]:
+                self.record_search(success=True)
+            return allowed
+    
+    def seconds_until_search(self) -> float:
+        """
+        Seconds until the search timers allow the next search
         
-        return True, "OK"
+        Returns:
+            Seconds to wait, 0 if a search is allowed now, infinity while a counter limit blocks
+        """
+        self.reset_if_needed()
+        with self._lock:
+            if self._search_gate_version != self._state_version:
+                self._recompute_next_allowed()
+            return max(0.0, self._next_search_allowed_at - time.monotonic())
+    
+    def _recompute_next_allowed(self) -> None:
+        """Fold the search gates into the single monotonic time checked by can_search"""
+        limits = self.limits
+        state = self.state
+        self._search_gate_version = self._state_version
+        
+        if (state.daily_searches >= limits.searches_per_day
+                or state.hourly_searches >= limits.searches_per_hour
+                or state.continuous_searches >= limits.max_continuous_searches
+                or state.total_failures_today >= 10):
+            self._next_search_allowed_at = float("inf")
+            return
+        
+        min_delay = limits.min_delay_between_searches
+        if state.consecutive_failures > 0:
+            backoff_factor = self._backoff_table[min(state.consecutive_failures, _BACKOFF_TABLE_SIZE - 1)]
+            min_delay = min(min_delay * backoff_factor, limits.max_backoff)
+        
+        wait = max(
+            state.blocked_until - time.time(),
+            min_delay - self._elapsed_since("last_search_time"),
+            0.0
+        )
+        self._next_search_allowed_at = time.monotonic() + wait
     
     def can_view_profile(self) -> Tuple[bool, str]:
         """
@@ -186,25 +592,27 @@ class RateLimiter:
         Returns:
             Tuple of (can_view: bool, reason: str)
         """
+        limits = self.limits
+        state = self.state
         self.reset_if_needed()
         
         # Check daily limit
-        if self.state["daily_profiles"] >= self.limits["profiles_per_day"]:
-            return False, f"Daily profile view limit reached ({self.limits['profiles_per_day']} profiles)"
+        if state.daily_profiles >= limits.profiles_per_day:
+            return self._reasons["daily_profiles"]
         
         # Check hourly limit
-        if self.state["hourly_profiles"] >= self.limits["profiles_per_hour"]:
-            return False, f"Hourly profile view limit reached ({self.limits['profiles_per_hour']} profiles)"
+        if state.hourly_profiles >= limits.profiles_per_hour:
+            return self._reasons["hourly_profiles"]
         
         # Check minimum delay
-        time_since_last = time.time() - self.state["last_profile_time"]
-        min_delay = self.limits["min_delay_between_profiles"]
+        time_since_last = self._elapsed_since("last_profile_time")
+        min_delay = limits.min_delay_between_profiles
         
         if time_since_last < min_delay:
             wait_time = min_delay - time_since_last
             return False, f"Please wait {wait_time:.0f} seconds before next profile view"
         
-        return True, "OK"
+        return _OK
     
     def record_search(self, success: bool = True) -> None:
         """
@@ -213,28 +621,32 @@ class RateLimiter:
         Args:
             success: Whether the search was successful
         """
-        self.state["daily_searches"] += 1
-        self.state["hourly_searches"] += 1
-        self.state["last_search_time"] = time.time()
-        self.state["continuous_searches"] += 1
-        
-        if success:
-            self.state["consecutive_failures"] = 0
-            logger.info(f"Search recorded: {self.state['daily_searches']}/{self.limits['searches_per_day']} daily")
-        else:
-            self.state["consecutive_failures"] += 1
-            self.state["total_failures_today"] += 1
+        with self._lock:
+            limits = self.limits
+            state = self.state
+            state.daily_searches += 1
+            state.hourly_searches += 1
+            self._mark("last_search_time")
+            state.continuous_searches += 1
             
-            # Apply temporary block if too many consecutive failures
-            if self.state["consecutive_failures"] >= 3:
-                block_duration = min(
-                    300 * (2 ** (self.state["consecutive_failures"] - 3)),
-                    3600
-                )
-                self.state["blocked_until"] = time.time() + block_duration
-                logger.warning(f"Too many failures. Blocking for {block_duration} seconds")
-        
-        self.save_state()
+            if success:
+                state.consecutive_failures = 0
+                logger.info(f"Search recorded: {state.daily_searches}/{limits.searches_per_day} daily")
+            else:
+                state.consecutive_failures += 1
+                state.total_failures_today += 1
+                
+                # Apply temporary block if too many consecutive failures
+                if state.consecutive_failures >= 3:
+                    block_duration = min(
+                        300 * (2 ** (state.consecutive_failures - 3)),
+                        3600
+                    )
+                    state.blocked_until = time.time() + block_duration
+                    logger.warning(f"Too many failures. Blocking for {block_duration} seconds")
+            
+            # Failures and blocks must survive a crash; plain counter bumps can wait
+            self._maybe_flush(urgent=not success)
     
     def record_profile_view(self, success: bool = True) -> None:
         """
@@ -243,15 +655,18 @@ class RateLimiter:
         Args:
             success: Whether the profile view was successful
         """
-        self.state["daily_profiles"] += 1
-        self.state["hourly_profiles"] += 1
-        self.state["last_profile_time"] = time.time()
-        
-        if not success:
-            self.state["total_failures_today"] += 1
-        
-        logger.debug(f"Profile view recorded: {self.state['daily_profiles']}/{self.limits['profiles_per_day']} daily")
-        self.save_state()
+        with self._lock:
+            limits = self.limits
+            state = self.state
+            state.daily_profiles += 1
+            state.hourly_profiles += 1
+            self._mark("last_profile_time")
+            
+            if not success:
+                state.total_failures_today += 1
+            
+            logger.debug(f"Profile view recorded: {state.daily_profiles}/{limits.profiles_per_day} daily")
+            self._maybe_flush(urgent=not success)
     
     def get_delay(self, action_type: str = "search") -> float:
         """
@@ -263,31 +678,33 @@ class RateLimiter:
         Returns:
             Delay in seconds
         """
-        if action_type == "search":
-            min_delay = self.limits["min_delay_between_searches"]
-            max_delay = self.limits["max_delay_between_searches"]
-        else:
-            min_delay = self.limits["min_delay_between_profiles"]
-            max_delay = self.limits["max_delay_between_profiles"]
+        limits = self.limits
+        state = self.state
+        min_delay, max_delay, mean, std_dev = self._delay_params.get(action_type) or self._delay_params["profile"]
         
         # Base delay with normal distribution
-        mean = (min_delay + max_delay) / 2
-        std_dev = (max_delay - min_delay) / 6
-        base_delay = random.gauss(mean, std_dev)
+        draw = next(self._delay_draws.get(action_type, iter(())), None)
+        if draw is None:
+            draws = zip(
+                _rng.normal(mean, std_dev, _DELAY_DRAW_BATCH).tolist(),
+                _rng.uniform(-1.0, 1.0, _DELAY_DRAW_BATCH).tolist()
+            )
+            self._delay_draws[action_type] = draws
+            draw = next(draws)
+        base_delay, unit_jitter = draw
         base_delay = max(min_delay, min(max_delay, base_delay))
         
         # Add jitter
-        jitter_amount = base_delay * self.limits["jitter_range"]
-        jitter = random.uniform(-jitter_amount, jitter_amount)
+        jitter = base_delay * limits.jitter_range * unit_jitter
         
         # Apply exponential backoff if needed
-        if self.state["consecutive_failures"] > 0:
-            backoff_factor = self.limits["backoff_multiplier"] ** self.state["consecutive_failures"]
-            base_delay = min(base_delay * backoff_factor, self.limits["max_backoff"])
+        if state.consecutive_failures > 0:
+            backoff_factor = self._backoff_table[min(state.consecutive_failures, _BACKOFF_TABLE_SIZE - 1)]
+            base_delay = min(base_delay * backoff_factor, limits.max_backoff)
         
         final_delay = max(min_delay, base_delay + jitter)
         
-        logger.debug(f"Calculated delay: {final_delay:.1f} seconds (failures: {self.state['consecutive_failures']})")
+        logger.debug(f"Calculated delay: {final_delay:.1f} seconds (failures: {state.consecutive_failures})")
         return final_delay
     
     def should_take_break(self) -> bool:
@@ -297,20 +714,16 @@ class RateLimiter:
         Returns:
             True if break is recommended
         """
-        # Check continuous actions
-        if self.state["continuous_searches"] >= self.limits["max_continuous_searches"]:
-            return True
-        
-        # Random break chance to appear more human
-        if random.random() < 0.1:  # 10% chance
-            return True
+        limits = self.limits
+        state = self.state
         
-        # Break if we're approaching limits
-        daily_usage = self.state["daily_searches"] / self.limits["searches_per_day"]
-        if daily_usage > 0.7 and random.random() < 0.3:  # 30% chance when above 70% usage
+        # Check continuous actions
+        if state.continuous_searches >= limits.max_continuous_searches:
             return True
         
-        return False
+        # Randomized part, drawn once per second so repeated polls agree
+        daily_usage = state.daily_searches / limits.searches_per_day
+        return _random_break(id(self), daily_usage > 0.7, int(time.time()))
     
     def get_break_duration(self) -> float:
         """
@@ -320,13 +733,13 @@ class RateLimiter:
             Break duration in seconds
         """
         base_duration = random.uniform(
-            self.limits["break_duration_min"],
-            self.limits["break_duration_max"]
+            self.limits.break_duration_min,
+            self.limits.break_duration_max
         )
         
         # Longer break if we have failures
-        if self.state["consecutive_failures"] > 0:
-            base_duration *= (1 + 0.5 * self.state["consecutive_failures"])
+        if self.state.consecutive_failures > 0:
+            base_duration *= (1 + 0.5 * self.state.consecutive_failures)
         
         return base_duration
     
@@ -337,39 +750,72 @@ class RateLimiter:
         Returns:
             Dictionary with current limits and usage
         """
+        limits = self.limits
+        state = self.state
         self.reset_if_needed()
         
-        return {
+        cache_key = (self._state_version, int(time.time()))
+        if cache_key == self._status_cache_key:
+            return self._status_cache
+        
+        self._status_cache = {
             "daily": {
-                "searches": f"{self.state['daily_searches']}/{self.limits['searches_per_day']}",
-                "profiles": f"{self.state['daily_profiles']}/{self.limits['profiles_per_day']}",
-                "remaining_searches": self.limits["searches_per_day"] - self.state["daily_searches"],
-                "remaining_profiles": self.limits["profiles_per_day"] - self.state["daily_profiles"],
+                "searches": f"{state.daily_searches}/{limits.searches_per_day}",
+                "profiles": f"{state.daily_profiles}/{limits.profiles_per_day}",
+                "remaining_searches": limits.searches_per_day - state.daily_searches,
+                "remaining_profiles": limits.profiles_per_day - state.daily_profiles,
             },
             "hourly": {
-                "searches": f"{self.state['hourly_searches']}/{self.limits['searches_per_hour']}",
-                "profiles": f"{self.state['hourly_profiles']}/{self.limits['profiles_per_hour']}",
+                "searches": f"{state.hourly_searches}/{limits.searches_per_hour}",
+                "profiles": f"{state.hourly_profiles}/{limits.profiles_per_hour}",
             },
             "failures": {
-                "consecutive": self.state["consecutive_failures"],
-                "total_today": self.state["total_failures_today"],
+                "consecutive": state.consecutive_failures,
+                "total_today": state.total_failures_today,
             },
-            "blocked": self.state["blocked_until"] > time.time(),
-            "continuous_searches": self.state["continuous_searches"],
+            "blocked": state.blocked_until > time.time(),
+            "continuous_searches": state.continuous_searches,
             "should_break": self.should_take_break()
         }
+        self._status_cache_key = cache_key
+        return self._status_cache
     
     def reset_session(self) -> None:
         """Reset session-specific counters"""
-        self.state["continuous_searches"] = 0
-        self.state["last_break_time"] = time.time()
-        self.continuous_actions = 0
-        self.save_state()
-        logger.info("Session counters reset")
+        with self._lock:
+            self.state.continuous_searches = 0
+            self._mark("last_break_time")
+            self.continuous_actions = 0
+            self._maybe_flush()
+            logger.info("Session counters reset")
     
     def emergency_stop(self) -> None:
         """Emergency stop - block all actions for extended period"""
-        self.state["blocked_until"] = time.time() + 3600  # Block for 1 hour
-        self.state["consecutive_failures"] = 5  # Set high failure count
-        self.save_state()
-        logger.warning("Emergency stop activated - blocking for 1 hour")
\ No newline at end of file
+        with self._lock:
+            self.state.blocked_until = time.time() + 3600  # Block for 1 hour
+            self.state.consecutive_failures = 5  # Set high failure count
+            self._maybe_flush(urgent=True)
+            logger.warning("Emergency stop activated - blocking for 1 hour")
+
+
+# Process-wide limiters keyed by state file, so every caller checks and records against one set of counters
+_SHARED_LIMITERS: Dict[Path, RateLimiter] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def get_rate_limiter(config_file: str = "linkedin_rate_limit.sqlite") -> RateLimiter:
+    """
+    Return the process-wide rate limiter for a state file, creating it on first use
+    
+    Args:
+        config_file: Path to the state database, as for RateLimiter
+    
+    Returns:
+        The shared limiter
+    """
+    key = Path(config_file).with_suffix(".sqlite").resolve()
+    with _SHARED_LOCK:
+        limiter = _SHARED_LIMITERS.get(key)
+        if limiter is None:
+            limiter = _SHARED_LIMITERS[key] = RateLimiter(config_file)
+        return limiter
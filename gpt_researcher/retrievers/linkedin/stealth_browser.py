@@ -1,24 +1,468 @@
 # LinkedIn Stealth Browser with Anti-Detection Measures
 
+import re
+import json
 import random
 import time
 import logging
-from typing import Optional
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+import copy
+import functools
+import hashlib
+import tempfile
+import threading
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 import os
 import platform
+import shutil
+
+try:
+    import fcntl
+except ImportError:  # Windows: profile slots are only coordinated within this process
+    fcntl = None
+
+# Selenium is imported where a browser is built, keeping the package cheap to import
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
 
 logger = logging.getLogger(__name__)
 
+# Static resources refused at the network layer; scraping only needs the DOM
+_BLOCKED_RESOURCE_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp",
+    "*.woff", "*.woff2", "*.ttf",
+    "*.mp4",
+)
+_BLOCKED_STYLESHEET_PATTERNS = ("*.css",)
+
+# Container detection and the system chromedriver can't change while the process runs.
+# Production containers should pin CHROMEDRIVER_PATH; otherwise chromedriver is looked up on PATH
+_IN_DOCKER = os.path.exists('/.dockerenv') or bool(os.environ.get('DOCKER_CONTAINER'))
+_SYSTEM_CHROMEDRIVER = os.environ.get('CHROMEDRIVER_PATH') or shutil.which('chromedriver')
+
+# Launch arguments shared by every enhanced browser
+_DEFAULT_ARGS = (
+    # Anti-detection
+    "--disable-blink-features=AutomationControlled",
+    # Additional stealth options
+    "--disable-web-security",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-ipc-flooding-protection",
+    # Memory optimizations
+    "--memory-pressure-off",
+    "--max_old_space_size=4096",
+)
+
+# Chrome honours only the last --disable-features switch, so features are joined into one
+_DISABLED_FEATURES = ("VizDisplayCompositor", "TranslateUI")
+
+# Container arguments for both launch paths; headless mode is requested separately per path.
+# Headless Chrome renders without an X server, so no display is passed or started
+_DOCKER_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+)
+_GPU_ARGS = ("--disable-gpu", "--disable-software-rasterizer")
+
+# Opt-in: chrome-headless-shell starts faster and uses less memory than full Chrome in
+# headless mode, but cannot take full-page screenshots. It has no GPU stack to disable
+_USE_HEADLESS_SHELL = os.environ.get('STEALTH_HEADLESS_SHELL') == '1'
+_HEADLESS_SHELL_PATHS = ("/usr/bin/chrome-headless-shell", "/usr/local/bin/chrome-headless-shell")
+_HEADLESS_SHELL_DISABLED_FEATURES = ("Translate", "BackForwardCache")
+
+# Only settings that differ from Chrome's defaults
+_CHROME_PREFS = {
+    "credentials_enable_service": False,
+    "profile.password_manager_enabled": False,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.managed_default_content_settings.plugins": 2,
+    "profile.managed_default_content_settings.popups": 2,
+    "profile.managed_default_content_settings.geolocation": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+    "webrtc.ip_handling_policy": "disable_non_proxied_udp",
+    "webrtc.multiple_routes_enabled": False,
+    "webrtc.nonproxied_udp_enabled": False
+}
+
+# Persistent Chrome profiles keep the HTTP cache, DNS and TLS sessions warm across launches.
+# Chrome locks a profile while running, so every live browser claims its own numbered slot;
+# set LINKEDIN_PERSISTENT_PROFILE=0 to launch with throwaway profiles instead
+_PROFILE_ROOT = os.environ.get('LINKEDIN_PROFILE_DIR') or os.path.join(tempfile.gettempdir(), 'lnk_stealth_profile')
+_DISK_CACHE_SIZE = 200 * 1024 * 1024
+_PROFILE_LOCK = threading.Lock()
+_PROFILE_SLOTS: Dict[int, object] = {}  # slot -> open lock file held while the browser runs
+
+# Pages that have not loaded by then rarely finish at all; no implicit wait is set, so a
+# missing element fails immediately and callers wait explicitly via wait_for
+_PAGE_LOAD_TIMEOUT = 15
+
+# driver.get returns at DOMContentLoaded instead of waiting out LinkedIn's analytics and
+# tracking requests; callers already wait explicitly for the elements they scrape
+_PAGE_LOAD_STRATEGY = 'eager'
+
+
+def _claim_profile_dir() -> Optional[tuple]:
+    """
+    Claim the lowest profile slot not used by this or another process
+    
+    Returns:
+        (slot, profile directory), or None if persistent profiles are disabled or unavailable
+    """
+    if os.environ.get('LINKEDIN_PERSISTENT_PROFILE') == '0':
+        return None
+    
+    with _PROFILE_LOCK:
+        slot = 0
+        while True:
+            if slot not in _PROFILE_SLOTS:
+                profile_dir = os.path.join(_PROFILE_ROOT, f"profile_{slot}")
+                try:
+                    os.makedirs(profile_dir, exist_ok=True)
+                    handle = open(f"{profile_dir}.lock", "w")
+                except OSError as e:
+                    logger.warning(f"Persistent browser profile unavailable: {e}")
+                    return None
+                try:
+                    if fcntl:
+                        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    # Held by a browser in another process
+                    handle.close()
+                    slot += 1
+                    continue
+                _PROFILE_SLOTS[slot] = handle
+                return slot, profile_dir
+            slot += 1
+
+
+def _release_profile_dir(slot: Optional[int]) -> None:
+    """Give a profile slot back once its browser has quit"""
+    with _PROFILE_LOCK:
+        handle = _PROFILE_SLOTS.pop(slot, None)
+    if handle:
+        handle.close()
+
+
+# Init script that hides automation tells, injected into every new document
+_STEALTH_JS_SOURCE = """
+// Scoped so no helper binding leaks into, or collides with, the page's globals
+(() => {
+    // Remove webdriver property
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+
+    // Mock plugins
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [
+            {
+                0: {type: "application/x-google-chrome-pdf", suffixes: "pdf"},
+                description: "Portable Document Format",
+                filename: "internal-pdf-viewer",
+                length: 1,
+                name: "Chrome PDF Plugin"
+            },
+            {
+                0: {type: "application/pdf", suffixes: "pdf"},
+                description: "Portable Document Format",
+                filename: "mhjfbmdgcfjbbpaeojofohoefgiehjai",
+                length: 1,
+                name: "Chrome PDF Viewer"
+            },
+            {
+                0: {type: "application/x-nacl", suffixes: ""},
+                1: {type: "application/x-pnacl", suffixes: ""},
+                description: "Native Client Executable",
+                filename: "internal-nacl-plugin",
+                length: 2,
+                name: "Native Client"
+            }
+        ]
+    });
+
+    // Mock vendor
+    Object.defineProperty(navigator, 'vendor', {
+        get: () => 'Google Inc.'
+    });
+
+    // Mock hardware concurrency
+    Object.defineProperty(navigator, 'hardwareConcurrency', {
+        get: () => 8
+    });
+
+    // Mock connection
+    Object.defineProperty(navigator, 'connection', {
+        get: () => ({
+            rtt: 100,
+            downlink: 10,
+            effectiveType: '4g',
+            saveData: false
+        })
+    });
+
+    // Chrome specific
+    window.chrome = {
+        app: {
+            isInstalled: false,
+            InstallState: {
+                DISABLED: 'disabled',
+                INSTALLED: 'installed',
+                NOT_INSTALLED: 'not_installed'
+            },
+            RunningState: {
+                CANNOT_RUN: 'cannot_run',
+                READY_TO_RUN: 'ready_to_run',
+                RUNNING: 'running'
+            }
+        },
+        runtime: {
+            OnInstalledReason: {
+                CHROME_UPDATE: 'chrome_update',
+                INSTALL: 'install',
+                SHARED_MODULE_UPDATE: 'shared_module_update',
+                UPDATE: 'update'
+            },
+            OnRestartRequiredReason: {
+                APP_UPDATE: 'app_update',
+                OS_UPDATE: 'os_update',
+                PERIODIC: 'periodic'
+            },
+            PlatformArch: {
+                ARM: 'arm',
+                ARM64: 'arm64',
+                MIPS: 'mips',
+                MIPS64: 'mips64',
+                X86_32: 'x86-32',
+                X86_64: 'x86-64'
+            },
+            PlatformNaclArch: {
+                ARM: 'arm',
+                MIPS: 'mips',
+                MIPS64: 'mips64',
+                X86_32: 'x86-32',
+                X86_64: 'x86-64'
+            },
+            PlatformOs: {
+                ANDROID: 'android',
+                CROS: 'cros',
+                LINUX: 'linux',
+                MAC: 'mac',
+                OPENBSD: 'openbsd',
+                WIN: 'win'
+            },
+            RequestUpdateCheckStatus: {
+                NO_UPDATE: 'no_update',
+                THROTTLED: 'throttled',
+                UPDATE_AVAILABLE: 'update_available'
+            }
+        }
+    };
+
+    // WebGL vendor and renderer (UNMASKED_VENDOR_WEBGL / UNMASKED_RENDERER_WEBGL)
+    for (const context of [WebGLRenderingContext, window.WebGL2RenderingContext]) {
+        if (!context) continue;
+        const getParameter = context.prototype.getParameter;
+        context.prototype.getParameter = function (parameter) {
+            if (parameter === 37445) return 'Intel Inc.';
+            if (parameter === 37446) return 'Intel Iris OpenGL Engine';
+            return getParameter.call(this, parameter);
+        };
+    }
+
+    // Headless Chrome reports a zero-height hairline for Modernizr's probe element
+    const offsetHeight = Object.getOwnPropertyDescriptor(HTMLElement.prototype, 'offsetHeight');
+    Object.defineProperty(HTMLDivElement.prototype, 'offsetHeight', {
+        ...offsetHeight,
+        get: function () {
+            if (this.id === 'modernizr') return 1;
+            return offsetHeight.get.apply(this);
+        }
+    });
+
+    // Permissions
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+})();
+"""
+
+# Identity overrides appended to the init script, so no separate Network.setUserAgentOverride is needed
+_IDENTITY_JS_SOURCE = """
+// Scoped like _STEALTH_JS_SOURCE so its bindings stay off the page's globals
+(() => {
+    // Languages and platform matching the launch flags
+    Object.defineProperty(navigator, 'languages', { get: () => __LANGUAGES__ });
+    Object.defineProperty(navigator, 'platform', { get: () => __NAV_PLATFORM__ });
+
+    // User agent, kept consistent across navigator and client hints
+    const uaBrands = [
+        { brand: 'Not_A Brand', version: '8' },
+        { brand: 'Chromium', version: __UA_MAJOR__ },
+        { brand: 'Google Chrome', version: __UA_MAJOR__ }
+    ];
+    Object.defineProperty(navigator, 'userAgent', { get: () => __UA__ });
+    Object.defineProperty(navigator, 'appVersion', { get: () => __UA_APP_VERSION__ });
+    if (navigator.userAgentData) {
+        const uaData = navigator.userAgentData;
+        const uaLowEntropy = { brands: uaBrands, mobile: false, platform: __UA_PLATFORM__ };
+        Object.defineProperty(navigator, 'userAgentData', {
+            get: () => ({
+                ...uaLowEntropy,
+                getHighEntropyValues: (hints) => uaData.getHighEntropyValues(hints).then(
+                    (values) => Object.assign(values, uaLowEntropy, { fullVersionList: uaBrands })
+                ),
+                toJSON: () => uaLowEntropy
+            })
+        });
+    }
+})();
+"""
+
+
+def _minify_js(source: str) -> str:
+    """Strip comment lines and indentation so fewer bytes cross the CDP bridge per launch"""
+    return re.sub(r"^[ \t]*(?://.*)?\n", "", re.sub(r"^[ \t]+", "", source, flags=re.M), flags=re.M)
+
+
+_STEALTH_JS = _minify_js(_STEALTH_JS_SOURCE)
+_IDENTITY_JS = _minify_js(_IDENTITY_JS_SOURCE)
+
+
+@functools.lru_cache(maxsize=None)
+def _stealth_payload(user_agent: str, languages: Tuple[str, ...]) -> Dict[str, str]:
+    """
+    Build the init script payload for a fingerprint, once per distinct fingerprint
+    
+    Args:
+        user_agent: User agent the browser was launched with
+        languages: Languages the browser was launched with
+    
+    Returns:
+        Parameters for Page.addScriptToEvaluateOnNewDocument
+    """
+    major = re.search(r"Chrome/(\d+)", user_agent)
+    if "Windows" in user_agent:
+        ua_platform, nav_platform = "Windows", "Win32"
+    elif "Mac OS X" in user_agent:
+        ua_platform, nav_platform = "macOS", "MacIntel"
+    else:
+        ua_platform, nav_platform = "Linux", "Linux x86_64"
+    
+    identity_js = (
+        _IDENTITY_JS
+        .replace("__LANGUAGES__", json.dumps(list(languages)))
+        .replace("__NAV_PLATFORM__", json.dumps(nav_platform))
+        .replace("__UA_MAJOR__", json.dumps(major.group(1) if major else "120"))
+        .replace("__UA_APP_VERSION__", json.dumps(user_agent.split("/", 1)[-1]))
+        .replace("__UA_PLATFORM__", json.dumps(ua_platform))
+        .replace("__UA__", json.dumps(user_agent))
+    )
+    return {'source': _STEALTH_JS + identity_js}
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_chrome_binary() -> Optional[str]:
+    """Locate the Chrome binary in a Docker/container environment, probing the filesystem once"""
+    if not _IN_DOCKER:
+        return None
+    if platform.system() != "Linux":
+        return None
+    
+    possible_chrome_paths = [
+        *(_HEADLESS_SHELL_PATHS if _USE_HEADLESS_SHELL else ()),
+        "/usr/bin/chromium",
+        "/usr/bin/chromium-browser",
+        "/usr/bin/google-chrome",
+        "/usr/bin/google-chrome-stable",
+        "/usr/local/bin/chrome",
+    ]
+    for chrome_path in possible_chrome_paths:
+        if os.path.exists(chrome_path):
+            return chrome_path
+    return None
+
+
+def _is_headless_shell(chrome_path: Optional[str]) -> bool:
+    """Check whether a browser binary is chrome-headless-shell"""
+    return bool(chrome_path) and os.path.basename(chrome_path) == "chrome-headless-shell"
+
+
+def _container_args(chrome_path: Optional[str]) -> tuple:
+    """
+    Build the container launch arguments for a browser binary
+    
+    Args:
+        chrome_path: Browser binary in use, None for the driver's default
+    
+    Returns:
+        Tuple of Chrome arguments, without the headless switch
+    """
+    if _is_headless_shell(chrome_path):
+        return _DOCKER_ARGS
+    return _DOCKER_ARGS + _GPU_ARGS
+
+
+def _disable_features_arg(chrome_path: Optional[str]) -> str:
+    """Build the single --disable-features switch for a browser binary"""
+    features = _DISABLED_FEATURES
+    if _is_headless_shell(chrome_path):
+        features += _HEADLESS_SHELL_DISABLED_FEATURES
+    return f"--disable-features={','.join(features)}"
+
+
+@functools.lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """Resolve the chromedriver executable once per process"""
+    # Try using the pinned or system chromedriver first (for Docker)
+    if _SYSTEM_CHROMEDRIVER:
+        return _SYSTEM_CHROMEDRIVER
+    
+    # Only then import webdriver-manager, which checks the remote version metadata on every install()
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+@functools.lru_cache(maxsize=1)
+def _base_chrome_options() -> "Options":
+    """
+    Build the Chrome options shared by every enhanced browser once per process;
+    callers copy the result and add their randomized fingerprint arguments
+    """
+    from selenium.webdriver.chrome.options import Options
+    
+    options = Options()
+    
+    chrome_path = _detect_chrome_binary()
+    args = _DEFAULT_ARGS + (_disable_features_arg(chrome_path),)
+    if _IN_DOCKER:
+        args += ("--headless=new",) + _container_args(chrome_path)
+    for arg in args:
+        options.add_argument(arg)
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    options.add_experimental_option("prefs", _CHROME_PREFS)
+    options.page_load_strategy = _PAGE_LOAD_STRATEGY
+    
+    # Set binary location for Docker environment
+    if chrome_path:
+        options.binary_location = chrome_path
+        logger.info(f"Using Chrome binary at: {chrome_path}")
+    
+    return options
+
 
 class StealthBrowser:
     """Enhanced browser with anti-detection measures for LinkedIn scraping"""
     
     def __init__(self):
         self.driver = None
+        self._profile_slot = None
+        self._load_assets = False
+        self._identity = None
         self.user_agents = [
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
@@ -41,18 +485,27 @@ class StealthBrowser:
             ["en-AU", "en"],
         ]
     
-    def init_stealth_browser(self, use_undetected: bool = False) -> webdriver.Chrome:
+    def init_stealth_browser(self, use_undetected: bool = True, load_assets: bool = False,
+                             identity: Optional[str] = None) -> "webdriver.Chrome":
         """
         Initialize browser with maximum stealth capabilities
         
         Args:
-            use_undetected: If True, attempt to use undetected-chromedriver (requires installation)
+            use_undetected: If True, use undetected-chromedriver when it is installed, falling back
+                to enhanced Selenium otherwise
+            load_assets: If True, download images, fonts, media and stylesheets instead of
+                blocking them at the network layer
+            identity: Stable key such as a proxy IP or session id; every launch with the same key
+                presents the same user agent, window size and language. Defaults to the claimed
+                persistent profile, so a profile's cookies always travel with one fingerprint
         
         Returns:
             Chrome WebDriver instance with stealth settings
         """
+        self._load_assets = load_assets
+        self._identity = identity
         
-        # Try to use undetected-chromedriver if available and requested
+        # Prefer undetected-chromedriver: it patches the driver binary and needs no webdriver-manager lookup
         if use_undetected:
             try:
                 import undetected_chromedriver as uc
@@ -70,27 +523,16 @@ class StealthBrowser:
             
             options = uc.ChromeOptions()
             
-            # Randomize window size
-            width, height = random.choice(self.window_sizes)
-            options.add_argument(f'--window-size={width},{height}')
-            
-            # Random user agent
-            options.add_argument(f'--user-agent={random.choice(self.user_agents)}')
-            
-            # Random language
-            lang = random.choice(self.languages)
-            options.add_argument(f'--lang={lang[0]}')
-            
-            # Docker/container specific settings
-            if os.path.exists('/.dockerenv') or os.environ.get('DOCKER_CONTAINER'):
-                options.add_argument("--headless=new")
-                options.add_argument("--no-sandbox")
-                options.add_argument("--disable-dev-shm-usage")
-                options.add_argument("--disable-gpu")
-                if os.environ.get('DISPLAY'):
-                    options.add_argument(f"--display={os.environ.get('DISPLAY')}")
-                else:
-                    options.add_argument("--display=:99")
+            # Docker/container specific settings; headless mode is requested through uc itself
+            # so its headless patches are applied as well. uc finds full Chrome on its own and
+            # is only pointed at a binary when the headless shell was opted into
+            chrome_path = _detect_chrome_binary()
+            headless_shell = _is_headless_shell(chrome_path)
+            if _IN_DOCKER:
+                for arg in _container_args(chrome_path):
+                    options.add_argument(arg)
+            if headless_shell:
+                options.add_argument(_disable_features_arg(chrome_path))
             
             # Additional stealth options
             options.add_argument("--disable-blink-features=AutomationControlled")
@@ -98,291 +540,178 @@ class StealthBrowser:
             # Disable automation flags
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
+            options.page_load_strategy = _PAGE_LOAD_STRATEGY
             
             # Initialize undetected Chrome
-            self.driver = uc.Chrome(options=options, version_main=None)
+            self._use_persistent_profile(options)
+            user_agent, lang = self._add_fingerprint(options)
+            self.driver = uc.Chrome(
+                options=options,
+                version_main=None,
+                headless=_IN_DOCKER,
+                use_subprocess=True,
+                browser_executable_path=chrome_path if headless_shell else None,
+            )
+            self.driver.set_page_load_timeout(_PAGE_LOAD_TIMEOUT)
             
             # Apply additional stealth via CDP
-            self._apply_cdp_stealth()
+            self._apply_cdp_stealth(user_agent, lang)
+            self._block_static_resources()
             
             logger.info("Successfully initialized undetected-chromedriver with stealth settings")
             return self.driver
             
         except Exception as e:
+            self._quit_partial_driver()
+            self._release_profile()
             logger.error(f"Failed to initialize undetected-chromedriver: {e}")
             logger.info("Falling back to enhanced regular Chrome")
             return self._init_enhanced_chrome()
     
     def _init_enhanced_chrome(self):
         """Initialize regular Chrome with maximum stealth enhancements"""
-        options = Options()
-        
-        # Randomize window size
-        width, height = random.choice(self.window_sizes)
-        options.add_argument(f'--window-size={width},{height}')
-        
-        # Random user agent
-        user_agent = random.choice(self.user_agents)
-        options.add_argument(f'--user-agent={user_agent}')
-        
-        # Random language
-        lang = random.choice(self.languages)
-        options.add_argument(f'--lang={lang[0]}')
-        
-        # Essential Docker/container configurations
-        if os.path.exists('/.dockerenv') or os.environ.get('DOCKER_CONTAINER'):
-            options.add_argument("--headless=new")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--disable-software-rasterizer")
-            
-            if os.environ.get('DISPLAY'):
-                options.add_argument(f"--display={os.environ.get('DISPLAY')}")
-            else:
-                options.add_argument("--display=:99")
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
         
-        # Anti-detection arguments
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        
-        # Additional stealth options
-        options.add_argument("--disable-web-security")
-        options.add_argument("--disable-features=VizDisplayCompositor")
-        options.add_argument("--disable-background-timer-throttling")
-        options.add_argument("--disable-renderer-backgrounding")
-        options.add_argument("--disable-features=TranslateUI")
-        options.add_argument("--disable-ipc-flooding-protection")
-        
-        # Memory optimizations
-        options.add_argument("--memory-pressure-off")
-        options.add_argument("--max_old_space_size=4096")
-        
-        # Enhanced preferences for stealth
-        prefs = {
-            "credentials_enable_service": False,
-            "profile.password_manager_enabled": False,
-            "profile.default_content_setting_values.notifications": 2,
-            "profile.managed_default_content_settings.images": 1,  # Load images for more realistic browsing
-            "profile.managed_default_content_settings.stylesheets": 1,
-            "profile.managed_default_content_settings.cookies": 1,
-            "profile.managed_default_content_settings.javascript": 1,
-            "profile.managed_default_content_settings.plugins": 2,
-            "profile.managed_default_content_settings.popups": 2,
-            "profile.managed_default_content_settings.geolocation": 2,
-            "profile.managed_default_content_settings.media_stream": 2,
-            "webrtc.ip_handling_policy": "disable_non_proxied_udp",
-            "webrtc.multiple_routes_enabled": False,
-            "webrtc.nonproxied_udp_enabled": False
-        }
-        options.add_experimental_option("prefs", prefs)
-        
-        # Set binary location for Docker environment
-        if os.path.exists('/.dockerenv') or os.environ.get('DOCKER_CONTAINER'):
-            if platform.system() == "Linux":
-                possible_chrome_paths = [
-                    "/usr/bin/chromium",
-                    "/usr/bin/chromium-browser",
-                    "/usr/bin/google-chrome",
-                    "/usr/bin/google-chrome-stable",
-                    "/usr/local/bin/chrome",
-                ]
-                for chrome_path in possible_chrome_paths:
-                    if os.path.exists(chrome_path):
-                        options.binary_location = chrome_path
-                        logger.info(f"Using Chrome binary at: {chrome_path}")
-                        break
+        options = copy.deepcopy(_base_chrome_options())
         
         try:
-            # Try using system chromedriver first (for Docker)
-            if os.path.exists('/usr/bin/chromedriver'):
-                service = Service('/usr/bin/chromedriver')
-                self.driver = webdriver.Chrome(service=service, options=options)
-            else:
-                # Use webdriver-manager
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=options)
+            self._use_persistent_profile(options)
+            user_agent, lang = self._add_fingerprint(options)
+            service = Service(_chromedriver_path())
+            self.driver = webdriver.Chrome(service=service, options=options)
             
             # Apply CDP stealth commands
-            self._apply_cdp_stealth()
-            
-            # Apply selenium-stealth if available
-            try:
-                from selenium_stealth import stealth
-                stealth(self.driver,
-                    languages=lang,
-                    vendor="Google Inc.",
-                    platform="Win32",
-                    webgl_vendor="Intel Inc.",
-                    renderer="Intel Iris OpenGL Engine",
-                    fix_hairline=True,
-                )
-                logger.info("Applied selenium-stealth successfully")
-            except ImportError:
-                logger.info("selenium-stealth not installed, using CDP commands only")
+            self._apply_cdp_stealth(user_agent, lang)
+            self._block_static_resources()
             
-            # Set timeouts
-            self.driver.set_page_load_timeout(30)
-            self.driver.implicitly_wait(10)
+            self.driver.set_page_load_timeout(_PAGE_LOAD_TIMEOUT)
             
             logger.info("Successfully initialized enhanced Chrome with stealth settings")
             return self.driver
             
         except Exception as e:
+            self._quit_partial_driver()
+            self._release_profile()
             logger.error(f"Failed to initialize Chrome browser: {e}")
             raise
     
-    def _apply_cdp_stealth(self):
-        """Apply Chrome DevTools Protocol commands for additional stealth"""
+    def _identity_profile(self, key: Optional[str]) -> Tuple[str, Tuple[int, int], List[str]]:
+        """
+        Pick the user agent, window size and language for an identity
+        
+        Args:
+            key: Identity key, or None for a fresh random fingerprint
+        
+        Returns:
+            Tuple of (user agent, window size, languages)
+        """
+        # Seeding from the key makes the choice a pure function of it, so nothing needs caching
+        rng = random.Random(hashlib.blake2b(key.encode(), digest_size=8).digest()) if key else random
+        return rng.choice(self.user_agents), rng.choice(self.window_sizes), rng.choice(self.languages)
+    
+    def _add_fingerprint(self, options) -> Tuple[str, List[str]]:
+        """
+        Add the identity's window size, user agent and language to the launch options
+        
+        Args:
+            options: Chrome options being built
+        
+        Returns:
+            Tuple of (user agent, languages) the browser is launched with
+        """
+        key = self._identity
+        if key is None and self._profile_slot is not None:
+            key = f"profile-{self._profile_slot}"
+        user_agent, (width, height), lang = self._identity_profile(key)
+        options.add_argument(f'--window-size={width},{height}')
+        options.add_argument(f'--user-agent={user_agent}')
+        options.add_argument(f'--lang={lang[0]}')
+        return user_agent, lang
+    
+    def _use_persistent_profile(self, options) -> None:
+        """Point Chrome at a claimed persistent profile with an enlarged disk cache"""
+        claimed = _claim_profile_dir()
+        if not claimed:
+            return
+        self._profile_slot, profile_dir = claimed
+        options.add_argument(f'--user-data-dir={profile_dir}')
+        options.add_argument(f'--disk-cache-size={_DISK_CACHE_SIZE}')
+        logger.debug(f"Using persistent browser profile {profile_dir}")
+    
+    def _quit_partial_driver(self) -> None:
+        """Quit a browser whose setup failed after launch, so it stops holding the profile directory"""
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting partially initialized browser: {e}")
+        self.driver = None
+    
+    def _release_profile(self) -> None:
+        """Free this browser's profile slot"""
+        _release_profile_dir(self._profile_slot)
+        self._profile_slot = None
+    
+    def _apply_cdp_stealth(self, user_agent: str, languages: List[str]):
+        """
+        Apply Chrome DevTools Protocol commands for additional stealth
+        
+        Args:
+            user_agent: User agent the browser was launched with
+            languages: Languages the browser was launched with
+        """
         if not self.driver:
             return
         
         try:
-            # Override navigator.webdriver
-            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                'source': '''
-                    // Remove webdriver property
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                    
-                    // Mock plugins
-                    Object.defineProperty(navigator, 'plugins', {
-                        get: () => [
-                            {
-                                0: {type: "application/x-google-chrome-pdf", suffixes: "pdf"},
-                                description: "Portable Document Format",
-                                filename: "internal-pdf-viewer",
-                                length: 1,
-                                name: "Chrome PDF Plugin"
-                            },
-                            {
-                                0: {type: "application/pdf", suffixes: "pdf"},
-                                description: "Portable Document Format",
-                                filename: "mhjfbmdgcfjbbpaeojofohoefgiehjai",
-                                length: 1,
-                                name: "Chrome PDF Viewer"
-                            },
-                            {
-                                0: {type: "application/x-nacl", suffixes: ""},
-                                1: {type: "application/x-pnacl", suffixes: ""},
-                                description: "Native Client Executable",
-                                filename: "internal-nacl-plugin",
-                                length: 2,
-                                name: "Native Client"
-                            }
-                        ]
-                    });
-                    
-                    // Mock languages
-                    Object.defineProperty(navigator, 'languages', {
-                        get: () => ['en-US', 'en']
-                    });
-                    
-                    // Mock vendor
-                    Object.defineProperty(navigator, 'vendor', {
-                        get: () => 'Google Inc.'
-                    });
-                    
-                    // Mock platform
-                    Object.defineProperty(navigator, 'platform', {
-                        get: () => 'Win32'
-                    });
-                    
-                    // Mock hardware concurrency
-                    Object.defineProperty(navigator, 'hardwareConcurrency', {
-                        get: () => 8
-                    });
-                    
-                    // Mock connection
-                    Object.defineProperty(navigator, 'connection', {
-                        get: () => ({
-                            rtt: 100,
-                            downlink: 10,
-                            effectiveType: '4g',
-                            saveData: false
-                        })
-                    });
-                    
-                    // Chrome specific
-                    window.chrome = {
-                        app: {
-                            isInstalled: false,
-                            InstallState: {
-                                DISABLED: 'disabled',
-                                INSTALLED: 'installed',
-                                NOT_INSTALLED: 'not_installed'
-                            },
-                            RunningState: {
-                                CANNOT_RUN: 'cannot_run',
-                                READY_TO_RUN: 'ready_to_run',
-                                RUNNING: 'running'
-                            }
-                        },
-                        runtime: {
-                            OnInstalledReason: {
-                                CHROME_UPDATE: 'chrome_update',
-                                INSTALL: 'install',
-                                SHARED_MODULE_UPDATE: 'shared_module_update',
-                                UPDATE: 'update'
-                            },
-                            OnRestartRequiredReason: {
-                                APP_UPDATE: 'app_update',
-                                OS_UPDATE: 'os_update',
-                                PERIODIC: 'periodic'
-                            },
-                            PlatformArch: {
-                                ARM: 'arm',
-                                ARM64: 'arm64',
-                                MIPS: 'mips',
-                                MIPS64: 'mips64',
-                                X86_32: 'x86-32',
-                                X86_64: 'x86-64'
-                            },
-                            PlatformNaclArch: {
-                                ARM: 'arm',
-                                MIPS: 'mips',
-                                MIPS64: 'mips64',
-                                X86_32: 'x86-32',
-                                X86_64: 'x86-64'
-                            },
-                            PlatformOs: {
-                                ANDROID: 'android',
-                                CROS: 'cros',
-                                LINUX: 'linux',
-                                MAC: 'mac',
-                                OPENBSD: 'openbsd',
-                                WIN: 'win'
-                            },
-                            RequestUpdateCheckStatus: {
-                                NO_UPDATE: 'no_update',
-                                THROTTLED: 'throttled',
-                                UPDATE_AVAILABLE: 'update_available'
-                            }
-                        }
-                    };
-                    
-                    // Permissions
-                    const originalQuery = window.navigator.permissions.query;
-                    window.navigator.permissions.query = (parameters) => (
-                        parameters.name === 'notifications' ?
-                            Promise.resolve({ state: Notification.permission }) :
-                            originalQuery(parameters)
-                    );
-                '''
-            })
-            
-            # Disable webdriver flag in Chrome
-            self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": self.driver.execute_script("return navigator.userAgent").replace("HeadlessChrome", "Chrome")
-            })
+            # Override navigator.webdriver and other automation tells, plus the UA we chose, in one
+            # round-trip; the request header already carries it via --user-agent
+            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', _stealth_payload(user_agent, tuple(languages)))
             
             logger.info("Applied CDP stealth commands successfully")
             
         except Exception as e:
             logger.warning(f"Failed to apply some CDP commands: {e}")
     
+    def _block_static_resources(self):
+        """
+        Refuse image, font, media and stylesheet requests via CDP so they are never
+        downloaded. Content-setting prefs only stop rendering, not the transfer.
+        Set LINKEDIN_ALLOW_CSS=1 to keep stylesheets when debugging page layouts.
+        """
+        if not self.driver or self._load_assets:
+            return
+        
+        patterns = list(_BLOCKED_RESOURCE_PATTERNS)
+        if os.environ.get('LINKEDIN_ALLOW_CSS') != '1':
+            patterns.extend(_BLOCKED_STYLESHEET_PATTERNS)
+        
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+            logger.debug(f"Blocking static resources: {patterns}")
+        except Exception as e:
+            logger.warning(f"Failed to block static resources: {e}")
+    
+    def wait_for(self, by: str, selector: str, timeout: float = 5):
+        """
+        Wait until an element is present in the DOM
+        
+        Args:
+            by: Selenium locator strategy, e.g. By.CSS_SELECTOR
+            selector: Locator value
+            timeout: Maximum seconds to wait
+        
+        Returns:
+            The located WebElement
+        """
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        return WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located((by, selector)))
+    
     def close(self):
         """Close the browser safely"""
         if self.driver:
@@ -392,4 +721,5 @@ class StealthBrowser:
             except Exception as e:
                 logger.warning(f"Error closing browser: {e}")
             finally:
-                self.driver = None
\ No newline at end of file
+                self.driver = None
+                self._release_profile()
\ No newline at end of file
@@ -1,6 +1,7 @@
 from typing import List, Dict, Any, Optional, Set
 import asyncio
 import logging
+import re
 import time
 from datetime import datetime, timedelta
 
@@ -156,7 +157,6 @@ Format each question on a new line starting with 'Question: '"""}
         for line in lines:
             line = line.strip()
             if line.startswith('Learning'):
-                import re
                 url_match = re.search(r'\[(.*?)\]:', line)
                 if url_match:
                     url = url_match.group(1)
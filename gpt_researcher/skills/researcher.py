@@ -218,7 +218,7 @@ class ResearchConductor:
         # Generate Sub-Queries including original query
         sub_queries = await self.plan_research(query)
         # If this is not part of a sub researcher, add original query to research for better results
-        if self.researcher.report_type != "subtopic_report":
+        if self.researcher.report_type != "subtopic_report" and query not in sub_queries:
             sub_queries.append(query)
 
         if self.researcher.verbose:
@@ -308,7 +308,7 @@ class ResearchConductor:
         self.logger.info(f"Generated sub-queries: {sub_queries}")
         
         # If this is not part of a sub researcher, add original query to research for better results
-        if self.researcher.report_type != "subtopic_report":
+        if self.researcher.report_type != "subtopic_report" and query not in sub_queries:
             sub_queries.append(query)
 
         if self.researcher.verbose:
@@ -762,7 +762,7 @@ class ResearchConductor:
                     )
                 
                 # Check if LinkedIn returned no results and fall back to Tavily
-                if "linkedin" in retriever_class.__name__.lower() and (not search_results or len(search_results) == 0):
+                if "linkedin" in retriever_class.__name__.lower() and not search_results:
                     self.logger.warning("LinkedIn search returned no results, falling back to Tavily")
                     try:
                         from gpt_researcher.retrievers import TavilySearch
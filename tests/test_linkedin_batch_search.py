@@ -0,0 +1,57 @@
+import asyncio
+import time
+import types
+
+import pytest
+
+from gpt_researcher.retrievers.linkedin import rate_limiter as rate_limiter_module
+from gpt_researcher.retrievers.linkedin.linkedin_sales_navigator import LinkedInSalesNavigator
+
+
+@pytest.fixture
+def clock(monkeypatch, tmp_path):
+    clock = types.SimpleNamespace(now=time.mktime((2026, 3, 10, 10, 0, 0, 0, 0, -1)), mono=1000.0)
+    fake_time = types.SimpleNamespace(
+        time=lambda: clock.now,
+        monotonic=lambda: clock.mono,
+        localtime=time.localtime,
+        sleep=time.sleep,
+    )
+    monkeypatch.setattr(rate_limiter_module, "time", fake_time)
+    monkeypatch.setattr(rate_limiter_module, "_SHARED_LIMITERS", {})
+    monkeypatch.chdir(tmp_path)
+    return clock
+
+
+@pytest.mark.asyncio
+async def test_batch_is_spaced_by_the_shared_limiter(clock, monkeypatch):
+    real_sleep = asyncio.sleep
+    real_reserve = rate_limiter_module.RateLimiter.reserve_search
+    reserved_at = []
+
+    async def fake_sleep(seconds):
+        clock.now += seconds
+        clock.mono += seconds
+        await real_sleep(0)
+
+    def reserve_search(limiter):
+        allowed = real_reserve(limiter)
+        if allowed[0]:
+            reserved_at.append(clock.mono)
+        return allowed
+
+    def run_batch_query(cls, query, kind, max_results):
+        return [query]
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(rate_limiter_module.RateLimiter, "reserve_search", reserve_search)
+    monkeypatch.setattr(LinkedInSalesNavigator, "_run_batch_query", classmethod(run_batch_query))
+
+    results = await LinkedInSalesNavigator.batch_search(["a", "b", "c", "d"])
+
+    # Three searches fit in the hourly limit, each at least the minimum gap after the last
+    assert results.count(None) == 1
+    assert all(result == [query] for result, query in zip(results, "abcd") if result)
+    assert len(reserved_at) == 3
+    min_gap = rate_limiter_module.RateLimits().min_delay_between_searches
+    assert all(later - earlier >= min_gap for earlier, later in zip(reserved_at, reserved_at[1:]))
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+
+import pytest
+
+from gpt_researcher.retrievers.linkedin.browser_pool import BrowserLease, BrowserPool
+from gpt_researcher.retrievers.linkedin.linkedin_sales_navigator import LinkedInSalesNavigator
+
+
+class FakeStealthBrowser:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeDriver:
+    current_url = "about:blank"
+
+    def __init__(self):
+        self.cdp_commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_commands.append(command)
+        return {}
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    launched = []
+
+    def launch():
+        lease = BrowserLease(FakeStealthBrowser(), FakeDriver())
+        launched.append(lease)
+        return lease
+
+    monkeypatch.setattr(BrowserPool, "_launch", staticmethod(launch))
+    pool = BrowserPool(size=3, recycle_after=100)
+    pool.launched = launched
+    return pool
+
+
+def test_nested_lease_reuses_browser(pool):
+    with pool.lease() as outer:
+        with pool.lease() as inner:
+            assert inner is outer
+    assert len(pool.launched) == 1
+    assert pool._idle.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_gathered_workers_get_distinct_drivers(pool):
+    started = asyncio.Event()
+    holding = 0
+
+    async def worker():
+        nonlocal holding
+        with pool.lease() as lease:
+            holding += 1
+            if holding == 2:
+                started.set()
+            # Hold the lease until both workers have one, so they can't share by turns
+            await asyncio.wait_for(started.wait(), timeout=5)
+            return lease.driver
+
+    with pool.lease() as parent:
+        first, second = await asyncio.gather(worker(), worker())
+
+    assert first is not second
+    assert parent.driver not in (first, second)
+    assert len(pool.launched) == 3
+
+
+@pytest.mark.asyncio
+async def test_thread_worker_gets_own_driver(pool):
+    def worker():
+        with pool.lease() as lease:
+            return lease.driver, threading.get_ident()
+
+    with pool.lease() as parent:
+        driver, thread_id = await asyncio.to_thread(worker)
+
+    assert thread_id != threading.get_ident()
+    assert driver is not parent.driver
+
+
+def test_dead_browser_is_discarded(pool):
+    with pytest.raises(RuntimeError):
+        with pool.lease() as lease:
+            lease.is_alive = lambda: False
+            raise RuntimeError("driver crashed")
+
+    assert lease.stealth_browser.closed
+    assert pool._idle.qsize() == 0
+
+
+@pytest.fixture
+def navigator_on(monkeypatch):
+    monkeypatch.delenv("LINKEDIN_SESSION_TOKEN", raising=False)
+    monkeypatch.delenv("LINKEDIN_PASSWORD", raising=False)
+    lease = BrowserLease(FakeStealthBrowser(), FakeDriver())
+
+    def init_browser(self):
+        self._lease = lease
+        self.driver = lease.driver
+
+    monkeypatch.setattr(LinkedInSalesNavigator, "init_browser", init_browser)
+    monkeypatch.setattr("gpt_researcher.retrievers.linkedin.browser_pool.get_browser_pool", lambda: BrowserPool(size=1))
+
+    def make(username):
+        navigator = LinkedInSalesNavigator("cto", headers={"linkedin_username": username})
+        navigator.has_saved_session = False
+        return navigator
+
+    make.lease = lease
+    return make
+
+
+def test_login_is_reused_only_for_the_same_account(navigator_on):
+    lease = navigator_on.lease
+    first = navigator_on("a@example.com")
+    first.init_browser()
+    first.logged_in = True
+    first.close()
+
+    same = navigator_on("a@example.com")
+    assert same.login()
+    assert lease.driver.cdp_commands == []
+    same.close()
+
+    other = navigator_on("b@example.com")
+    assert not other.login()
+    assert "Network.clearBrowserCookies" in lease.driver.cdp_commands
+    assert not lease.logged_in
+
+
+def test_failed_login_clears_the_session_on_release(navigator_on):
+    lease = navigator_on.lease
+    navigator = navigator_on("a@example.com")
+
+    assert not navigator.login()
+    navigator.close()
+
+    assert "Network.clearBrowserCookies" in lease.driver.cdp_commands
+    assert lease.account is None
@@ -0,0 +1,36 @@
+from gpt_researcher.retrievers.linkedin.human_simulator import HumanSimulator
+
+
+class RecordingDriver:
+    """Driver stub that keeps the W3C action payloads sent to it"""
+
+    def __init__(self, position, viewport=(200, 100)):
+        self._hs_mouse_position = position
+        self._hs_viewport_size = viewport
+        self.actions = []
+
+    def execute(self, command, params=None):
+        self.actions.append(params)
+        return {"value": None}
+
+
+def _pointer_moves(driver):
+    (payload,) = driver.actions
+    return [
+        action
+        for source in payload["actions"] if source["type"] == "pointer"
+        for action in source["actions"] if action["type"] == "pointerMove"
+    ]
+
+
+def test_micro_movements_stay_inside_the_viewport(monkeypatch):
+    monkeypatch.setattr("random.randint", lambda low, high: low if high == 20 else high)
+    driver = RecordingDriver(position=(3, 98.6))
+
+    HumanSimulator.simulate_micro_movements(driver)
+
+    moves = _pointer_moves(driver)
+    assert moves
+    assert all(move["origin"] == "viewport" for move in moves)
+    assert all(0 <= move["x"] < 200 and 0 <= move["y"] < 100 for move in moves)
+    assert driver._hs_mouse_position == (moves[-1]["x"], moves[-1]["y"])
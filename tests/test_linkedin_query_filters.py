@@ -0,0 +1,49 @@
+import pytest
+
+from gpt_researcher.retrievers.linkedin import linkedin_sales_navigator as navigator_module
+from gpt_researcher.retrievers.linkedin.linkedin_sales_navigator import (
+    LinkedInSalesNavigator,
+    _match_intent_terms,
+    _parse_intent,
+)
+
+QUERIES = [
+    "senior python developer in kyiv",
+    "знайти cto стартапу з інвестиціями",
+    "react js frontend engineers at funded startups up to 100 employees",
+    "decision maker at fintech company in warsaw",
+    "",
+]
+
+
+def test_keywords_raw_keeps_the_callers_query():
+    navigator = LinkedInSalesNavigator("  Python CTO Kyiv ")
+
+    intent = navigator.parse_intent(navigator.query)
+    filters = navigator.parse_query_filters(navigator.query)
+
+    assert intent["keywords_raw"] == "  python cto kyiv "
+    assert filters["intent"]["keywords_raw"] == "  python cto kyiv "
+
+
+def test_queries_differing_in_case_and_whitespace_share_the_cache():
+    navigator = LinkedInSalesNavigator("python cto kyiv")
+    _parse_intent.cache_clear()
+
+    plain = navigator.parse_query_filters("python cto kyiv")
+    padded = navigator.parse_query_filters(" Python CTO Kyiv  ")
+
+    assert padded["keywords"] == plain["keywords"]
+    assert padded["native_filters"] == plain["native_filters"]
+    assert _parse_intent.cache_info().currsize == 1
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_automaton_matches_like_the_substring_scan(query, monkeypatch):
+    pytest.importorskip("ahocorasick")
+    assert navigator_module._INTENT_AUTOMATON is not None
+
+    with_automaton = _match_intent_terms(query)
+    monkeypatch.setattr(navigator_module, "_INTENT_AUTOMATON", None)
+
+    assert _match_intent_terms(query) == with_automaton
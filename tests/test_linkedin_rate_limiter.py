@@ -0,0 +1,234 @@
+import json
+import threading
+import time
+import types
+from dataclasses import astuple
+
+import pytest
+
+from gpt_researcher.retrievers.linkedin import rate_limiter as rate_limiter_module
+from gpt_researcher.retrievers.linkedin.rate_limiter import RateLimiter, get_rate_limiter
+
+
+class FakeClock:
+    """Wall and monotonic clock that only moves when advanced"""
+
+    def __init__(self, now):
+        self.now = now
+        self.mono = 1000.0
+
+    def advance(self, seconds):
+        self.now += seconds
+        self.mono += seconds
+
+
+@pytest.fixture
+def local_tz(monkeypatch):
+    # UTC+5:30 puts local hour and day boundaries half an hour off the UTC ones
+    monkeypatch.setenv("TZ", "Asia/Kolkata")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.fixture
+def clock(monkeypatch, local_tz):
+    clock = FakeClock(time.mktime((2026, 3, 10, 10, 59, 0, 0, 0, -1)))
+    fake_time = types.SimpleNamespace(
+        time=lambda: clock.now,
+        monotonic=lambda: clock.mono,
+        localtime=time.localtime,
+        sleep=time.sleep,
+    )
+    monkeypatch.setattr(rate_limiter_module, "time", fake_time)
+    return clock
+
+
+def test_hourly_counters_reset_on_local_hour(tmp_path, clock):
+    limiter = RateLimiter(tmp_path / "rate_limit.sqlite")
+    limiter.record_search()
+
+    # 10:59 -> 11:01 local time is 05:29 -> 05:31 UTC, inside a single UTC hour
+    clock.advance(120)
+    limiter.reset_if_needed()
+
+    assert limiter.state.hourly_searches == 0
+    assert limiter.state.daily_searches == 1
+
+
+def test_daily_counters_reset_at_local_midnight(tmp_path, clock):
+    clock.now = time.mktime((2026, 3, 10, 23, 59, 30, 0, 0, -1))
+    limiter = RateLimiter(tmp_path / "rate_limit.sqlite")
+    limiter.record_search()
+    limiter.record_profile_view()
+
+    # 23:59:30 -> 00:00:30 local time is 18:29:30 -> 18:30:30 UTC, inside a single UTC day
+    clock.advance(60)
+    limiter.reset_if_needed()
+
+    assert limiter.state.daily_searches == 0
+    assert limiter.state.daily_profiles == 0
+    assert limiter.state.hourly_searches == 0
+
+
+def test_no_reset_within_the_same_local_hour(tmp_path, clock):
+    clock.now = time.mktime((2026, 3, 10, 11, 0, 0, 0, 0, -1))
+    limiter = RateLimiter(tmp_path / "rate_limit.sqlite")
+    limiter.record_search()
+
+    clock.advance(30 * 60)
+    limiter.reset_if_needed()
+
+    assert limiter.state.hourly_searches == 1
+    assert limiter.state.daily_searches == 1
+
+
+def _write_legacy_state(tmp_path, clock, **overrides):
+    local_now = time.localtime(clock.now)
+    state = {
+        "daily_searches": 7,
+        "daily_profiles": 3,
+        "hourly_searches": 2,
+        "consecutive_failures": 1,
+        "last_search_time": clock.now - 600,
+        "last_reset_date": time.strftime("%Y-%m-%d", local_now),
+        "last_hour_reset": local_now.tm_hour,
+    }
+    state.update(overrides)
+    legacy_file = tmp_path / "rate_limit.json"
+    legacy_file.write_text(json.dumps(state))
+    return legacy_file
+
+
+def test_legacy_json_state_is_imported_into_sqlite(tmp_path, clock):
+    legacy_file = _write_legacy_state(tmp_path, clock)
+
+    limiter = RateLimiter(tmp_path / "rate_limit.sqlite")
+    limiter.reset_if_needed()
+
+    # Same local day and hour as the legacy file, so nothing is reset by the upgrade
+    assert limiter.state.daily_searches == 7
+    assert limiter.state.daily_profiles == 3
+    assert limiter.state.hourly_searches == 2
+    assert limiter.state.consecutive_failures == 1
+
+    limiter.save_state(force=True)
+    legacy_file.unlink()
+
+    reloaded = RateLimiter(tmp_path / "rate_limit.sqlite")
+    assert astuple(reloaded.state) == astuple(limiter.state)
+
+
+def test_legacy_state_from_an_earlier_day_is_reset(tmp_path, clock):
+    _write_legacy_state(tmp_path, clock, last_reset_date="2026-03-09")
+
+    limiter = RateLimiter(tmp_path / "rate_limit.sqlite")
+    limiter.reset_if_needed()
+
+    assert limiter.state.daily_searches == 0
+    assert limiter.state.hourly_searches == 0
+
+
+def test_unreadable_legacy_date_keeps_counters(tmp_path, clock):
+    _write_legacy_state(tmp_path, clock, last_reset_date="not a date")
+
+    limiter = RateLimiter(tmp_path / "rate_limit.sqlite")
+    limiter.reset_if_needed()
+
+    assert limiter.state.daily_searches == 7
+    assert limiter.state.hourly_searches == 2
+
+
+def test_corrupt_legacy_file_blocks_searches(tmp_path, clock):
+    (tmp_path / "rate_limit.json").write_bytes(b'{"daily_searches": 7,')
+
+    limiter = RateLimiter(tmp_path / "rate_limit.sqlite")
+    allowed, reason = limiter.can_search()
+
+    assert not allowed
+    assert "limit reached" in reason
+    assert limiter.state.daily_searches == limiter.limits.searches_per_day
+
+    # The block lifts at the next local midnight like any spent daily quota
+    clock.now = time.mktime((2026, 3, 11, 0, 0, 30, 0, 0, -1))
+    clock.advance(5)
+    limiter.reset_if_needed()
+    assert limiter.state.daily_searches == 0
+
+
+def test_state_round_trips_through_save_and_load(tmp_path, clock):
+    limiter = RateLimiter(tmp_path / "rate_limit.sqlite")
+    limiter.record_search()
+    limiter.record_profile_view()
+    limiter.record_search(success=False)
+    limiter.save_state(force=True)
+
+    reloaded = RateLimiter(tmp_path / "rate_limit.sqlite")
+
+    assert astuple(reloaded.state) == astuple(limiter.state)
+    assert reloaded.state.daily_searches == 2
+    assert reloaded.state.total_failures_today == 1
+
+
+def test_break_decision_is_stable_within_a_second(tmp_path, clock):
+    limiter = RateLimiter(tmp_path / "rate_limit.sqlite")
+
+    decisions = {limiter.should_take_break() for _ in range(200)}
+
+    assert len(decisions) == 1
+
+
+def test_shared_limiter_is_reused_per_state_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(rate_limiter_module, "_SHARED_LIMITERS", {})
+
+    limiter = get_rate_limiter(tmp_path / "rate_limit.sqlite")
+
+    assert get_rate_limiter(tmp_path / "rate_limit.sqlite") is limiter
+    assert get_rate_limiter(tmp_path / "other.sqlite") is not limiter
+
+
+def test_close_writes_deferred_state(tmp_path, clock):
+    limiter = RateLimiter(tmp_path / "rate_limit.sqlite")
+    limiter.record_search()
+    limiter.record_search()
+    limiter.close()
+
+    assert limiter.config_file not in rate_limiter_module._PENDING_FLUSH
+    reloaded = RateLimiter(tmp_path / "rate_limit.sqlite")
+
+    assert reloaded.state.daily_searches == 2
+
+
+def test_concurrent_reservations_allow_one_search(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(rate_limiter_module, "_SHARED_LIMITERS", {})
+    barrier = threading.Barrier(3)
+    outcomes = []
+
+    def worker():
+        limiter = get_rate_limiter(tmp_path / "rate_limit.sqlite")
+        barrier.wait()
+        outcomes.append(limiter.reserve_search()[0])
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    limiter = get_rate_limiter(tmp_path / "rate_limit.sqlite")
+    limiter.save_state(force=True)
+
+    assert sorted(outcomes) == [False, False, True]
+    assert RateLimiter(tmp_path / "rate_limit.sqlite").state.daily_searches == 1
+
+
+def test_seconds_until_search_follows_the_minimum_gap(tmp_path, clock):
+    limiter = RateLimiter(tmp_path / "rate_limit.sqlite")
+    assert limiter.seconds_until_search() == 0
+
+    limiter.reserve_search()
+    assert limiter.seconds_until_search() == pytest.approx(limiter.limits.min_delay_between_searches)
+
+    clock.advance(limiter.limits.min_delay_between_searches)
+    assert limiter.seconds_until_search() == 0
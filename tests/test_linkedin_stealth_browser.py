@@ -0,0 +1,43 @@
+import sys
+import types
+
+from gpt_researcher.retrievers.linkedin.stealth_browser import StealthBrowser
+
+
+class HalfStartedDriver:
+    def __init__(self):
+        self.quit_called = False
+
+    def set_page_load_timeout(self, timeout):
+        raise RuntimeError("session not created")
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_failed_undetected_setup_quits_the_browser_before_falling_back(monkeypatch):
+    driver = HalfStartedDriver()
+    fake_uc = types.SimpleNamespace(
+        ChromeOptions=lambda: types.SimpleNamespace(
+            add_argument=lambda arg: None,
+            add_experimental_option=lambda name, value: None,
+        ),
+        Chrome=lambda **kwargs: driver,
+    )
+    monkeypatch.setitem(sys.modules, "undetected_chromedriver", fake_uc)
+
+    browser = StealthBrowser()
+    monkeypatch.setattr(browser, "_use_persistent_profile", lambda options: None)
+    monkeypatch.setattr(browser, "_add_fingerprint", lambda options: ("agent", ["en-US"]))
+
+    fallback_state = {}
+
+    def init_enhanced_chrome():
+        fallback_state["driver_quit"] = driver.quit_called
+        fallback_state["driver"] = browser.driver
+        return "fallback driver"
+
+    monkeypatch.setattr(browser, "_init_enhanced_chrome", init_enhanced_chrome)
+
+    assert browser._init_undetected_chrome() == "fallback driver"
+    assert fallback_state == {"driver_quit": True, "driver": None}
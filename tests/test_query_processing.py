@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from gpt_researcher.actions import query_processing
+
+
+class FakeLinkedInRetriever:
+    results = [{"href": "https://www.linkedin.com/in/someone"}]
+
+    def __init__(self, query, query_domains=None):
+        self.query = query
+
+    @classmethod
+    def can_serve(cls):
+        return True
+
+    def search(self):
+        return self.results
+
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    calls = []
+
+    async def create_chat_completion(**kwargs):
+        calls.append(kwargs)
+        return '{"is_english": false, "language": "Ukrainian", "search_optimized_query": "cto kyiv"}'
+
+    monkeypatch.setattr(query_processing, "create_chat_completion", create_chat_completion)
+    monkeypatch.setattr(query_processing, "_translation_cache", type(query_processing._translation_cache)())
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_linkedin_success_skips_the_translation(llm_calls):
+    results = await query_processing.get_search_results("знайти cto у києві", FakeLinkedInRetriever)
+
+    assert results == FakeLinkedInRetriever.results
+    assert llm_calls == []
+
+
+def test_translation_semaphore_is_created_per_event_loop():
+    async def current():
+        return query_processing._translation_semaphore()
+
+    first = asyncio.run(current())
+    second = asyncio.run(current())
+
+    assert first is not second